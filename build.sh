@@ -5,12 +5,21 @@ set -o errexit
 # Install only production dependencies
 make install-prod
 
+# Make sure the vendored Bootstrap files are in place
+make vendor-bootstrap
+
 # Collect static files
 make static
 
+# Check that all templates compile
+make templates
+
 # Apply migrations
 make migrate
 
+# Delete expired sessions
+make clearsessions
+
 # Create superuser
 make createsuperuser || true
 
@@ -9,7 +9,10 @@ load_dotenv()
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.settings')
+    settings_module = 'task_manager.settings'
+    if sys.argv[1:2] == ['test']:
+        settings_module = 'task_manager.settings_test'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
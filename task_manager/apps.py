@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+from django.core.checks import Tags, register
+
+
+class TaskManagerConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager'
+
+    def ready(self):
+        # Connect signal receivers
+        from task_manager import metrics, sqlite  # noqa: F401
+        from task_manager.checks import (
+            check_shared_caches,
+            check_vendored_bootstrap,
+        )
+
+        register(check_vendored_bootstrap, Tags.staticfiles)
+        register(check_shared_caches, Tags.caches)
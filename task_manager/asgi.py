@@ -9,8 +9,17 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
+from task_manager.warmup import compile_templates
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.settings')
+# Serve the login and registration views, which hash passwords, async
+os.environ.setdefault('ASYNC_VIEWS', 'True')
 
 application = get_asgi_application()
+
+if settings.TEMPLATE_WARMUP:
+    # Compile templates when the worker starts, not on the first requests
+    compile_templates()
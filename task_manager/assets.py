@@ -0,0 +1,123 @@
+"""
+Self-hosted Bootstrap.
+
+The Bootstrap files used by django_bootstrap5, with their source maps,
+are vendored into task_manager/static/vendor/bootstrap by the
+vendor_bootstrap command and committed. They are served like other static
+files: collectstatic stores them under hashed names with gzip and brotli
+copies, and WhiteNoise serves hashed files with a far-future
+Cache-Control: immutable header.
+
+The vendored files are checked against the integrity hashes below by
+the command and by a system check, which fails collectstatic when a file
+is missing or changed. The pages do not send the hashes to the browser:
+the files come from the same origin as the pages, and collectstatic
+rewrites the source map URLs in them, which changes their hashes.
+"""
+import base64
+import hashlib
+from pathlib import Path
+from urllib.request import urlopen
+
+from django.templatetags.static import static
+from django.utils.functional import lazy
+
+BOOTSTRAP_VERSION = '5.3.3'
+BOOTSTRAP_CDN_URL = (
+    'https://cdn.jsdelivr.net/npm/bootstrap@{version}/dist/{path}'
+)
+BOOTSTRAP_STATIC_DIR = 'vendor/bootstrap'
+BOOTSTRAP_DIR = (
+    Path(__file__).resolve().parent / 'static' / BOOTSTRAP_STATIC_DIR
+)
+
+# django_bootstrap5 setting -> (path in the dist directory, integrity),
+# the integrity hashes are the ones of the django_bootstrap5 defaults
+BOOTSTRAP_FILES = {
+    'css_url': (
+        'css/bootstrap.min.css',
+        'sha384-QWTKZyjpPEjISv5WaRU9OFeRpok6YctnYmDr5pNlyT2bRjXh0JMhjY6hW'
+        '+ALEwIH',
+    ),
+    'javascript_url': (
+        'js/bootstrap.bundle.min.js',
+        'sha384-YvpcrYf0tY3lHB60NNkmXc5s9fDVZLESaAA55NDzOxhy9GkcIdslK1eN7'
+        'N6jIeHz',
+    ),
+}
+
+# Source maps referenced by the files, collectstatic cannot store
+# the files under hashed names without them
+BOOTSTRAP_SOURCE_MAPS = {
+    'css/bootstrap.min.css.map': (
+        'sha384-LwyFPAYeWO3SJbG/pZ2F2/f6nZxkMKWlkH/ElWNjvUD3ILLrbzetzX8Sh'
+        'ggJy4Of'
+    ),
+    'js/bootstrap.bundle.min.js.map': (
+        'sha384-Vgvn9G4A9CfS51jXa46jlIkMKKuYr7Yx/s0g5vKRDoo0LbYA2yj5uVeF4'
+        '2qc0AJf'
+    ),
+}
+
+# The hashed name is only known once the static files storage is ready
+static_lazy = lazy(static, str)
+
+
+def get_vendored_files():
+    """
+    Returns the integrity hashes of the vendored files by path.
+    """
+    return {**dict(BOOTSTRAP_FILES.values()), **BOOTSTRAP_SOURCE_MAPS}
+
+
+def get_bootstrap_settings():
+    """
+    Returns the BOOTSTRAP5 settings pointing to the vendored files.
+    """
+    return {
+        name: {'url': static_lazy(f'{BOOTSTRAP_STATIC_DIR}/{path}')}
+        for name, (path, _) in BOOTSTRAP_FILES.items()
+    }
+
+
+def get_integrity(content):
+    """
+    Returns the subresource integrity value of the content.
+    """
+    digest = base64.b64encode(hashlib.sha384(content).digest()).decode()
+    return f'sha384-{digest}'
+
+
+def get_outdated_files(directory=BOOTSTRAP_DIR):
+    """
+    Returns the paths of the vendored files which are missing
+    or do not match their integrity hashes.
+    """
+    return [
+        path
+        for path, integrity in get_vendored_files().items()
+        if not (directory / path).is_file()
+        or get_integrity((directory / path).read_bytes()) != integrity
+    ]
+
+
+def download_bootstrap(directory=BOOTSTRAP_DIR):
+    """
+    Downloads the missing or outdated Bootstrap files from the CDN
+    into the directory. Raises ValueError without writing anything
+    if a file does not match its integrity hash. Returns the written paths.
+    """
+    integrities = get_vendored_files()
+    contents = {}
+    for path in get_outdated_files(directory):
+        url = BOOTSTRAP_CDN_URL.format(version=BOOTSTRAP_VERSION, path=path)
+        with urlopen(url, timeout=30) as response:
+            content = response.read()
+        if get_integrity(content) != integrities[path]:
+            raise ValueError(f'{url} does not match its integrity hash.')
+        contents[directory / path] = content
+
+    for target, content in contents.items():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+    return list(contents)
@@ -0,0 +1,25 @@
+"""
+Helpers for the benchmark management commands.
+"""
+import statistics
+import time
+
+
+def measure(func, repeat=5):
+    """
+    Calls func repeat times and returns the timings in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def format_timings(timings):
+    return (
+        f'min {min(timings):.2f} ms, '
+        f'median {statistics.median(timings):.2f} ms, '
+        f'max {max(timings):.2f} ms'
+    )
@@ -0,0 +1,75 @@
+"""
+Cache backends counting hits and misses.
+
+The backends are Django's own with get() counting a hit or a miss
+for the key prefix of the cache. Counts are kept in memory, so every
+worker process reports its own. get_many() is not counted.
+"""
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.core.cache.backends import dummy, filebased, locmem, redis
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self):
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self):
+        return self.hits / self.lookups if self.lookups else None
+
+
+_MISSING = object()
+_lock = threading.Lock()
+_stats = defaultdict(CacheStats)
+
+
+def get_stats():
+    """
+    Returns the counts of this process by key prefix.
+    """
+    with _lock:
+        return {
+            prefix: CacheStats(**vars(stats))
+            for prefix, stats in _stats.items()
+        }
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+class StatsMixin:
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        with _lock:
+            stats = _stats[self.key_prefix]
+            if value is _MISSING:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+        return default if value is _MISSING else value
+
+
+class LocMemCache(StatsMixin, locmem.LocMemCache):
+    pass
+
+
+class FileBasedCache(StatsMixin, filebased.FileBasedCache):
+    pass
+
+
+class RedisCache(StatsMixin, redis.RedisCache):
+    pass
+
+
+class DummyCache(StatsMixin, dummy.DummyCache):
+    pass
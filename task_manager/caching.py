@@ -0,0 +1,105 @@
+"""
+Cache configuration.
+
+Every cache is configured with a URL, CACHE_URL for the default cache
+and the caches of the apps:
+    locmem://[name]             memory of the worker process
+    file:///path/to/directory   files shared by the workers of the host
+                                (default, in the temporary directory)
+    redis://[:password@]host:port/db, rediss://...
+                                Redis or a compatible server shared by
+                                all hosts, requires the redis extra
+    dummy://                    no caching
+
+Every app (tasks, statuses, labels, users) has its own cache alias
+and key prefix, so the keys of different apps never clash and the cache
+of an app can be cleared alone. All keys carry CACHE_VERSION: bumping it
+on deploy makes every cached value of the previous release unreachable.
+
+Caches count their hits and misses (see task_manager.cache_backends).
+The caches of the apps keep the version tokens of the cached choices
+(see task_manager.tasks.choices), so they have to be shared by the
+workers: a system check refuses process-local caches unless DEBUG is on.
+"""
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+
+CACHE_NAMESPACES = ('tasks', 'statuses', 'labels', 'users')
+
+CACHE_BACKENDS = {
+    'locmem': 'task_manager.cache_backends.LocMemCache',
+    'file': 'task_manager.cache_backends.FileBasedCache',
+    'redis': 'task_manager.cache_backends.RedisCache',
+    'rediss': 'task_manager.cache_backends.RedisCache',
+    'dummy': 'task_manager.cache_backends.DummyCache',
+}
+
+
+def get_location(scheme, url, namespace):
+    parts = urlsplit(url)
+    if scheme == 'locmem':
+        return f'{parts.netloc}:{namespace}' if parts.netloc else namespace
+    if scheme == 'file':
+        # A directory per namespace, as clearing a file cache
+        # deletes every file of its directory
+        return str(Path(parts.netloc + parts.path) / namespace)
+    if scheme == 'dummy':
+        return ''
+    return url
+
+
+def get_cache_settings(url, namespace, version=1):
+    """
+    Returns the CACHES entry of the namespace for the cache URL.
+    """
+    scheme = urlsplit(url).scheme
+    if scheme not in CACHE_BACKENDS:
+        raise ImproperlyConfigured(
+            f'Unsupported cache URL scheme {scheme!r}, '
+            f'expected one of {", ".join(CACHE_BACKENDS)}.'
+        )
+    return {
+        'BACKEND': CACHE_BACKENDS[scheme],
+        'LOCATION': get_location(scheme, url, namespace),
+        'KEY_PREFIX': namespace,
+        'VERSION': version,
+    }
+
+
+def get_cache_alias(app_label):
+    """
+    Returns the alias of the cache of the app, or the default cache
+    for apps without their own.
+    """
+    if app_label in settings.CACHES:
+        return app_label
+    return DEFAULT_CACHE_ALIAS
+
+
+def get_cache(app_label):
+    return caches[get_cache_alias(app_label)]
+
+
+def is_shared(alias):
+    """
+    Tells whether the values of the cache are seen by all worker processes.
+    """
+    return not isinstance(caches[alias], LocMemCache)
+
+
+def is_available(alias):
+    """
+    Checks that a value can be stored in the cache and read back.
+    """
+    cache = caches[alias]
+    try:
+        cache.set('health', True, timeout=10)
+        return cache.has_key('health')
+    # Connection errors depend on the backend
+    except Exception:
+        return False
@@ -0,0 +1,50 @@
+"""
+System checks of the project.
+"""
+from django.conf import settings
+from django.core.checks import Error
+
+from task_manager.assets import BOOTSTRAP_STATIC_DIR, get_outdated_files
+from task_manager.caching import (
+    CACHE_NAMESPACES,
+    get_cache_alias,
+    is_shared,
+)
+
+
+def check_vendored_bootstrap(app_configs, **kwargs):
+    """
+    Fails collectstatic and the other commands when a vendored
+    Bootstrap file is missing or changed, instead of serving
+    the pages without it.
+    """
+    return [
+        Error(
+            f'{BOOTSTRAP_STATIC_DIR}/{path} is missing or does not match '
+            'its integrity hash.',
+            hint='Run make vendor-bootstrap and commit the files.',
+            id='task_manager.E001',
+        )
+        for path in get_outdated_files()
+    ]
+
+
+def check_shared_caches(app_configs, **kwargs):
+    """
+    A version token replaced in the cache of one worker process would
+    never reach the others, which would keep serving stale choices,
+    ETags and task rows.
+    """
+    if settings.DEBUG:
+        return []
+    aliases = {get_cache_alias(namespace) for namespace in CACHE_NAMESPACES}
+    return [
+        Error(
+            f'The {alias!r} cache is kept in the memory of every worker '
+            'process, so the workers do not see the changes of the others.',
+            hint='Set CACHE_URL to a file:// or redis:// location.',
+            id='task_manager.E002',
+        )
+        for alias in sorted(aliases)
+        if not is_shared(alias)
+    ]
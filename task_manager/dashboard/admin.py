@@ -0,0 +1,6 @@
+from django.contrib import admin
+
+from task_manager.dashboard.models import TaskRollup
+
+# Register your models here.
+admin.site.register(TaskRollup)
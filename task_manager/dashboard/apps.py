@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class DashboardConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager.dashboard'
+
+    def ready(self):
+        # Connect signal receivers
+        from task_manager.dashboard import signals  # noqa: F401
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.dashboard import rollups
+
+
+class Command(BaseCommand):
+    help = 'Recounts the dashboard rollups from the tasks.'
+
+    def handle(self, *args, **options):
+        rollups.rebuild()
+        self.stdout.write(self.style.SUCCESS('Task rollups rebuilt.'))
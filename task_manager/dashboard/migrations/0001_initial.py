@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('status', 'Status'), ('executor', 'Executor'), ('label', 'Label')], max_length=16, verbose_name='Dimension')),
+                ('key', models.BigIntegerField(verbose_name='Key')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('count', models.IntegerField(default=0, verbose_name='Count')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['dimension', 'day'], name='taskrollup_dimension_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'key', 'day'), name='taskrollup_dimension_key_day_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def fill_task_rollups(apps, schema_editor):
+    TaskRollup = apps.get_model('dashboard', 'TaskRollup')
+    Task = apps.get_model('tasks', 'Task')
+    TaskLabel = apps.get_model('tasks', 'TaskLabel')
+
+    for dimension, source, field, created_at in (
+        ('status', Task, 'status', 'created_at'),
+        ('executor', Task, 'executor', 'created_at'),
+        ('label', TaskLabel, 'label', 'task__created_at'),
+    ):
+        rows = (
+            source.objects.order_by()
+            .annotate(day=TruncDate(created_at))
+            .values(field, 'day')
+            .annotate(count=Count('pk'))
+        )
+        TaskRollup.objects.bulk_create(
+            [
+                TaskRollup(
+                    dimension=dimension,
+                    key=row[field] or 0,
+                    day=row['day'],
+                    count=row['count'],
+                )
+                for row in rows.iterator()
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        ('tasks', '0007_fill_task_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_task_rollups, migrations.RunPython.noop),
+    ]
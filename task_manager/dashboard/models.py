@@ -0,0 +1,56 @@
+from django.db import models
+
+from task_manager.texts import rollup_model
+
+
+class TaskRollup(models.Model):
+    """
+    Number of tasks created on a day, grouped by one dimension:
+    their status, executor or label.
+    Maintained by task_manager.dashboard.rollups.
+    """
+    STATUS = 'status'
+    EXECUTOR = 'executor'
+    LABEL = 'label'
+    DIMENSIONS = [
+        (STATUS, rollup_model['status']),
+        (EXECUTOR, rollup_model['executor']),
+        (LABEL, rollup_model['label']),
+    ]
+
+    # Key of tasks without an executor
+    NO_KEY = 0
+
+    dimension = models.CharField(
+        verbose_name=rollup_model['dimension'],
+        max_length=16,
+        choices=DIMENSIONS,
+    )
+    # Primary key of the status, executor or label
+    key = models.BigIntegerField(
+        verbose_name=rollup_model['key'],
+    )
+    day = models.DateField(
+        verbose_name=rollup_model['day'],
+    )
+    count = models.IntegerField(
+        verbose_name=rollup_model['count'],
+        default=0,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dimension', 'key', 'day'],
+                name='taskrollup_dimension_key_day_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['dimension', 'day'],
+                name='taskrollup_dimension_day_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.dimension} {self.key} {self.day}: {self.count}'
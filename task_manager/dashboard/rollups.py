@@ -0,0 +1,106 @@
+"""
+Maintains the task rollups read by the dashboard.
+
+Rollups are adjusted incrementally by the receivers in
+task_manager.dashboard.signals. Bulk operations, which bypass model signals,
+send the tasks_bulk_updating and task_labels_bulk_changing signals
+and are counted by their receivers. rebuild() only repairs rollups,
+it is run by the rebuild_task_rollups command.
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from task_manager.dashboard.models import TaskRollup
+from task_manager.tasks.models import Task, TaskLabel
+
+# Dimension -> (model of the rows to count, field of the dimension,
+# field of the task creation time)
+_sources = {
+    TaskRollup.STATUS: (Task, 'status', 'created_at'),
+    TaskRollup.EXECUTOR: (Task, 'executor', 'created_at'),
+    TaskRollup.LABEL: (TaskLabel, 'label', 'task__created_at'),
+}
+
+
+def get_day(created_at):
+    return timezone.localdate(created_at)
+
+
+def task_deltas(status_id, executor_id, day, delta):
+    """
+    Returns the changes of the status and executor rollups
+    made by adding (delta=1) or removing (delta=-1) a task.
+    """
+    return Counter({
+        (TaskRollup.STATUS, status_id, day): delta,
+        (TaskRollup.EXECUTOR, executor_id or TaskRollup.NO_KEY, day): delta,
+    })
+
+
+def count_by_day(tasks, *fields):
+    """
+    Returns (*field values, day, number of tasks) rows of the tasks
+    grouped by the fields and the day they were created.
+    """
+    return (
+        tasks.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values_list(*fields, 'day')
+        .annotate(count=Count('pk'))
+    )
+
+
+def record(deltas):
+    """
+    Adds deltas to the rollups, creating missing ones.
+    deltas maps (dimension, key, day) to the change of the count.
+    """
+    for (dimension, key, day), delta in deltas.items():
+        if key is None or not delta:
+            continue
+        rollup = TaskRollup.objects.filter(
+            dimension=dimension, key=key, day=day,
+        )
+        if rollup.update(count=F('count') + delta):
+            continue
+        try:
+            with transaction.atomic():
+                TaskRollup.objects.create(
+                    dimension=dimension, key=key, day=day, count=delta,
+                )
+        except IntegrityError:
+            # Created concurrently since the update
+            rollup.update(count=F('count') + delta)
+
+
+def _count(dimension):
+    source, field, created_at = _sources[dimension]
+    rows = (
+        source.objects.order_by()
+        .annotate(day=TruncDate(created_at))
+        .values(field, 'day')
+        .annotate(count=Count('pk'))
+    )
+    return [
+        TaskRollup(
+            dimension=dimension,
+            key=row[field] or TaskRollup.NO_KEY,
+            day=row['day'],
+            count=row['count'],
+        )
+        for row in rows.iterator()
+    ]
+
+
+@transaction.atomic
+def rebuild():
+    """
+    Recounts all rollups from the tasks.
+    """
+    TaskRollup.objects.all().delete()
+    for dimension in _sources:
+        TaskRollup.objects.bulk_create(_count(dimension), batch_size=1000)
@@ -0,0 +1,141 @@
+"""
+Signal receivers of the dashboard app.
+
+Same events as the task counters in task_manager.tasks.signals,
+but changes are also grouped by the day the task was created.
+"""
+from collections import Counter
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from task_manager.dashboard import rollups
+from task_manager.dashboard.models import TaskRollup
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.tasks.signals import (
+    task_labels_bulk_changing,
+    tasks_bulk_created,
+    tasks_bulk_updating,
+)
+
+# Task field -> dimension of the rollups
+_task_dimensions = {
+    'status_id': TaskRollup.STATUS,
+    'executor_id': TaskRollup.EXECUTOR,
+}
+
+
+@receiver(post_save, sender=Task)
+def roll_up_saved_task(sender, instance, created, **kwargs):
+    day = rollups.get_day(instance.created_at)
+    deltas = rollups.task_deltas(
+        instance.status_id, instance.executor_id, day, 1
+    )
+    if not created:
+        # Values stored before the save, see Task.save()
+        previous = instance._loaded_values
+        deltas.update(rollups.task_deltas(
+            previous.get('status_id'), previous.get('executor_id'), day, -1
+        ))
+    rollups.record(deltas)
+
+
+@receiver(post_delete, sender=Task)
+def roll_up_deleted_task(sender, instance, **kwargs):
+    rollups.record(rollups.task_deltas(
+        instance.status_id,
+        instance.executor_id,
+        rollups.get_day(instance.created_at),
+        -1,
+    ))
+
+
+def _task_label_deltas(instance, delta):
+    created_at = (
+        Task.objects.filter(pk=instance.task_id)
+        .values_list('created_at', flat=True)
+        .first()
+    )
+    if created_at is None:
+        return {}
+    day = rollups.get_day(created_at)
+    return {(TaskRollup.LABEL, instance.label_id, day): delta}
+
+
+@receiver(post_save, sender=TaskLabel)
+def roll_up_saved_task_label(sender, instance, created, **kwargs):
+    if created:
+        rollups.record(_task_label_deltas(instance, 1))
+
+
+@receiver(post_delete, sender=TaskLabel)
+def roll_up_deleted_task_label(sender, instance, **kwargs):
+    """
+    Also called for the links of deleted tasks, which are deleted
+    before the tasks themselves, and for links removed by
+    task.labels.remove(), set() and clear().
+    """
+    rollups.record(_task_label_deltas(instance, -1))
+
+
+@receiver(m2m_changed, sender=TaskLabel)
+def roll_up_added_task_labels(sender, instance, action, reverse, pk_set,
+                              **kwargs):
+    """
+    task.labels.add() and set() insert TaskLabel objects with bulk_create,
+    which sends no post_save signals.
+    """
+    if action != 'post_add' or not pk_set:
+        return
+    if reverse:
+        # label.tasks.add(*tasks)
+        days = Counter(
+            rollups.get_day(created_at)
+            for created_at in Task.objects.filter(pk__in=pk_set)
+            .values_list('created_at', flat=True)
+        )
+        rollups.record({
+            (TaskRollup.LABEL, instance.pk, day): count
+            for day, count in days.items()
+        })
+    else:
+        day = rollups.get_day(instance.created_at)
+        rollups.record({(TaskRollup.LABEL, pk, day): 1 for pk in pk_set})
+
+
+@receiver(tasks_bulk_created)
+def roll_up_bulk_created_tasks(sender, tasks, task_labels, **kwargs):
+    deltas = Counter()
+    days = {}
+    for task in tasks:
+        days[task.pk] = rollups.get_day(task.created_at)
+        deltas.update(rollups.task_deltas(
+            task.status_id, task.executor_id, days[task.pk], 1
+        ))
+    deltas.update(
+        (TaskRollup.LABEL, link.label_id, days[link.task_id])
+        for link in task_labels
+    )
+    rollups.record(deltas)
+
+
+@receiver(tasks_bulk_updating)
+def roll_up_bulk_updated_tasks(sender, queryset, values, **kwargs):
+    deltas = Counter()
+    for field, dimension in _task_dimensions.items():
+        if field not in values:
+            continue
+        new_key = values[field] or TaskRollup.NO_KEY
+        for key, day, count in rollups.count_by_day(queryset, field):
+            deltas[(dimension, key or TaskRollup.NO_KEY, day)] -= count
+            deltas[(dimension, new_key, day)] += count
+    rollups.record(deltas)
+
+
+@receiver(task_labels_bulk_changing)
+def roll_up_bulk_changed_task_labels(sender, tasks, label_id, delta,
+                                     **kwargs):
+    rollups.record({
+        (TaskRollup.LABEL, label_id, day): delta * count
+        for day, count in rollups.count_by_day(tasks)
+    })
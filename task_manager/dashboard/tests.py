@@ -0,0 +1,163 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from task_manager import texts
+from task_manager.dashboard import rollups
+from task_manager.dashboard.models import TaskRollup
+from task_manager.factories import (
+    LabelFactory,
+    StatusFactory,
+    TaskFactory,
+    UserFactory,
+)
+from task_manager.tasks import bulk
+from task_manager.tasks.importers import TaskImporter
+from task_manager.tasks.models import Task
+
+
+class SetUpMixin:
+    def setUp(self):
+        self.client = Client()
+        self.tasks = TaskFactory.create_batch(3)
+        self.user = UserFactory()
+        self.client.force_login(self.user)
+
+
+def get_rollups():
+    return {
+        (rollup.dimension, rollup.key, rollup.day): rollup.count
+        for rollup in TaskRollup.objects.exclude(count=0)
+    }
+
+
+class TestTaskRollups(SetUpMixin, TestCase):
+    def assertRollupsRebuilt(self):
+        """
+        Checks the incrementally maintained rollups
+        match the ones counted from scratch.
+        """
+        incremental = get_rollups()
+        rollups.rebuild()
+        self.assertEqual(incremental, get_rollups())
+
+    def test_task_changes(self):
+        status = StatusFactory()
+        task = TaskFactory(status=status, executor=None)
+        day = timezone.localdate()
+        self.assertEqual(
+            get_rollups()[(TaskRollup.STATUS, status.id, day)], 1
+        )
+        self.assertEqual(
+            get_rollups()[(TaskRollup.EXECUTOR, TaskRollup.NO_KEY, day)], 1
+        )
+
+        task.status = self.tasks[0].status
+        task.executor = self.user
+        task.save()
+        self.assertNotIn((TaskRollup.STATUS, status.id, day), get_rollups())
+        self.assertEqual(
+            get_rollups()[(TaskRollup.EXECUTOR, self.user.id, day)], 1
+        )
+        self.assertRollupsRebuilt()
+
+        task.delete()
+        self.assertRollupsRebuilt()
+
+    def test_unchanged_task_save_makes_no_rollup_queries(self):
+        task = self.tasks[0]
+        task.name = 'Renamed task'
+        with CaptureQueriesContext(connection) as queries:
+            task.save()
+        self.assertFalse(any(
+            'dashboard_taskrollup' in query['sql']
+            for query in queries.captured_queries
+        ))
+
+    def test_label_changes(self):
+        label, other_label = LabelFactory.create_batch(2)
+        task = TaskFactory(labels=[label])
+        task.labels.add(other_label)
+        other_label.tasks.add(*self.tasks)
+        self.assertRollupsRebuilt()
+
+        task.labels.set([other_label])
+        self.assertRollupsRebuilt()
+
+        other_label.tasks.clear()
+        self.assertRollupsRebuilt()
+
+        task.delete()
+        self.assertRollupsRebuilt()
+
+    def test_bulk_import(self):
+        label = LabelFactory()
+        TaskImporter(self.user).import_rows([
+            {'name': 'Imported', 'status': self.tasks[0].status.name,
+             'labels': [label.name]},
+            {'name': 'Imported too', 'status': self.tasks[1].status.name,
+             'executor': self.user.username},
+        ])
+        self.assertRollupsRebuilt()
+
+    def test_bulk_actions(self):
+        label = LabelFactory()
+        tasks = Task.objects.all()
+        bulk.set_status(tasks, self.tasks[0].status)
+        self.assertRollupsRebuilt()
+
+        bulk.set_executor(tasks.filter(pk=self.tasks[1].pk), None)
+        bulk.set_executor(tasks, self.user)
+        self.assertRollupsRebuilt()
+
+        bulk.add_labels(tasks, [label])
+        self.assertRollupsRebuilt()
+
+        bulk.remove_labels(tasks.filter(pk=self.tasks[2].pk), [label])
+        self.assertRollupsRebuilt()
+
+    def test_rebuild_task_rollups(self):
+        expected = get_rollups()
+        TaskRollup.objects.update(count=100)
+
+        call_command('rebuild_task_rollups', stdout=StringIO())
+
+        self.assertEqual(get_rollups(), expected)
+
+
+class TestDashboard(SetUpMixin, TestCase):
+    def test_dashboard_with_no_login(self):
+        self.client.logout()
+        response = self.client.get(reverse_lazy('dashboard'))
+        expected_url = (
+            f"{reverse_lazy('login')}?next={reverse_lazy('dashboard')}"
+        )
+        self.assertRedirects(response, expected_url)
+
+    def test_dashboard(self):
+        response = self.client.get(reverse_lazy('dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'dashboard/index.html')
+        self.assertContains(response, texts.dashboard['by_status'])
+
+        for task in self.tasks:
+            self.assertIn((task.status.name, 1), response.context['by_status'])
+            self.assertIn(
+                (str(task.executor), 1), response.context['by_executor']
+            )
+        (day, counts, total), = response.context['timeline']
+        self.assertEqual(day, timezone.localdate())
+        self.assertEqual(total, 3)
+
+    def test_dashboard_does_not_read_tasks(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse_lazy('dashboard'))
+        self.assertFalse(any(
+            'tasks_task' in query['sql']
+            for query in queries.captured_queries
+        ))
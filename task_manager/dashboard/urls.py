@@ -0,0 +1,6 @@
+from django.urls import path
+from task_manager.dashboard import views
+
+urlpatterns = [
+    path('', views.DashboardView.as_view(), name='dashboard'),
+]
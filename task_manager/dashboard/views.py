@@ -0,0 +1,103 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Sum
+from django.urls import reverse_lazy
+from django.utils import timezone
+from django.views.generic import TemplateView
+
+from task_manager import texts
+from task_manager.dashboard.models import TaskRollup
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import choices
+
+User = get_user_model()
+
+# Number of days shown in the timeline
+TIMELINE_DAYS = 30
+
+
+def get_names(model):
+    """
+    Returns names of all objects of the model by primary key,
+    from the cached dropdown choices.
+    """
+    return dict(choices.get_choices(model.objects.all(), str))
+
+
+class DashboardView(LoginRequiredMixin, TemplateView):
+    """
+    Task counts by status, executor and label.
+    Reads only the rollups, never the tasks table.
+    """
+    template_name = 'dashboard/index.html'
+    login_url = reverse_lazy('login')
+    extra_context = {
+        'base': texts.base,
+        'dashboard': texts.dashboard,
+    }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        status_names = get_names(Status)
+        executor_names = {
+            TaskRollup.NO_KEY: texts.dashboard['no_executor'],
+            **get_names(User),
+        }
+        context.update({
+            'by_status': self.get_totals(TaskRollup.STATUS, status_names),
+            'by_executor': self.get_totals(
+                TaskRollup.EXECUTOR, executor_names
+            ),
+            'by_label': self.get_totals(TaskRollup.LABEL, get_names(Label)),
+        })
+        context.update(self.get_timeline(status_names))
+        return context
+
+    def get_totals(self, dimension, names):
+        """
+        Returns (name, count) pairs of the dimension, largest first.
+        """
+        rows = (
+            TaskRollup.objects.filter(dimension=dimension)
+            .values('key')
+            .annotate(total=Sum('count'))
+            .filter(total__gt=0)
+            .order_by('-total', 'key')
+        )
+        return [
+            (names.get(row['key'], row['key']), row['total'])
+            for row in rows
+        ]
+
+    def get_timeline(self, status_names):
+        """
+        Returns the number of tasks created on every day
+        of the last TIMELINE_DAYS days by status, newest first.
+        """
+        since = timezone.localdate() - timedelta(days=TIMELINE_DAYS - 1)
+        rows = TaskRollup.objects.filter(
+            dimension=TaskRollup.STATUS, day__gte=since, count__gt=0,
+        ).values_list('day', 'key', 'count')
+
+        counts = defaultdict(dict)
+        for day, key, count in rows:
+            counts[day][key] = count
+        keys = sorted({key for day in counts.values() for key in day})
+
+        return {
+            'timeline_statuses': [
+                status_names.get(key, key) for key in keys
+            ],
+            'timeline': [
+                (
+                    day,
+                    [counts[day].get(key, 0) for key in keys],
+                    sum(counts[day].values()),
+                )
+                for day in sorted(counts, reverse=True)
+            ],
+        }
@@ -0,0 +1,84 @@
+"""
+Connection pooling for PostgreSQL deployments.
+
+By default every gunicorn worker thread keeps its own persistent connection
+(CONN_MAX_AGE), and all of them reconnect at once after a deploy.
+With DATABASE_POOL=True every worker process keeps a pool of connections
+(Django's native pool) instead: requests borrow a connection and return it
+when they finish, and the pool opens, checks and recycles connections.
+
+Pooling requires psycopg 3 with the pool, the pool extra of the project:
+    poetry install -E pool
+
+The pool is configured with environment variables:
+    DATABASE_POOL_MIN_SIZE      connections kept open (2)
+    DATABASE_POOL_MAX_SIZE      connections opened at most (4)
+    DATABASE_POOL_TIMEOUT       seconds to wait for a free connection (10)
+    DATABASE_POOL_MAX_IDLE      seconds before closing an idle connection
+                                above min size (300)
+    DATABASE_POOL_MAX_LIFETIME  seconds before replacing a connection (3600)
+    DATABASE_POOL_CHECK         check connections before lending them (True)
+"""
+import os
+from importlib.util import find_spec
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+
+POOL_DEFAULTS = {
+    'min_size': 2,
+    'max_size': 4,
+    'timeout': 10.0,
+    'max_idle': 300.0,
+    'max_lifetime': 3600.0,
+}
+
+
+def check_connection(connection):
+    """
+    Health check of a connection taken from the pool.
+    Broken connections raise and are replaced by the pool.
+    """
+    connection.execute('SELECT 1')
+
+
+def get_pool_options(environ=os.environ):
+    """
+    Returns the 'pool' database option built from the environment.
+    """
+    # Django would fall back to psycopg2, which cannot pool
+    if find_spec('psycopg') is None or find_spec('psycopg_pool') is None:
+        raise ImproperlyConfigured(
+            'DATABASE_POOL=True requires psycopg 3 with the pool, '
+            'install it with `poetry install -E pool`.'
+        )
+    options = {
+        name: type(default)(
+            environ.get(f'DATABASE_POOL_{name.upper()}', default)
+        )
+        for name, default in POOL_DEFAULTS.items()
+    }
+    if environ.get('DATABASE_POOL_CHECK', 'True') == 'True':
+        options['check'] = check_connection
+    return options
+
+
+def get_pool_stats():
+    """
+    Returns the statistics of the connection pools of this process
+    by database alias, with the average wait for a connection in ms.
+    Databases without a pool are skipped.
+    """
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], 'pool', None)
+        if pool is None:
+            continue
+        pool_stats = pool.get_stats()
+        requests = pool_stats.get('requests_num', 0)
+        pool_stats['requests_wait_ms_avg'] = (
+            pool_stats.get('requests_wait_ms', 0) / requests
+            if requests else 0
+        )
+        stats[alias] = pool_stats
+    return stats
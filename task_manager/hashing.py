@@ -0,0 +1,49 @@
+"""
+Bounded executor for password hashing in async views.
+
+Hashing a password takes hundreds of milliseconds of CPU. The async
+login and registration views run the step that hashes in this executor,
+so the event loop of the worker keeps serving other requests meanwhile.
+hashlib releases the GIL while hashing, so PASSWORD_HASHING_THREADS
+passwords are hashed in parallel, and further ones wait in the queue of
+the executor instead of starting more threads that would slow every hash
+down. One thread per CPU of the worker is enough.
+
+Every thread has its own database connection, which is closed like the
+connection of a request: when it is unusable or older than CONN_MAX_AGE.
+With PASSWORD_HASHING_THREADS=0 the step runs in the thread of the
+request instead.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+
+@cache
+def get_executor(threads):
+    return ThreadPoolExecutor(
+        max_workers=threads, thread_name_prefix='password_hashing'
+    )
+
+
+def _run(func, *args, **kwargs):
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_hashing(func, *args, **kwargs):
+    """
+    Calls func, which hashes a password, in the hashing executor.
+    """
+    threads = settings.PASSWORD_HASHING_THREADS
+    if not threads:
+        return await sync_to_async(func)(*args, **kwargs)
+    return await sync_to_async(
+        _run, thread_sensitive=False, executor=get_executor(threads)
+    )(func, *args, **kwargs)
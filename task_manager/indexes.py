@@ -0,0 +1,27 @@
+"""
+Indexes of prefix searches.
+
+The autocomplete views search with Upper(field)__startswith, which runs
+UPPER(field) LIKE 'TERM%'. On PostgreSQL a plain btree index can serve
+LIKE only with the C collation, so PrefixIndex adds the text_pattern_ops
+operator class to its expressions there (registered as an index
+wrapper by django.contrib.postgres). Other databases get a plain index.
+"""
+from django.contrib.postgres.indexes import OpClass
+from django.db import models
+
+
+class PrefixIndex(models.Index):
+    opclass = 'text_pattern_ops'
+
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        index = self
+        if schema_editor.connection.vendor == 'postgresql':
+            index = models.Index(
+                *(OpClass(expression, name=self.opclass)
+                  for expression in self.expressions),
+                name=self.name,
+            )
+        return models.Index.create_sql(
+            index, model, schema_editor, using=using, **kwargs
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:19
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0002_alter_label_created_at_alter_label_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='label',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='label_name_upper_idx'),
+        ),
+    ]
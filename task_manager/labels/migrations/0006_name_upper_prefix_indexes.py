@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-18 19:14
+
+import django.db.models.functions.text
+import task_manager.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0005_label_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='label',
+            name='label_name_upper_idx',
+        ),
+        migrations.AddIndex(
+            model_name='label',
+            index=task_manager.indexes.PrefixIndex(django.db.models.functions.text.Upper('name'), name='label_name_upper_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models.functions import Upper
 
+from task_manager.indexes import PrefixIndex
 from task_manager.texts import label_model
 
 
@@ -15,6 +17,24 @@ class Label(models.Model):
         verbose_name=label_model['created_at'],
         auto_now_add=True,
     )
+    updated_at = models.DateTimeField(
+        verbose_name=label_model['updated_at'],
+        auto_now=True,
+    )
+
+    # Number of tasks using the label.
+    # Maintained by task_manager.tasks.counters
+    task_count = models.IntegerField(
+        verbose_name=label_model['task_count'],
+        default=0,
+        editable=False,
+    )
+
+    class Meta:
+        # Used by the prefix search of the labels autocomplete
+        indexes = [
+            PrefixIndex(Upper('name'), name='label_name_upper_idx'),
+        ]
 
     def __str__(self):
         return self.name
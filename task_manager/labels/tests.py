@@ -3,6 +3,7 @@ from django.urls import reverse_lazy
 
 from task_manager import texts
 from task_manager.factories import LabelFactory, TaskFactory, UserFactory
+from task_manager.labels.forms import LabelForm
 from task_manager.labels.models import Label
 
 
@@ -83,6 +84,44 @@ class TestLabelsIndex(SetUpMixin, TestCase):
             )
 
 
+class TestLabelsIndexConditionalGet(SetUpMixin, TestCase):
+    def get(self, etag=None):
+        headers = {'If-None-Match': etag} if etag else {}
+        return self.client.get(reverse_lazy('labels_index'), headers=headers)
+
+    def test_unchanged_labels_index(self):
+        etag = self.get()['ETag']
+        self.assertEqual(self.get(etag).status_code, 304)
+
+    def test_labels_index_after_update(self):
+        etag = self.get()['ETag']
+        self.labels[0].name = 'Renamed label'
+        self.labels[0].save()
+        self.assertEqual(self.get(etag).status_code, 200)
+
+
+class TestLabelsAutocomplete(SetUpMixin, TestCase):
+    def test_autocomplete_by_prefix(self):
+        label = LabelFactory(name='Urgent')
+        LabelFactory(name='Not urgent')
+        response = self.client.get(
+            reverse_lazy('labels_autocomplete'),
+            {'q': 'urg'},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['results'],
+            [{'id': label.id, 'text': 'Urgent'}],
+        )
+
+    def test_autocomplete_without_term(self):
+        response = self.client.get(reverse_lazy('labels_autocomplete'))
+        self.assertEqual(
+            [result['id'] for result in response.json()['results']],
+            [label.id for label in self.labels],
+        )
+
+
 class TestLabelCreate(SetUpMixin, TestCase):
     def test_label_create_form(self):
         response = self.client.get(reverse_lazy('label_create'))
@@ -113,6 +152,15 @@ class TestLabelCreate(SetUpMixin, TestCase):
         errors = response.context['form'].errors
         self.assertIn('name', errors)
 
+    def test_label_update_keeps_task_count(self):
+        label = Label.objects.get(id=self.labels[0].id)
+        TaskFactory(labels=[label])
+        form = LabelForm({'name': 'Updated label'}, instance=label)
+        form.save()
+        label.refresh_from_db()
+        self.assertEqual(label.name, 'Updated label')
+        self.assertEqual(label.task_count, 1)
+
 
 class TestLabelUpdate(SetUpMixin, TestCase):
     def test_label_update_form(self):
@@ -144,6 +192,15 @@ class TestLabelUpdate(SetUpMixin, TestCase):
         errors = response.context['form'].errors
         self.assertIn('name', errors)
 
+    def test_label_update_keeps_task_count(self):
+        label = Label.objects.get(id=self.labels[0].id)
+        TaskFactory(labels=[label])
+        form = LabelForm({'name': 'Updated label'}, instance=label)
+        form.save()
+        label.refresh_from_db()
+        self.assertEqual(label.name, 'Updated label')
+        self.assertEqual(label.task_count, 1)
+
 
 class TestLabelDelete(SetUpMixin, TestCase):
     def test_label_delete_form(self):
@@ -174,3 +231,14 @@ class TestLabelDelete(SetUpMixin, TestCase):
         self.assertRedirects(response, reverse_lazy('labels_index'))
         self.assertContains(response, texts.delete_label['delete_error'])
         self.assertEqual(Label.objects.count(), 3)
+
+    def test_label_with_stale_counter_delete_failure(self):
+        TaskFactory(labels=[self.labels[0]])
+        Label.objects.filter(id=self.labels[0].id).update(task_count=0)
+        response = self.client.post(
+            reverse_lazy('label_delete', args=[self.labels[0].id]),
+            follow=True
+        )
+        self.assertRedirects(response, reverse_lazy('labels_index'))
+        self.assertContains(response, texts.delete_label['delete_error'])
+        self.assertEqual(Label.objects.count(), 3)
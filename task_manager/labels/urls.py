@@ -4,6 +4,11 @@ from task_manager.labels import views
 urlpatterns = [
     path('', views.LabelsIndexView.as_view(), name='labels_index'),
     path('create/', views.LabelCreateView.as_view(), name='label_create'),
+    path(
+        'autocomplete/',
+        views.LabelsAutocompleteView.as_view(),
+        name='labels_autocomplete',
+    ),
     path(
         '<int:pk>/update/',
         views.LabelUpdateView.as_view(),
@@ -1,6 +1,7 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
+from django.db.models import ProtectedError
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
@@ -8,9 +9,18 @@ from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 from task_manager import texts
 from task_manager.labels.forms import LabelForm
 from task_manager.labels.models import Label
+from task_manager.mixins import ConditionalGetMixin
+from task_manager.replicas import ReplicaReadMixin
+from task_manager.views import AutocompleteView
 
 
-class LabelsIndexView(LoginRequiredMixin, ListView):
+class LabelsIndexView(LoginRequiredMixin,
+                      ReplicaReadMixin,
+                      ConditionalGetMixin,
+                      ListView):
+    """
+    Unchanged pages are answered with 304 Not Modified.
+    """
     model = Label
     template_name = 'labels/index.html'
     context_object_name = 'labels'
@@ -75,11 +85,24 @@ class LabelDeleteView(SuccessMessageMixin, LoginRequiredMixin, DeleteView):
         If label is in use, show an error message and redirect
         to the labels index page.
         """
-        in_use = self.get_object().tasks.exists()
-        if in_use:
-            messages.error(
-                request,
-                texts.delete_label['delete_error']
-            )
-            return redirect(self.success_url)
-        return super().post(request, *args, **kwargs)
+        in_use = self.get_object().task_count > 0
+        if not in_use:
+            try:
+                return super().post(request, *args, **kwargs)
+            except ProtectedError:
+                # The counter lags behind tasks added meanwhile
+                pass
+        messages.error(
+            request,
+            texts.delete_label['delete_error']
+        )
+        return redirect(self.success_url)
+
+
+class LabelsAutocompleteView(AutocompleteView):
+    """
+    Search labels by the beginning of the name.
+    """
+    model = Label
+    search_fields = ('name',)
+    ordering = ('name',)
@@ -0,0 +1,79 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+
+User = get_user_model()
+
+USERNAME = 'benchmark_login'
+PASSWORD = 'benchmark!123'
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the login throughput of a worker with the configured '
+        'password hasher, and the hashing time with other iterations. '
+        'The user it logs in is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=20,
+            help='Number of timed logins.',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            nargs='*',
+            default=[],
+            help='Iteration counts to time the hasher with.',
+        )
+
+    def handle(self, *args, **options):
+        hasher = get_hasher()
+        self.stdout.write(
+            f'Hasher: {hasher.algorithm}, '
+            f'{getattr(hasher, "iterations", "-")} iterations'
+        )
+        with transaction.atomic():
+            rate = self.measure_logins(options['requests'])
+            transaction.set_rollback(True)
+        self.stdout.write(
+            f'Logins: {rate:.1f}/s, {1000 / rate:.0f} ms per login'
+        )
+
+        if options['iterations'] and not hasattr(hasher, 'iterations'):
+            raise CommandError(
+                f'The {hasher.algorithm} hasher has no iterations.'
+            )
+        for iterations in options['iterations']:
+            seconds = self.measure_hashing(hasher, iterations)
+            self.stdout.write(
+                f'{iterations} iterations: {seconds * 1000:.0f} ms per hash'
+            )
+
+    def measure_logins(self, requests):
+        User.objects.create_user(USERNAME, password=PASSWORD)
+        url = reverse('login')
+        data = {'username': USERNAME, 'password': PASSWORD}
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            start = time.perf_counter()
+            for _ in range(requests):
+                response = Client().post(url, data)
+                if response.status_code != 302:
+                    raise CommandError('Login failed.')
+            seconds = time.perf_counter() - start
+        return requests / seconds
+
+    def measure_hashing(self, hasher, iterations, runs=3):
+        salt = hasher.salt()
+        start = time.perf_counter()
+        for _ in range(runs):
+            hasher.encode(PASSWORD, salt, iterations=iterations)
+        return (time.perf_counter() - start) / runs
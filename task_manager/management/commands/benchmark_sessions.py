@@ -0,0 +1,66 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the throughput of the tasks index for an authenticated '
+        'user with every session backend of SESSION_ENGINES.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'username',
+            help='User to log in, e.g. one created by seed_data.',
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=100,
+            help='Number of timed requests per backend.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f'User "{options["username"]}" not found.')
+
+        for name, engine in settings.SESSION_ENGINES.items():
+            with override_settings(
+                SESSION_ENGINE=engine,
+                ALLOWED_HOSTS=['testserver'],
+            ):
+                rate, session_queries = self.measure(
+                    user, options['requests']
+                )
+            self.stdout.write(
+                f'{name}: {rate:.0f} requests/s, '
+                f'{session_queries:.1f} session queries per request'
+            )
+
+    def measure(self, user, requests):
+        client = Client()
+        client.force_login(user)
+        url = reverse('tasks_index')
+        # The first request loads caches shared by all backends
+        client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for _ in range(requests):
+                client.get(url)
+            seconds = time.perf_counter() - start
+        session_queries = sum(
+            'django_session' in query['sql'] for query in queries
+        )
+        return requests / seconds, session_queries / requests
@@ -0,0 +1,96 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.template import Engine, RequestContext, engines
+from django.test import RequestFactory
+from django.utils import timezone
+
+from task_manager.benchmarks import format_timings, measure
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.forms import TaskBulkActionForm
+from task_manager.tasks.models import Task
+from task_manager.tasks.views import TasksIndexView
+
+User = get_user_model()
+
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the render time of tasks/index.html with and without '
+        'the cached template loader. Rows are rendered without '
+        'the row cache, so every row is rendered in every run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='Number of tasks on the page.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed renders.',
+        )
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get('/tasks/')
+        request.user = User(pk=1, username='benchmark')
+        context = self.get_context(request, options['rows'])
+
+        cached = engines['django'].engine
+        uncached = Engine(
+            dirs=cached.dirs,
+            context_processors=cached.context_processors,
+            loaders=TEMPLATE_LOADERS,
+            libraries=cached.libraries,
+            builtins=cached.builtins,
+        )
+        # Loaded once, like the cached loader after the warm-up
+        cached.get_template(TasksIndexView.template_name)
+
+        for title, engine in (
+            ('uncached loader', uncached),
+            ('cached loader', cached),
+        ):
+            load = measure(
+                lambda: engine.get_template(TasksIndexView.template_name),
+                options['repeat'],
+            )
+            render = measure(
+                lambda: engine.get_template(
+                    TasksIndexView.template_name
+                ).render(RequestContext(request, context)),
+                options['repeat'],
+            )
+            self.stdout.write(f'{title}, load: {format_timings(load)}')
+            self.stdout.write(f'{title}, render: {format_timings(render)}')
+
+    def get_context(self, request, rows):
+        now = timezone.now()
+        status = Status(pk=1, name='Status')
+        user = User(pk=1, username='user', first_name='John', last_name='Doe')
+        tasks = [
+            Task(
+                pk=n, name=f'Task {n}', status=status, author=user,
+                executor=user, created_at=now, updated_at=now,
+            )
+            for n in range(1, rows + 1)
+        ]
+        return {
+            **TasksIndexView.extra_context,
+            'tasks': tasks,
+            'filter': TaskFilter(request=request),
+            'bulk_form': TaskBulkActionForm(),
+            'export_query': '',
+            'row_versions': '',
+            # Do not store the rows, so every run renders them
+            'row_cache_timeout': 0,
+        }
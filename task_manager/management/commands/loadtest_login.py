@@ -0,0 +1,167 @@
+import re
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode, urljoin
+from urllib.request import (
+    HTTPCookieProcessor,
+    HTTPRedirectHandler,
+    Request,
+    build_opener,
+)
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from task_manager.seeding import SEED_PASSWORD
+
+CSRF_INPUT = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+class NoRedirect(HTTPRedirectHandler):
+    """
+    Times the login request alone, without the page it redirects to.
+    """
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+def get_results(futures):
+    """
+    Returns the results of the clients. Raises the error which stopped
+    a client rather than the broken barrier of the clients waiting for it.
+    """
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error and not isinstance(error, threading.BrokenBarrierError):
+            raise error
+    if any(errors):
+        raise CommandError('Clients timed out waiting for each other.')
+    return [future.result() for future in futures]
+
+
+def get_percentiles(latencies):
+    """
+    Returns the 50th, 90th and 99th percentiles of the latencies.
+    """
+    if len(latencies) < 2:
+        return dict.fromkeys(('p50', 'p90', 'p99'), max(latencies))
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+    return {'p50': cuts[49], 'p90': cuts[89], 'p99': cuts[98]}
+
+
+class Command(BaseCommand):
+    help = (
+        'Logs in the user from many clients at once against a running '
+        'server and reports the latency of the login requests. Run it '
+        'against `make start` (WSGI) and `make start-asgi` to compare them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'server',
+            help='Base URL of the server, e.g. http://localhost:8000.',
+        )
+        parser.add_argument(
+            'username',
+            help='User to log in, e.g. one created by seed_data.',
+        )
+        parser.add_argument('--password', default=SEED_PASSWORD)
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=200,
+            help='Number of clients logging in at the same time.',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=60,
+            help='Seconds to wait for a response.',
+        )
+
+    def handle(self, *args, **options):
+        url = urljoin(options['server'], reverse('login'))
+        concurrency = options['concurrency']
+        self.timeout = options['timeout']
+        self.barrier = threading.Barrier(concurrency, timeout=self.timeout)
+        data = {
+            'username': options['username'],
+            'password': options['password'],
+        }
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(self.login, url, data)
+                for _ in range(concurrency)
+            ]
+        results = get_results(futures)
+        seconds = time.perf_counter() - start
+
+        latencies = [latency for latency in results if latency is not None]
+        if not latencies:
+            raise CommandError('All logins failed.')
+        self.report(latencies, len(results) - len(latencies), seconds)
+
+    def login(self, url, data):
+        """
+        Opens the login page, waits for the other clients and logs in.
+        Returns the latency of the login, or None if it failed.
+        """
+        opener = build_opener(HTTPCookieProcessor(CookieJar()), NoRedirect)
+        token = self.get_ready(opener, url)
+        request = Request(
+            url, urlencode({**data, 'csrfmiddlewaretoken': token}).encode()
+        )
+
+        start = time.perf_counter()
+        try:
+            opener.open(request, timeout=self.timeout).close()
+        except HTTPError as error:
+            # A successful login redirects
+            if error.code == 302:
+                return time.perf_counter() - start
+        except (URLError, TimeoutError):
+            pass
+        return None
+
+    def get_ready(self, opener, url):
+        """
+        Returns the CSRF token once every client has one.
+        On any error the other clients stop waiting.
+        """
+        try:
+            token = self.get_csrf_token(opener, url)
+            self.barrier.wait()
+        except Exception:
+            self.barrier.abort()
+            raise
+        return token
+
+    def get_csrf_token(self, opener, url):
+        try:
+            with opener.open(url, timeout=self.timeout) as response:
+                page = response.read().decode()
+        except (URLError, TimeoutError) as error:
+            raise CommandError(f'Cannot open the login page {url}: {error}')
+        match = CSRF_INPUT.search(page)
+        if match is None:
+            raise CommandError(f'The login page {url} has no CSRF token.')
+        return match.group(1)
+
+    def report(self, latencies, errors, seconds):
+        percentiles = get_percentiles(latencies)
+        self.stdout.write(
+            f'{len(latencies)} logins, {errors} errors in {seconds:.1f} s'
+        )
+        self.stdout.write(
+            ', '.join(
+                f'{name} {latency * 1000:.0f} ms'
+                for name, latency in percentiles.items()
+            )
+            + f', max {max(latencies) * 1000:.0f} ms'
+        )
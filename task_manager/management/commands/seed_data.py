@@ -0,0 +1,71 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.factories import SEED
+from task_manager.seeding import SEED_BATCH_SIZE, Seeder
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates users, statuses, labels and tasks for load tests '
+        'and benchmarks. The same seed generates the same data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--statuses', type=int, default=10)
+        parser.add_argument('--labels', type=int, default=50)
+        parser.add_argument('--tasks', type=int, default=10000)
+        parser.add_argument(
+            '--max-labels',
+            type=int,
+            default=4,
+            help='Maximum number of labels of a task.',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=SEED,
+            help='Seed of the random data, also used in the names.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SEED_BATCH_SIZE,
+            help='Number of tasks inserted in a transaction.',
+        )
+
+    def handle(self, *args, **options):
+        if options['tasks'] and not (options['users'] and options['statuses']):
+            raise CommandError('Tasks need at least one user and status.')
+        seeder = Seeder(
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            max_labels=options['max_labels'],
+        )
+        if seeder.exists():
+            raise CommandError(
+                f'Data of seed {options["seed"]} already exists, '
+                f'use another --seed.'
+            )
+
+        start = time.perf_counter()
+        created = seeder.seed(
+            options['users'],
+            options['statuses'],
+            options['labels'],
+            options['tasks'],
+            progress=lambda count: self.stdout.write(
+                f'{count} tasks', ending='\r'
+            ),
+        )
+        seconds = time.perf_counter() - start
+
+        summary = ', '.join(
+            f'{count} {name}' for name, count in created.items()
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {summary} in {seconds:.1f} s '
+            f'({created["tasks"] / seconds:.0f} tasks/s).'
+        ))
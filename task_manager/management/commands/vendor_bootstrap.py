@@ -0,0 +1,27 @@
+from urllib.error import URLError
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.assets import BOOTSTRAP_VERSION, download_bootstrap
+
+
+class Command(BaseCommand):
+    help = (
+        'Downloads the Bootstrap files which are missing from '
+        'task_manager/static or do not match their integrity hashes. '
+        'The downloaded files should be committed.'
+    )
+
+    def handle(self, *args, **options):
+        try:
+            paths = download_bootstrap()
+        except (URLError, ValueError) as error:
+            raise CommandError(error)
+        if not paths:
+            self.stdout.write(f'Bootstrap {BOOTSTRAP_VERSION} is vendored.')
+            return
+        for path in paths:
+            self.stdout.write(str(path))
+        self.stdout.write(self.style.SUCCESS(
+            f'Vendored Bootstrap {BOOTSTRAP_VERSION}.'
+        ))
@@ -0,0 +1,32 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.warmup import compile_templates
+
+
+class Command(BaseCommand):
+    help = (
+        'Compiles all templates and fails if templates of the project '
+        'have errors. Workers compile the templates when they start, '
+        'see TEMPLATE_WARMUP.'
+    )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        compiled, errors = compile_templates()
+        elapsed = (time.perf_counter() - start) * 1000
+
+        project_dir = settings.BASE_DIR / 'task_manager'
+        failed = [path for path in errors if path.is_relative_to(project_dir)]
+        for path, error in errors.items():
+            style = self.style.ERROR if path in failed else self.style.WARNING
+            self.stderr.write(style(f'{path}: {error}'))
+        if failed:
+            raise CommandError(
+                f'{len(failed)} templates of the project have errors.'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Compiled {compiled} templates in {elapsed:.2f} ms.'
+        ))
@@ -0,0 +1,246 @@
+"""
+Per-view request metrics.
+
+MetricsMiddleware measures every request: the number of SQL queries,
+the time spent in the database, the time spent rendering templates and
+the total time. The measurements are
+    - sent back in the Server-Timing header (SERVER_TIMING setting)
+    - summed up per URL name and exposed in the Prometheus text format
+      by MetricsView
+    - logged as a warning when the request takes longer than
+      SLOW_REQUEST_SECONDS or runs more than SLOW_REQUEST_QUERIES queries
+
+Sums are kept in memory, so every worker process reports its own.
+Template time includes the queries of lazy querysets evaluated
+while rendering. Queries are counted by a wrapper installed on every
+database connection, for the request in the context of the code
+running them, so in ASGI mode the queries run by sync code in threads
+count for the request too.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from task_manager import cache_backends
+from task_manager.db_pool import get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'task_manager'
+UNRESOLVED = '<unresolved>'
+
+
+@dataclass
+class RequestMetrics:
+    requests: int = 0
+    queries: int = 0
+    db_seconds: float = 0
+    template_seconds: float = 0
+    seconds: float = 0
+    slow_requests: int = 0
+
+    def add(self, other):
+        for field in fields(self):
+            setattr(
+                self,
+                field.name,
+                getattr(self, field.name) + getattr(other, field.name),
+            )
+
+
+# Prometheus name, type and help of every field of RequestMetrics
+METRICS = {
+    'requests': (
+        'requests_total', 'counter', 'Requests served.'
+    ),
+    'queries': (
+        'db_queries_total', 'counter', 'SQL queries run by requests.'
+    ),
+    'db_seconds': (
+        'db_duration_seconds_total', 'counter',
+        'Time spent running SQL queries.',
+    ),
+    'template_seconds': (
+        'template_duration_seconds_total', 'counter',
+        'Time spent rendering templates.',
+    ),
+    'seconds': (
+        'request_duration_seconds_total', 'counter',
+        'Time spent serving requests.',
+    ),
+    'slow_requests': (
+        'slow_requests_total', 'counter',
+        'Requests over the time or query thresholds.',
+    ),
+}
+
+_lock = threading.Lock()
+_totals = defaultdict(RequestMetrics)
+
+
+def record(view, metrics):
+    with _lock:
+        _totals[view].add(metrics)
+
+
+def get_totals():
+    with _lock:
+        return {
+            view: RequestMetrics(**vars(metrics))
+            for view, metrics in _totals.items()
+        }
+
+
+def reset():
+    with _lock:
+        _totals.clear()
+
+
+def render_prometheus():
+    """
+    Returns the sums of all views, the cache hits and misses and
+    the connection pool statistics in the Prometheus text exposition format.
+    """
+    totals = sorted(get_totals().items())
+    lines = []
+    for field, (name, metric_type, help_text) in METRICS.items():
+        lines.append(f'# HELP {PREFIX}_{name} {help_text}')
+        lines.append(f'# TYPE {PREFIX}_{name} {metric_type}')
+        for view, metrics in totals:
+            value = getattr(metrics, field)
+            lines.append(f'{PREFIX}_{name}{{view="{view}"}} {value}')
+    lines.extend(render_cache_stats())
+    for alias, stats in get_pool_stats().items():
+        for name, value in sorted(stats.items()):
+            lines.append(
+                f'{PREFIX}_db_pool_{name}{{database="{alias}"}} {value}'
+            )
+    return '\n'.join(lines) + '\n'
+
+
+def render_cache_stats():
+    stats = sorted(cache_backends.get_stats().items())
+    return [
+        f'{PREFIX}_cache_{name}_total{{namespace="{prefix}"}} '
+        f'{getattr(prefix_stats, name)}'
+        for name in ('hits', 'misses')
+        for prefix, prefix_stats in stats
+    ]
+
+
+# Metrics of the current request, sync_to_async() copies them
+# to the threads running sync code
+_request_metrics = ContextVar('request_metrics', default=None)
+
+
+def time_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper counting the queries
+    of the current request and their time.
+    """
+    metrics = _request_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_seconds += time.perf_counter() - start
+
+
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    # Connections are reopened by the same wrapper object
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+class MetricsMiddleware:
+    """
+    Should be the first middleware, so the measurements cover
+    the other middleware and templates are rendered last.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, token = self.start(request)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_metrics.reset(token)
+        metrics.seconds = time.perf_counter() - start
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics, token = self.start(request)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_metrics.reset(token)
+        metrics.seconds = time.perf_counter() - start
+        return self.finish(request, response, metrics)
+
+    def start(self, request):
+        metrics = RequestMetrics(requests=1)
+        request.metrics = metrics
+        return metrics, _request_metrics.set(metrics)
+
+    def finish(self, request, response, metrics):
+        match = request.resolver_match
+        view = match.view_name if match else UNRESOLVED
+        self.check_thresholds(request, view, metrics)
+        record(view, metrics)
+        if settings.SERVER_TIMING:
+            response['Server-Timing'] = self.get_server_timing(metrics)
+        return response
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+        response.render()
+        request.metrics.template_seconds = time.perf_counter() - start
+        return response
+
+    def check_thresholds(self, request, view, metrics):
+        if (
+            metrics.seconds > settings.SLOW_REQUEST_SECONDS
+            or metrics.queries > settings.SLOW_REQUEST_QUERIES
+        ):
+            metrics.slow_requests = 1
+            logger.warning(
+                'Slow request %s %s (%s): %.0f ms, %d queries, '
+                '%.0f ms in the database, %.0f ms in templates',
+                request.method,
+                request.path,
+                view,
+                metrics.seconds * 1000,
+                metrics.queries,
+                metrics.db_seconds * 1000,
+                metrics.template_seconds * 1000,
+            )
+
+    def get_server_timing(self, metrics):
+        return ', '.join([
+            f'db;dur={metrics.db_seconds * 1000:.1f};'
+            f'desc="{metrics.queries} queries"',
+            f'tpl;dur={metrics.template_seconds * 1000:.1f}',
+            f'total;dur={metrics.seconds * 1000:.1f}',
+        ])
@@ -1,7 +1,15 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.db.models import Count, Max
+from django.middleware.csrf import get_token
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
 
 from task_manager import texts
 
@@ -15,28 +23,66 @@ class OwnershipRequiredMixin(PermissionRequiredMixin):
     Valid ownership_field values:
         - 'user' for users
         - 'author' for tasks
+
+    Valid ownership_scope values:
+        - 'object' for views of a single object: the owner of the object
+          is checked before the view is processed
+        - 'queryset' for list and bulk views: get_queryset returns
+          only the objects owned by the user, so ownership is checked
+          in the same query that selects them
     """
     ownership_field = None
+    ownership_scope = 'object'
     permission_denied_redirect_url = None
     permission_denied_message = None
 
-    _owner_mapping = {
-        'user': lambda x: x.id,
-        'author': lambda x: x.author.id,
+    # Fields holding the id of the owner for every ownership_field
+    _owner_id_fields = {
+        'user': 'pk',
+        'author': 'author_id',
     }
 
+    def get_object(self, queryset=None):
+        """
+        Overriding get_object method from SingleObjectMixin.
+        Memoizes the object, so the permission check and the view
+        share a single query.
+        """
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_object'):
+            self._object = super().get_object()
+        return self._object
+
     def get_owner(self):
         """
-        Returns the owner of the model object based on the ownership_field.
+        Returns the owner id of the model object based on the ownership_field.
         """
         obj = self.get_object()
-        return self._owner_mapping[self.ownership_field](obj)
+        return getattr(obj, self._owner_id_fields[self.ownership_field])
+
+    def filter_owned(self, queryset):
+        """
+        Restricts the queryset to the objects owned by the current user.
+        """
+        lookup = self._owner_id_fields[self.ownership_field]
+        return queryset.filter(**{lookup: self.request.user.id})
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.ownership_scope == 'queryset':
+            queryset = self.filter_owned(queryset)
+        return queryset
 
     def has_permission(self):
         """
         Overriding has_permission method from PermissionRequiredMixin.
         Checks if the user has permission to manage the object.
+        For the queryset scope any authenticated user has permission,
+        because get_queryset contains only their own objects.
         """
+        if self.ownership_scope == 'queryset':
+            return self.request.user.is_authenticated
         return self.get_owner() == self.request.user.id
 
     def handle_no_permission(self):
@@ -51,3 +97,95 @@ class OwnershipRequiredMixin(PermissionRequiredMixin):
 
         messages.error(self.request, self.permission_denied_message)
         return redirect(reverse_lazy(self.permission_denied_redirect_url))
+
+
+class ConditionalGetMixin:
+    """
+    Answers GET requests with 304 Not Modified, without rendering
+    the page, when the client already has its current version.
+
+    The ETag is computed from a single aggregate query over
+    get_conditional_queryset(): the latest updated_at and the number
+    of rows (which changes on deletes), plus the query string
+    (filters and page), the user, the language, the CSRF cookie
+    (forms on the page embed it) and get_etag_parts().
+    There is no Last-Modified: the latest updated_at of the rows does not
+    change when related objects shown on the page are renamed or deleted.
+    """
+    def get_conditional_queryset(self):
+        return self.get_queryset()
+
+    def get_etag_parts(self):
+        """
+        Returns other values the page depends on, e.g. versions
+        of related objects shown on it.
+        """
+        return []
+
+    def get_csrf_secret(self):
+        """
+        Returns the secret of the CSRF cookie, creating it
+        if the request has none, as rendering the page would.
+        """
+        get_token(self.request)
+        return self.request.META.get('CSRF_COOKIE')
+
+    def get_etag(self):
+        aggregate = self.get_conditional_queryset().order_by().aggregate(
+            last_modified=Max('updated_at'),
+            count=Count('pk'),
+        )
+        parts = [
+            type(self).__name__,
+            self.request.get_full_path(),
+            self.request.user.pk,
+            get_language(),
+            self.get_csrf_secret(),
+            aggregate['last_modified'],
+            aggregate['count'],
+            *self.get_etag_parts(),
+        ]
+        digest = hashlib.md5(
+            repr(parts).encode(), usedforsecurity=False
+        ).hexdigest()
+        return f'W/{quote_etag(digest)}'
+
+    def get(self, request, *args, **kwargs):
+        # Messages are shown once, so a page with them is always rendered
+        if len(messages.get_messages(request)):
+            return super().get(request, *args, **kwargs)
+
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response.headers['ETag'] = etag
+        # Browsers may keep the page, but must revalidate it every time
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class AsyncFormMixin:
+    """
+    Makes a form view async, for ASGI deployments. Forms are validated
+    and handled in the thread of the request, except for the step that
+    hashes a password, which the view runs in the hashing executor
+    (see task_manager.hashing) by overriding validate() or save().
+    """
+    async def get(self, request, *args, **kwargs):
+        return await sync_to_async(super().get)(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        form = self.get_form()
+        if await self.validate(form):
+            return await self.save(form)
+        return await sync_to_async(self.form_invalid)(form)
+
+    async def put(self, *args, **kwargs):
+        return await self.post(*args, **kwargs)
+
+    async def validate(self, form):
+        return await sync_to_async(form.is_valid)()
+
+    async def save(self, form):
+        return await sync_to_async(self.form_valid)(form)
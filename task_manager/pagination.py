@@ -0,0 +1,179 @@
+"""
+Keyset (cursor) pagination for list views.
+"""
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+CURSOR_PARAMS = ('after', 'before')
+
+
+def encode_cursor(values):
+    """
+    Encodes the cursor field values of a row into an opaque URL-safe token.
+    Values are stored as strings, model fields convert them back on lookup.
+    """
+    raw = json.dumps([str(value) for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(token):
+    """
+    Decodes a token made by encode_cursor.
+    Returns None if the token is missing or malformed.
+    """
+    if not token:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    if not isinstance(values, list):
+        return None
+    return values
+
+
+def keyset_filter(fields, values, backwards=False):
+    """
+    Builds a condition selecting rows that come after the given values
+    in the ordering defined by fields (or before them if backwards is True).
+    Fields prefixed with '-' are ordered descending.
+
+    For fields (a, b) and values (x, y) this is
+    a > x OR (a = x AND b > y).
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(fields, values):
+        name = field.lstrip('-')
+        descending = field.startswith('-')
+        lookup = 'lt' if descending != backwards else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def reverse_ordering(fields):
+    return [
+        field[1:] if field.startswith('-') else f'-{field}'
+        for field in fields
+    ]
+
+
+class KeysetPage:
+    """
+    A page of results with links to the neighbouring pages.
+    Mimics the part of django.core.paginator.Page used in templates.
+    """
+    def __init__(self, object_list, query_params, next_cursor, prev_cursor):
+        self.object_list = object_list
+        self._query_params = query_params
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.prev_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def _url(self, param, cursor):
+        params = self._query_params.copy()
+        for name in CURSOR_PARAMS:
+            params.pop(name, None)
+        params[param] = cursor
+        return f'?{params.urlencode()}'
+
+    @property
+    def next_url(self):
+        return self._url('after', self.next_cursor)
+
+    @property
+    def previous_url(self):
+        return self._url('before', self.prev_cursor)
+
+
+class KeysetPaginationMixin:
+    """
+    Replaces OFFSET pagination of MultipleObjectMixin with keyset pagination.
+    Rows are ordered by cursor_fields and each page starts right after
+    (or ends right before) the row encoded in the 'after' ('before')
+    query parameter, so fetching any page costs the same as the first one.
+    Other query parameters (e.g. filters) are preserved in page links.
+
+    cursor_fields must identify a row uniquely, so the last one
+    should be the primary key.
+    """
+    cursor_fields = ('created_at', 'id')
+
+    def get_cursor_fields(self, queryset):
+        return self.cursor_fields
+
+    def paginate_queryset(self, queryset, page_size):
+        fields = self.get_cursor_fields(queryset)
+        after = decode_cursor(self.request.GET.get('after'))
+        before = decode_cursor(self.request.GET.get('before'))
+
+        try:
+            if before is not None:
+                rows, next_row, prev_row = self._fetch_before(
+                    queryset, fields, before, page_size
+                )
+            else:
+                rows, next_row, prev_row = self._fetch_after(
+                    queryset, fields, after, page_size
+                )
+        except (ValidationError, ValueError, TypeError):
+            # Cursor values of a wrong type, start from the first page
+            rows, next_row, prev_row = self._fetch_after(
+                queryset, fields, None, page_size
+            )
+
+        page = KeysetPage(
+            rows,
+            self.request.GET,
+            next_cursor=self._row_cursor(next_row, fields),
+            prev_cursor=self._row_cursor(prev_row, fields),
+        )
+        return None, page, rows, page.has_other_pages()
+
+    def _fetch_after(self, queryset, fields, values, page_size):
+        if values is not None:
+            queryset = queryset.filter(keyset_filter(fields, values))
+        rows = list(queryset.order_by(*fields)[:page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        next_row = rows[-1] if has_next else None
+        prev_row = rows[0] if values is not None and rows else None
+        return rows, next_row, prev_row
+
+    def _fetch_before(self, queryset, fields, values, page_size):
+        queryset = queryset.filter(
+            keyset_filter(fields, values, backwards=True)
+        )
+        ordering = reverse_ordering(fields)
+        rows = list(queryset.order_by(*ordering)[:page_size + 1])
+        has_prev = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        prev_row = rows[0] if has_prev else None
+        next_row = rows[-1] if rows else None
+        return rows, next_row, prev_row
+
+    def _row_cursor(self, row, fields):
+        if row is None:
+            return None
+        return encode_cursor(
+            getattr(row, field.lstrip('-')) for field in fields
+        )
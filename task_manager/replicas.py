@@ -0,0 +1,117 @@
+"""
+Read replica routing.
+
+When the 'replica' database is configured (DATABASE_REPLICA_URL),
+views with ReplicaReadMixin read from it on GET and HEAD requests.
+Everything else, including writes and the reads of other views,
+uses the primary database.
+
+Replicas lag behind the primary, so after a request that wrote
+to the database ReplicaMiddleware sets a cookie pinning the reads
+of the user to the primary for REPLICA_PIN_SECONDS. This way
+redirects and success messages after a write show fresh data.
+"""
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+PIN_COOKIE = 'primary_pin'
+
+
+@dataclass
+class RequestState:
+    pinned: bool = False
+    use_replica: bool = False
+    wrote: bool = False
+
+
+_state = ContextVar('replica_state', default=None)
+
+
+def has_replica():
+    return REPLICA_DB_ALIAS in connections.settings
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is not None
+            and state.use_replica
+            and not state.pinned
+            and has_replica()
+        ):
+            return REPLICA_DB_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both databases have the same data
+        return True
+
+
+class ReplicaMiddleware:
+    """
+    The state of the request is a context variable, which sync_to_async()
+    copies to the threads running sync code in ASGI mode.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = RequestState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.pin(state, response)
+
+    async def __acall__(self, request):
+        state = RequestState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.pin(state, response)
+
+    def pin(self, state, response):
+        if state.wrote:
+            response.set_cookie(
+                PIN_COOKIE,
+                '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+class ReplicaReadMixin:
+    """
+    Reads from the replica on GET and HEAD requests.
+    Should follow LoginRequiredMixin, so the user is loaded
+    from the primary.
+    """
+    def dispatch(self, request, *args, **kwargs):
+        state = _state.get()
+        if state is not None and request.method in ('GET', 'HEAD'):
+            state.use_replica = True
+        return super().dispatch(request, *args, **kwargs)
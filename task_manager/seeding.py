@@ -0,0 +1,175 @@
+"""
+Generation of large datasets for load tests and benchmarks.
+
+Unlike the factories, which save objects one by one and hash
+the password of every user, Seeder inserts objects with bulk_create
+in batches and hashes the password once. All values are drawn from
+a random generator seeded with the given seed, so the same options
+produce the same data, and names start with the seed, so datasets
+of different seeds can be added to the same database.
+
+Statuses, labels and users are picked with Zipf-like weights (a few of
+them are used by most tasks) and the number of labels of a task falls
+off the same way from none to max_labels.
+"""
+import random
+from itertools import accumulate, batched
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from task_manager.factories import SEED
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import choices
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.tasks.signals import tasks_bulk_created
+
+User = get_user_model()
+
+SEED_BATCH_SIZE = 5000
+# Same as the password of users created by the factories
+SEED_PASSWORD = 'testpass!123'
+
+FIRST_NAMES = (
+    'Anna', 'Boris', 'Daria', 'Egor', 'Irina',
+    'Maria', 'Nikita', 'Olga', 'Pavel', 'Sofia',
+)
+LAST_NAMES = (
+    'Ivanov', 'Kuznetsov', 'Morozov', 'Novikov', 'Orlov',
+    'Petrov', 'Popov', 'Smirnov', 'Sokolov', 'Volkov',
+)
+WORDS = (
+    'check', 'deploy', 'fix', 'report', 'review', 'update', 'write',
+    'api', 'backup', 'build', 'database', 'docs', 'login', 'page',
+    'release', 'server', 'tests', 'users',
+)
+
+
+def zipf_weights(count):
+    """
+    Cumulative weights making the n-th item 1/n as likely as the first.
+    """
+    return list(accumulate(1 / rank for rank in range(1, count + 1)))
+
+
+class Seeder:
+    def __init__(self, seed=SEED, batch_size=SEED_BATCH_SIZE,
+                 max_labels=4, unassigned=0.2, password=SEED_PASSWORD):
+        self.random = random.Random(seed)
+        self.prefix = f'seed{seed}'
+        self.batch_size = batch_size
+        self.label_counts = self.with_weights(range(max_labels + 1))
+        self.unassigned = unassigned
+        self.password = password
+
+    def exists(self):
+        return User.objects.filter(
+            username__startswith=f'{self.prefix}_'
+        ).exists()
+
+    def seed(self, users, statuses, labels, tasks, progress=None):
+        """
+        Creates the objects and returns the numbers of created users,
+        statuses, labels and tasks. progress is called with the number
+        of created tasks after every batch.
+        """
+        self.users = self.with_weights(self.create_users(users))
+        self.statuses = self.with_weights(
+            self.create_named(Status, 'status', statuses)
+        )
+        self.labels = self.with_weights(
+            self.create_named(Label, 'label', labels)
+        )
+        created = 0
+        for numbers in batched(range(tasks), self.batch_size):
+            created += self.create_tasks(numbers)
+            if progress is not None:
+                progress(created)
+        return {
+            'users': len(self.users[0]),
+            'statuses': len(self.statuses[0]),
+            'labels': len(self.labels[0]),
+            'tasks': created,
+        }
+
+    @staticmethod
+    def with_weights(ids):
+        return ids, zipf_weights(len(ids))
+
+    def create_users(self, count):
+        password = make_password(self.password)
+        User.objects.bulk_create(
+            (
+                User(
+                    username=f'{self.prefix}_user{n}',
+                    first_name=self.random.choice(FIRST_NAMES),
+                    last_name=self.random.choice(LAST_NAMES),
+                    password=password,
+                )
+                for n in range(count)
+            ),
+            batch_size=self.batch_size,
+        )
+        # bulk_create sends no signals
+        choices.invalidate(User)
+        return list(
+            User.objects.filter(username__startswith=f'{self.prefix}_')
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+    def create_named(self, model, kind, count):
+        """
+        Creates statuses or labels and returns their primary keys.
+        """
+        prefix = f'{self.prefix} {kind}'
+        model.objects.bulk_create(
+            (model(name=f'{prefix} {n}') for n in range(count)),
+            batch_size=self.batch_size,
+        )
+        choices.invalidate(model)
+        return list(
+            model.objects.filter(name__startswith=f'{prefix} ')
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+    def pick(self, ids_with_weights):
+        ids, weights = ids_with_weights
+        return self.random.choices(ids, cum_weights=weights)[0]
+
+    def build_task(self, number):
+        executor_id = None
+        if self.random.random() >= self.unassigned:
+            executor_id = self.pick(self.users)
+        return Task(
+            name=f'{self.prefix} task {number}',
+            description=' '.join(self.random.choices(WORDS, k=8)),
+            status_id=self.pick(self.statuses),
+            author_id=self.pick(self.users),
+            executor_id=executor_id,
+        )
+
+    def pick_labels(self):
+        if not self.labels[0]:
+            return set()
+        count = self.pick(self.label_counts)
+        return {self.pick(self.labels) for _ in range(count)}
+
+    @transaction.atomic
+    def create_tasks(self, numbers):
+        tasks = [self.build_task(number) for number in numbers]
+        task_label_ids = [self.pick_labels() for _ in tasks]
+        tasks = Task.objects.bulk_create(tasks)
+        task_labels = TaskLabel.objects.bulk_create([
+            TaskLabel(task_id=task.pk, label_id=label_id)
+            for task, label_ids in zip(tasks, task_label_ids)
+            for label_id in label_ids
+        ])
+        # Counters and dashboard rollups
+        tasks_bulk_created.send(
+            sender=Task, tasks=tasks, task_labels=task_labels
+        )
+        return len(tasks)
@@ -11,11 +11,16 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+import tempfile
 from pathlib import Path
 
 import dj_database_url
 from dotenv import load_dotenv
 
+from task_manager.assets import get_bootstrap_settings
+from task_manager.caching import CACHE_NAMESPACES, get_cache_settings
+from task_manager.db_pool import get_pool_options
+
 load_dotenv()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -48,6 +53,8 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    # Operator classes of the prefix search indexes, see task_manager.indexes
+    'django.contrib.postgres',
     'django_extensions',
     'whitenoise.runserver_nostatic',
     'django.contrib.staticfiles',
@@ -58,15 +65,18 @@ INSTALLED_APPS = [
     'task_manager.statuses',
     'task_manager.labels',
     'task_manager.tasks',
+    'task_manager.dashboard',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    'task_manager.metrics.MetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'task_manager.replicas.ReplicaMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -77,8 +87,18 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Templates are parsed once per process and kept in memory.
+            # runserver resets the cache when a template changes.
+            'loaders': [
+                (
+                    'django.template.loaders.cached.Loader',
+                    [
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ],
+                ),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -89,6 +109,16 @@ TEMPLATES = [
     },
 ]
 
+# Compile all templates when a worker starts, see task_manager.warmup
+TEMPLATE_WARMUP = os.getenv('TEMPLATE_WARMUP', str(not DEBUG)) == 'True'
+
+# Request metrics, see task_manager.metrics
+SERVER_TIMING = os.getenv('SERVER_TIMING', 'True') == 'True'
+SLOW_REQUEST_SECONDS = float(os.getenv('SLOW_REQUEST_SECONDS', 1))
+SLOW_REQUEST_QUERIES = int(os.getenv('SLOW_REQUEST_QUERIES', 50))
+# Bearer token of the metrics scraper, staff can read metrics without it
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
 WSGI_APPLICATION = 'task_manager.wsgi.application'
 
 
@@ -104,12 +134,105 @@ DATABASES = {
 
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# SQLite performance profile, see task_manager.sqlite
+SQLITE_TUNING = os.getenv('SQLITE_TUNING', 'False') == 'True'
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    # Milliseconds a writer waits for the lock
+    'busy_timeout': 5000,
+    'mmap_size': 128 * 1024 * 1024,
+    # Negative values are in KiB
+    'cache_size': -32 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+# Pool PostgreSQL connections in every process, see task_manager.db_pool
+DATABASE_POOL = os.getenv('DATABASE_POOL', 'False') == 'True'
+
 if DATABASE_URL:
     DATABASES['default'] = dj_database_url.config(
         default=DATABASE_URL,
+        # Pooled connections go back to the pool after every request
+        conn_max_age=0 if DATABASE_POOL else 600,
+        conn_health_checks=not DATABASE_POOL,
+    )
+
+if DATABASE_POOL and DATABASES['default']['ENGINE'].endswith('postgresql'):
+    DATABASES['default'].setdefault('OPTIONS', {})['pool'] = (
+        get_pool_options()
+    )
+
+if SQLITE_TUNING and DATABASES['default']['ENGINE'].endswith('sqlite3'):
+    DATABASES['default'].setdefault('OPTIONS', {}).update({
+        'transaction_mode': 'IMMEDIATE',
+        # Seconds Python's sqlite3 waits for the lock
+        'timeout': SQLITE_PRAGMAS['busy_timeout'] / 1000,
+    })
+
+# Read replica for list and detail views, see task_manager.replicas
+DATABASE_REPLICA_URL = os.getenv('DATABASE_REPLICA_URL')
+
+if DATABASE_REPLICA_URL:
+    DATABASES['replica'] = dj_database_url.config(
+        default=DATABASE_REPLICA_URL,
         conn_max_age=600,
         conn_health_checks=True,
     )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['task_manager.replicas.ReplicaRouter']
+
+# Seconds the reads of a user go to the primary after a write
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', 10))
+
+
+# Caches
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# Shared by the worker processes of the host by default, so the version
+# tokens a worker replaces on changes are seen by the others
+CACHE_DIR = Path(tempfile.gettempdir()) / 'task_manager'
+CACHE_URL = os.getenv('CACHE_URL', f'file://{CACHE_DIR}')
+CACHE_VERSION = int(os.getenv('CACHE_VERSION', 1))
+
+CACHES = {
+    alias: get_cache_settings(CACHE_URL, alias, CACHE_VERSION)
+    for alias in ('default', *CACHE_NAMESPACES)
+}
+# Shared by the worker processes of the host by default,
+# so sessions in the cache survive switching workers.
+# Not versioned, so deploys do not log users out.
+CACHES['sessions'] = get_cache_settings(
+    os.getenv('SESSION_CACHE_URL', f'file://{CACHE_DIR}'),
+    'sessions',
+)
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.1/topics/http/sessions/
+
+SESSION_ENGINES = {
+    # A SELECT on every authenticated request
+    'db': 'django.contrib.sessions.backends.db',
+    # No queries, sessions are lost when the cache is cleared
+    'cache': 'django.contrib.sessions.backends.cache',
+    # Reads from the cache, writes to the cache and the database
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    # No storage, sessions cannot be revoked before they expire
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+
+SESSION_ENGINE = SESSION_ENGINES[os.getenv('SESSION_BACKEND', 'db')]
+SESSION_CACHE_ALIAS = 'sessions'
+
+
+# Async versions of the login and registration views, enabled by asgi.py
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', 'False') == 'True'
+# Threads hashing the passwords of the async views in a worker process,
+# see task_manager/hashing.py
+PASSWORD_HASHING_THREADS = int(os.getenv('PASSWORD_HASHING_THREADS', 2))
 
 
 # Password validation
@@ -160,12 +283,22 @@ STATIC_URL = 'static/'
 
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# Static files are stored under hashed names with compressed copies.
+# WhiteNoise serves hashed files with Cache-Control: immutable
+# and a max-age of 10 years.
 STORAGES = {
     'staticfiles': {
         'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
     }
 }
 
+# Self-hosted Bootstrap, see task_manager.assets
+BOOTSTRAP5 = get_bootstrap_settings()
+
+# Select widgets switch to the autocomplete search
+# when there are more choices than this
+AUTOCOMPLETE_THRESHOLD = int(os.getenv('AUTOCOMPLETE_THRESHOLD', '100'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -0,0 +1,28 @@
+"""
+Settings for running tests, used by `manage.py test`.
+
+Users are created with a fast password hasher, as PBKDF2 with
+the production iterations would take most of the run time. Caches
+are kept in the memory of the test process, so parallel test
+processes never share cached values. Production hashing is measured
+by the benchmark_login command. Static files are not collected, so pages
+link to them by their plain names.
+"""
+from task_manager.settings import *  # noqa: F401, F403
+from task_manager.settings import CACHES, STORAGES
+from task_manager.caching import get_cache_settings
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+# Hash in the thread of the request, which sees the data of the test
+PASSWORD_HASHING_THREADS = 0
+
+CACHES = {alias: get_cache_settings('locmem://', alias) for alias in CACHES}
+# Tests of a process share its caches
+SILENCED_SYSTEM_CHECKS = ['task_manager.E002']
+
+STORAGES = {
+    **STORAGES,
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
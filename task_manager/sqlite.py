@@ -0,0 +1,34 @@
+"""
+Performance profile for deployments running on SQLite.
+
+With SQLITE_TUNING=True every new SQLite connection is configured
+with SQLITE_PRAGMAS:
+    - journal_mode=WAL lets readers work while a task is being written
+    - synchronous=NORMAL syncs the WAL at checkpoints only
+    - busy_timeout makes writers wait for the lock instead of failing
+      with "database is locked"
+    - mmap_size and cache_size keep more of the database in memory
+Settings also start transactions with BEGIN IMMEDIATE, so a transaction
+takes the write lock up front instead of failing when it upgrades
+from a read lock held by another writer.
+"""
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+def get_pragmas(connection):
+    with connection.cursor() as cursor:
+        return {
+            name: cursor.execute(f'PRAGMA {name}').fetchone()[0]
+            for name in settings.SQLITE_PRAGMAS
+        }
+
+
+@receiver(connection_created)
+def apply_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite' or not settings.SQLITE_TUNING:
+        return
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
@@ -0,0 +1,36 @@
+// Adds a search input to every <select data-autocomplete-url>.
+// Typed text is sent to the autocomplete endpoint and the options
+// of the select are replaced with the results, keeping the selected ones.
+document.addEventListener('DOMContentLoaded', () => {
+  const delay = 250;
+
+  document.querySelectorAll('select[data-autocomplete-url]').forEach((select) => {
+    const search = document.createElement('input');
+    search.type = 'search';
+    search.className = 'form-control mb-1';
+    search.placeholder = select.dataset.autocompletePlaceholder || '';
+    select.before(search);
+
+    let timer = null;
+    search.addEventListener('input', () => {
+      clearTimeout(timer);
+      timer = setTimeout(async () => {
+        const url = new URL(select.dataset.autocompleteUrl, window.location.origin);
+        url.searchParams.set('q', search.value);
+        const response = await fetch(url, { headers: { Accept: 'application/json' } });
+        if (!response.ok) {
+          return;
+        }
+        const { results } = await response.json();
+
+        Array.from(select.options)
+          .filter((option) => !option.selected && option.value !== '')
+          .forEach((option) => option.remove());
+        const present = new Set(Array.from(select.options).map((option) => option.value));
+        results
+          .filter((result) => !present.has(String(result.id)))
+          .forEach((result) => select.add(new Option(result.text, result.id)));
+      }, delay);
+    });
+  });
+});
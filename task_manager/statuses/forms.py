@@ -12,3 +12,16 @@ class StatusForm(ModelForm):
         fields = [
             'name',
         ]
+
+    def save(self, commit=True):
+        """
+        Updates only the fields of the form, so the task_count read
+        with the instance does not overwrite the counter.
+        """
+        status = super().save(commit=False)
+        if commit:
+            update_fields = None
+            if not status._state.adding:
+                update_fields = [*self._meta.fields, 'updated_at']
+            status.save(update_fields=update_fields)
+        return status
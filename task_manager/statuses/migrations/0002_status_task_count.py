@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('statuses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='status',
+            name='task_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Tasks'),
+        ),
+    ]
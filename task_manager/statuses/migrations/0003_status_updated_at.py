@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 18:04
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_updated_at(apps, schema_editor):
+    Status = apps.get_model('statuses', 'Status')
+    Status.objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('statuses', '0002_status_task_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='status',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Updated at'),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+    ]
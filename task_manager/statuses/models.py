@@ -15,6 +15,18 @@ class Status(models.Model):
         verbose_name=status_model['created_at'],
         auto_now_add=True,
     )
+    updated_at = models.DateTimeField(
+        verbose_name=status_model['updated_at'],
+        auto_now=True,
+    )
+
+    # Number of tasks using the status.
+    # Maintained by task_manager.tasks.counters
+    task_count = models.IntegerField(
+        verbose_name=status_model['task_count'],
+        default=0,
+        editable=False,
+    )
 
     def __str__(self):
         return self.name
@@ -3,6 +3,7 @@ from django.urls import reverse_lazy
 
 from task_manager import texts
 from task_manager.factories import StatusFactory, TaskFactory, UserFactory
+from task_manager.statuses.forms import StatusForm
 from task_manager.statuses.models import Status
 
 
@@ -91,6 +92,28 @@ class TestStatusesIndex(SetUpMixin, TestCase):
             )
 
 
+class TestStatusesIndexConditionalGet(SetUpMixin, TestCase):
+    def get(self, etag=None):
+        headers = {'If-None-Match': etag} if etag else {}
+        return self.client.get(reverse_lazy('statuses_index'), headers=headers)
+
+    def test_unchanged_statuses_index(self):
+        etag = self.get()['ETag']
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_statuses_index_after_changes(self):
+        etag = self.get()['ETag']
+        TaskFactory(status=self.statuses[0])
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        self.statuses[1].delete()
+        self.assertEqual(self.get(etag).status_code, 200)
+
+
 class TestStatusCreate(SetUpMixin, TestCase):
     def test_status_create_form(self):
         response = self.client.get(reverse_lazy('status_create'))
@@ -161,6 +184,15 @@ class TestStatusUpdate(SetUpMixin, TestCase):
         errors = response.context['form'].errors
         self.assertIn('name', errors)
 
+    def test_status_update_keeps_task_count(self):
+        status = Status.objects.get(id=self.statuses[0].id)
+        TaskFactory(status=status)
+        form = StatusForm({'name': 'New status'}, instance=status)
+        form.save()
+        status.refresh_from_db()
+        self.assertEqual(status.name, 'New status')
+        self.assertEqual(status.task_count, 1)
+
 
 class TestStatusDelete(SetUpMixin, TestCase):
     def test_status_delete_form(self):
@@ -193,3 +225,14 @@ class TestStatusDelete(SetUpMixin, TestCase):
         self.assertRedirects(response, reverse_lazy('statuses_index'))
         self.assertContains(response, texts.delete_status['delete_error'])
         self.assertEqual(Status.objects.count(), 3)
+
+    def test_status_delete_with_stale_counter_failure(self):
+        TaskFactory(status=self.statuses[0])
+        Status.objects.filter(id=self.statuses[0].id).update(task_count=0)
+        response = self.client.post(
+            reverse_lazy('status_delete', args=[self.statuses[0].id]),
+            follow=True,
+        )
+        self.assertRedirects(response, reverse_lazy('statuses_index'))
+        self.assertContains(response, texts.delete_status['delete_error'])
+        self.assertEqual(Status.objects.count(), 3)
@@ -1,16 +1,25 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
+from django.db.models import ProtectedError
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager import texts
+from task_manager.mixins import ConditionalGetMixin
+from task_manager.replicas import ReplicaReadMixin
 from task_manager.statuses.forms import StatusForm
 from task_manager.statuses.models import Status
 
 
-class StatusesIndexView(LoginRequiredMixin, ListView):
+class StatusesIndexView(LoginRequiredMixin,
+                        ReplicaReadMixin,
+                        ConditionalGetMixin,
+                        ListView):
+    """
+    Unchanged pages are answered with 304 Not Modified.
+    """
     model = Status
     template_name = 'statuses/index.html'
     context_object_name = 'statuses'
@@ -75,11 +84,15 @@ class StatusDeleteView(SuccessMessageMixin, LoginRequiredMixin, DeleteView):
         If status is in use, show an error message and redirect
         to the statuses index page.
         """
-        in_use = self.get_object().tasks.exists()
-        if in_use:
-            messages.error(
-                request,
-                texts.delete_status['delete_error']
-            )
-            return redirect(self.success_url)
-        return super().post(request, *args, **kwargs)
+        in_use = self.get_object().task_count > 0
+        if not in_use:
+            try:
+                return super().post(request, *args, **kwargs)
+            except ProtectedError:
+                # The counter lags behind tasks added meanwhile
+                pass
+        messages.error(
+            request,
+            texts.delete_status['delete_error']
+        )
+        return redirect(self.success_url)
@@ -1,6 +1,102 @@
-from django.contrib import admin
+import codecs
+import os
 
+from django import forms
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
+
+from task_manager import texts
+from task_manager.tasks.importers import IMPORT_FORMATS, TaskImporter
 from task_manager.tasks.models import Task
 
+# Number of rows with errors listed after an upload
+MAX_REPORTED_ERRORS = 20
+
+
+class TaskImportForm(forms.Form):
+    file = forms.FileField(
+        label=texts.import_tasks['file'],
+        help_text=texts.import_tasks['file_help'],
+    )
+
+    def clean_file(self):
+        file = self.cleaned_data['file']
+        extension = os.path.splitext(file.name)[1].lstrip('.').lower()
+        if extension not in IMPORT_FORMATS:
+            raise forms.ValidationError(texts.import_tasks['unknown_format'])
+        self.cleaned_data['format'] = extension
+        return file
+
+
+class TaskAdmin(admin.ModelAdmin):
+    """
+    Adds a page importing tasks from an uploaded file
+    to the task list, see task_manager.tasks.importers.
+    """
+    def get_urls(self):
+        return [
+            path(
+                'import/',
+                self.admin_site.admin_view(self.import_view),
+                name='tasks_task_import',
+            ),
+        ] + super().get_urls()
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = {
+            'import_tasks': texts.import_tasks,
+            **(extra_context or {}),
+        }
+        return super().changelist_view(request, extra_context)
+
+    def import_view(self, request):
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+
+        form = TaskImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            self.import_file(request, form)
+            return redirect('admin:tasks_task_changelist')
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': texts.import_tasks['import_tasks'],
+            'import_tasks': texts.import_tasks,
+            'form': form,
+        }
+        return TemplateResponse(
+            request, 'admin/tasks/task/import.html', context
+        )
+
+    def import_file(self, request, form):
+        read = IMPORT_FORMATS[form.cleaned_data['format']]
+        rows = read(codecs.iterdecode(form.cleaned_data['file'], 'utf-8'))
+        try:
+            result = TaskImporter(request.user).import_rows(rows)
+        except UnicodeDecodeError:
+            self.message_user(
+                request, texts.import_tasks['invalid_encoding'],
+                messages.ERROR,
+            )
+            return
+
+        self.message_user(request, texts.import_tasks['import_success'] % {
+            'created': result.created,
+            'skipped': len(result.errors),
+        })
+        for number, errors in result.errors[:MAX_REPORTED_ERRORS]:
+            self.message_user(request, texts.import_tasks['row_error'] % {
+                'number': number,
+                'errors': '; '.join(
+                    f'{field}: {" ".join(field_errors)}'
+                    for field, field_errors in errors.items()
+                ),
+            }, messages.WARNING)
+
+
 # Register your models here.
-admin.site.register(Task)
+admin.site.register(Task, TaskAdmin)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.tasks'
+
+    def ready(self):
+        # Connect signal receivers
+        from task_manager.tasks import signals  # noqa: F401
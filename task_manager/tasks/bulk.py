@@ -0,0 +1,125 @@
+"""
+Bulk actions on a queryset of tasks.
+
+Every action changes all tasks with a single UPDATE (or one INSERT/DELETE
+of TaskLabel rows per label) instead of saving them one by one.
+These statements send no model signals, so the actions send
+tasks_bulk_updating and task_labels_bulk_changing before changing
+the rows, letting the task counters and dashboard rollups
+count the affected rows in the same transaction.
+"""
+from django.db import router, transaction
+from django.utils import timezone
+
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.tasks.signals import (
+    task_labels_bulk_changing,
+    tasks_bulk_updating,
+)
+
+BATCH_SIZE = 1000
+
+
+def _plain(queryset):
+    """
+    Selects the same tasks without the joins, annotations and ordering
+    of the queryset, so it can be updated and counted.
+    """
+    return Task.objects.filter(pk__in=queryset.values('pk'))
+
+
+def _update(tasks, **values):
+    tasks_bulk_updating.send(sender=Task, queryset=tasks, values=values)
+    # QuerySet.update() does not set auto_now fields
+    return tasks.update(updated_at=timezone.now(), **values)
+
+
+@transaction.atomic
+def set_status(queryset, status):
+    """
+    Returns the number of tasks which status was changed.
+    """
+    tasks = _plain(queryset).exclude(status_id=status.pk)
+    return _update(tasks, status_id=status.pk)
+
+
+@transaction.atomic
+def set_executor(queryset, executor):
+    """
+    Assigns the tasks to the executor, or unassigns them if it is None.
+    Returns the number of tasks which executor was changed.
+    """
+    tasks = _plain(queryset)
+    if executor is None:
+        return _update(tasks.filter(executor__isnull=False), executor_id=None)
+    tasks = tasks.exclude(executor_id=executor.pk)
+    return _update(tasks, executor_id=executor.pk)
+
+
+@transaction.atomic
+def add_labels(queryset, labels):
+    """
+    Returns the number of added task labels.
+    """
+    # Locked, so the tasks are not deleted or relabeled in bulk meanwhile
+    task_ids = list(
+        _plain(queryset).select_for_update().values_list('pk', flat=True)
+    )
+    added = 0
+    for label in labels:
+        missing = list(
+            Task.objects.filter(pk__in=task_ids)
+            .exclude(labels=label)
+            .values_list('pk', flat=True)
+        )
+        unlabeled = Task.objects.filter(pk__in=missing)
+        task_labels_bulk_changing.send(
+            sender=TaskLabel, tasks=unlabeled, label_id=label.pk, delta=1
+        )
+        unlabeled.update(updated_at=timezone.now())
+        # A link added meanwhile by task.labels.add(), which does not lock
+        # the task, is skipped instead of failing the action
+        TaskLabel.objects.bulk_create(
+            [TaskLabel(task_id=pk, label_id=label.pk) for pk in missing],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        added += len(missing)
+    return added
+
+
+def _delete_links(link_ids):
+    """
+    Deletes the links in batches without loading them. QuerySet.delete()
+    would send post_delete for every link, but the links are already
+    counted, so the fast delete of the ORM collector is used.
+    """
+    using = router.db_for_write(TaskLabel)
+    deleted = 0
+    for start in range(0, len(link_ids), BATCH_SIZE):
+        batch = link_ids[start:start + BATCH_SIZE]
+        deleted += TaskLabel.objects.filter(pk__in=batch)._raw_delete(using)
+    return deleted
+
+
+@transaction.atomic
+def remove_labels(queryset, labels):
+    """
+    Returns the number of removed task labels.
+    """
+    tasks = _plain(queryset)
+    removed = 0
+    for label in labels:
+        # Locked, so the links counted are the links deleted
+        links = list(
+            TaskLabel.objects.select_for_update()
+            .filter(task__in=tasks, label=label)
+            .values_list('pk', 'task_id')
+        )
+        labeled = Task.objects.filter(pk__in=[pk for _, pk in links])
+        task_labels_bulk_changing.send(
+            sender=TaskLabel, tasks=labeled, label_id=label.pk, delta=-1
+        )
+        labeled.update(updated_at=timezone.now())
+        removed += _delete_links([pk for pk, _ in links])
+    return removed
@@ -0,0 +1,143 @@
+"""
+Cached choice lists for the task form and filter dropdowns.
+
+Choices of a model are built once per change instead of once per request.
+Every model has a version token stored in the cache of its app and
+replaced by the signals in task_manager.tasks.signals when an object
+is saved or deleted. Built choices are stored in the same cache under
+the current version and memoized in the process until the version changes.
+
+The tokens are only seen by all workers in a shared cache, which
+the system checks of task_manager.checks make sure of.
+
+Only querysets of all objects of a model can be cached,
+because choices are keyed by the model.
+"""
+import uuid
+
+from django import forms
+from django.db import DEFAULT_DB_ALIAS
+from django.forms.models import ModelChoiceIterator, ModelChoiceIteratorValue
+from django_filters import ModelChoiceFilter
+from django_filters import fields as filter_fields
+
+from task_manager.caching import get_cache
+
+# Built choices of old versions expire from the shared cache after a day
+CHOICES_TIMEOUT = 60 * 60 * 24
+
+# model label -> (version, choices)
+_local_choices = {}
+
+
+def _version_key(model):
+    return f'choices:{model._meta.label_lower}:version'
+
+
+def _get_cache(model):
+    return get_cache(model._meta.app_label)
+
+
+def get_version(model):
+    """
+    Returns the current version token of the model choices.
+    """
+    cache = _get_cache(model)
+    key = _version_key(model)
+    version = cache.get(key)
+    if version is None:
+        # A new token, so choices memoized under an evicted version
+        # are never mistaken for the current ones
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    # A cache keeping nothing (dummy://) gives a new token every time,
+    # so nothing is memoized under it
+    return version or uuid.uuid4().hex
+
+
+def invalidate(model):
+    """
+    Makes all cached choices of the model outdated.
+    """
+    _get_cache(model).set(_version_key(model), uuid.uuid4().hex, timeout=None)
+
+
+def get_choices(queryset, label_from_instance):
+    """
+    Returns a list of (pk, label) pairs for the objects of the queryset.
+    """
+    model = queryset.model
+    version = get_version(model)
+    label = model._meta.label_lower
+
+    local = _local_choices.get(label)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    key = f'choices:{label}:{version}'
+    cache = _get_cache(model)
+    choices = cache.get(key)
+    if choices is None:
+        # Choices are kept until the next change, so they are built
+        # from the primary database, which replicas may lag behind
+        queryset = queryset.using(DEFAULT_DB_ALIAS)
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+        choices = [
+            (obj.pk, label_from_instance(obj))
+            for obj in queryset.iterator()
+        ]
+        cache.set(key, choices, timeout=CHOICES_TIMEOUT)
+
+    _local_choices[label] = (version, choices)
+    return choices
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """
+    Model choice iterator reading choices from the cache
+    instead of querying the database on every render.
+    """
+    def _cached_choices(self):
+        return get_choices(self.queryset, self.field.label_from_instance)
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        for pk, label in self._cached_choices():
+            yield ModelChoiceIteratorValue(pk, None), label
+
+    def __len__(self):
+        empty = 1 if self.field.empty_label is not None else 0
+        return len(self._cached_choices()) + empty
+
+    def __bool__(self):
+        return (
+            self.field.empty_label is not None
+            or bool(self._cached_choices())
+        )
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    iterator = CachedModelChoiceIterator
+
+
+class CachedModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    iterator = CachedModelChoiceIterator
+
+
+class CachedFilterChoiceIterator(
+    filter_fields.ModelChoiceIterator,
+    CachedModelChoiceIterator,
+):
+    """
+    Adds the null choice handling of django-filter to the cached iterator.
+    """
+
+
+class CachedFilterChoiceField(filter_fields.ModelChoiceField):
+    iterator = CachedFilterChoiceIterator
+
+
+class CachedModelChoiceFilter(ModelChoiceFilter):
+    field_class = CachedFilterChoiceField
@@ -0,0 +1,61 @@
+"""
+Maintains the denormalized task_count of statuses and labels.
+
+Counters are adjusted incrementally by the receivers in
+task_manager.tasks.signals. Bulk operations, which bypass model signals,
+send the tasks_bulk_updating and task_labels_bulk_changing signals
+and are counted by their receivers. refresh_all() only repairs counters,
+it is run by the rebuild_task_counters command.
+"""
+from collections import defaultdict
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task, TaskLabel
+
+# Counted model -> (model of the rows to count, field pointing to it)
+_sources = {
+    Status: (Task, 'status'),
+    Label: (TaskLabel, 'label'),
+}
+
+
+def adjust(model, deltas):
+    """
+    Adds deltas to task_count of the objects and marks them updated.
+    deltas maps primary keys to the change of their counters.
+    Objects with the same delta are updated in a single query.
+    """
+    pks_by_delta = defaultdict(list)
+    for pk, delta in deltas.items():
+        if pk is not None and delta:
+            pks_by_delta[delta].append(pk)
+    for delta, pks in pks_by_delta.items():
+        model.objects.filter(pk__in=pks).update(
+            task_count=F('task_count') + delta,
+            updated_at=timezone.now(),
+        )
+
+
+def refresh(model):
+    """
+    Recounts task_count of all objects of the model.
+    """
+    source, field = _sources[model]
+    count = (
+        source.objects.filter(**{field: OuterRef('pk')})
+        .order_by()
+        .values(field)
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return model.objects.update(task_count=Coalesce(Subquery(count), 0))
+
+
+def refresh_all():
+    for model in _sources:
+        refresh(model)
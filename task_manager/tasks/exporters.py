@@ -0,0 +1,87 @@
+"""
+Streaming export of tasks to CSV and JSON Lines.
+
+Tasks are read with a server-side cursor (where the database supports it)
+in chunks of EXPORT_CHUNK_SIZE, with their labels prefetched per chunk,
+and written out chunk by chunk, so the memory used by an export
+does not depend on the number of tasks.
+"""
+import csv
+import json
+from itertools import batched
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_COLUMNS = [
+    'id',
+    'name',
+    'description',
+    'status',
+    'author',
+    'executor',
+    'labels',
+    'created_at',
+]
+
+# Separates label names in a CSV cell
+LABEL_SEPARATOR = ','
+
+
+def task_to_row(task):
+    """
+    Returns the exported values of a task.
+    Users are exported by username and statuses and labels by name,
+    so the rows can be imported back.
+    """
+    return {
+        'id': task.id,
+        'name': task.name,
+        'description': task.description,
+        'status': task.status.name,
+        'author': task.author.username,
+        'executor': task.executor.username if task.executor else '',
+        'labels': [label.name for label in task.labels.all()],
+        'created_at': task.created_at.isoformat(),
+    }
+
+
+def iter_rows(queryset):
+    for task in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield task_to_row(task)
+
+
+class Echo:
+    """
+    File-like object returning the written value instead of storing it,
+    so csv.writer can format rows for a streaming response.
+    """
+    def write(self, value):
+        return value
+
+
+def iter_csv(queryset):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for rows in batched(iter_rows(queryset), EXPORT_CHUNK_SIZE):
+        yield ''.join(
+            writer.writerow([
+                LABEL_SEPARATOR.join(value) if column == 'labels' else value
+                for column, value in row.items()
+            ])
+            for row in rows
+        )
+
+
+def iter_jsonl(queryset):
+    for rows in batched(iter_rows(queryset), EXPORT_CHUNK_SIZE):
+        yield ''.join(
+            json.dumps(row, ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
+
+# Format -> (content type, function streaming the tasks)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', iter_csv),
+    'jsonl': ('application/x-ndjson', iter_jsonl),
+}
@@ -1,27 +1,36 @@
 from django import forms
 from django.contrib.auth import get_user_model
-from django_filters import BooleanFilter, FilterSet, ModelChoiceFilter
+from django_filters import BooleanFilter, CharFilter, FilterSet
 
 from task_manager import texts
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
+from task_manager.tasks.choices import CachedModelChoiceFilter
 from task_manager.tasks.models import Task
+from task_manager.tasks.search import search_tasks
+from task_manager.widgets import AutocompleteSelect
 
 User = get_user_model()
 
 
 class TaskFilter(FilterSet):
-    status = ModelChoiceFilter(
+    q = CharFilter(
+        method='filter_search',
+        label=texts.tasks_index['search'],
+    )
+    status = CachedModelChoiceFilter(
         queryset=Status.objects.all(),
         label=texts.tasks_index['status']
     )
-    executor = ModelChoiceFilter(
+    executor = CachedModelChoiceFilter(
         queryset=User.objects.all(),
-        label=texts.tasks_index['executor']
+        label=texts.tasks_index['executor'],
+        widget=AutocompleteSelect('users_autocomplete'),
     )
-    labels = ModelChoiceFilter(
+    labels = CachedModelChoiceFilter(
         queryset=Label.objects.all(),
-        label=texts.tasks_index['label']
+        label=texts.tasks_index['label'],
+        widget=AutocompleteSelect('labels_autocomplete'),
     )
     self_tasks = BooleanFilter(
         method='filter_self_tasks',
@@ -29,6 +38,9 @@ class TaskFilter(FilterSet):
         label=texts.tasks_index['self_tasks']
     )
 
+    def filter_search(self, queryset, name, value):
+        return search_tasks(queryset, value)
+
     def filter_self_tasks(self, queryset, name, value):
         if value:
             return queryset.filter(author=self.request.user)
@@ -36,4 +48,4 @@ class TaskFilter(FilterSet):
 
     class Meta:
         model = Task
-        fields = ['status', 'executor', 'labels', 'self_tasks']
+        fields = ['q', 'status', 'executor', 'labels', 'self_tasks']
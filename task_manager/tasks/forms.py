@@ -1,11 +1,24 @@
+from django import forms
+from django.contrib.auth import get_user_model
 from django.forms import ModelForm
 
+from task_manager import texts
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.choices import (
+    CachedModelChoiceField,
+    CachedModelMultipleChoiceField,
+)
 from task_manager.tasks.models import Task
+from task_manager.widgets import AutocompleteSelect, AutocompleteSelectMultiple
+
+User = get_user_model()
 
 
 class TaskForm(ModelForm):
     """
     Form for creating and updating tasks.
+    Dropdown choices are read from the choices cache.
     """
     class Meta:
         model = Task
@@ -16,3 +29,80 @@ class TaskForm(ModelForm):
             'executor',
             'labels',
         ]
+        field_classes = {
+            'status': CachedModelChoiceField,
+            'executor': CachedModelChoiceField,
+            'labels': CachedModelMultipleChoiceField,
+        }
+        widgets = {
+            'executor': AutocompleteSelect('users_autocomplete'),
+            'labels': AutocompleteSelectMultiple('labels_autocomplete'),
+        }
+
+
+class TaskBulkActionForm(forms.Form):
+    """
+    Action applied to the tasks checked on the index page,
+    or to all tasks matching the filter if select_all is checked.
+    """
+    ACTIONS = [
+        ('set_status', texts.bulk_tasks['set_status']),
+        ('set_executor', texts.bulk_tasks['set_executor']),
+        ('add_labels', texts.bulk_tasks['add_labels']),
+        ('remove_labels', texts.bulk_tasks['remove_labels']),
+    ]
+
+    # Field holding the argument of every action
+    ACTION_FIELDS = {
+        'set_status': 'status',
+        'set_executor': 'executor',
+        'add_labels': 'labels',
+        'remove_labels': 'labels',
+    }
+
+    action = forms.ChoiceField(
+        label=texts.bulk_tasks['action'],
+        choices=ACTIONS,
+    )
+    tasks = forms.ModelMultipleChoiceField(
+        queryset=Task.objects.all(),
+        required=False,
+        widget=forms.MultipleHiddenInput,
+    )
+    select_all = forms.BooleanField(
+        label=texts.bulk_tasks['select_all'],
+        required=False,
+    )
+    status = CachedModelChoiceField(
+        queryset=Status.objects.all(),
+        label=texts.bulk_tasks['status'],
+        required=False,
+    )
+    executor = CachedModelChoiceField(
+        queryset=User.objects.all(),
+        label=texts.bulk_tasks['executor'],
+        required=False,
+        widget=AutocompleteSelect('users_autocomplete'),
+    )
+    labels = CachedModelMultipleChoiceField(
+        queryset=Label.objects.all(),
+        label=texts.bulk_tasks['labels'],
+        required=False,
+        widget=AutocompleteSelectMultiple('labels_autocomplete'),
+    )
+
+    def clean(self):
+        """
+        Checks that tasks are selected and the action has its argument.
+        The executor may be empty to unassign the tasks.
+        """
+        cleaned_data = super().clean()
+        if not cleaned_data.get('select_all') and not cleaned_data.get(
+            'tasks'
+        ):
+            raise forms.ValidationError(texts.bulk_tasks['no_tasks'])
+
+        field = self.ACTION_FIELDS.get(cleaned_data.get('action'))
+        if field in ('status', 'labels') and not cleaned_data.get(field):
+            self.add_error(field, self.fields[field].error_messages['required'])
+        return cleaned_data
@@ -0,0 +1,232 @@
+"""
+Bulk import of tasks from CSV and JSON Lines.
+
+Rows have the columns written by task_manager.tasks.exporters.
+They are validated with the rules of TaskForm fields, but statuses,
+labels and users are resolved by name from maps loaded once per import
+instead of a query per row. Valid tasks are inserted with bulk_create
+in batches, every batch in its own transaction.
+"""
+import csv
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from task_manager import texts
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.exporters import LABEL_SEPARATOR
+from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.tasks.signals import tasks_bulk_created
+
+User = get_user_model()
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def read_csv(file):
+    for row in csv.DictReader(file):
+        row['labels'] = [
+            name.strip()
+            for name in (row.get('labels') or '').split(LABEL_SEPARATOR)
+            if name.strip()
+        ]
+        yield row
+
+
+def read_jsonl(file):
+    """
+    Yields None for lines which are not JSON objects.
+    """
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield row if isinstance(row, dict) else None
+
+
+IMPORT_FORMATS = {
+    'csv': read_csv,
+    'jsonl': read_jsonl,
+}
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        # (row number, {field: [messages]})
+        self.errors = []
+        self.seconds = 0.0
+
+    @property
+    def rate(self):
+        """
+        Imported tasks per second.
+        """
+        return self.created / self.seconds if self.seconds else 0.0
+
+
+class TaskImporter:
+    """
+    Imports rows as tasks. Tasks without an author in the row
+    are authored by the given user. Rows with errors are skipped
+    and reported in the result.
+    """
+    def __init__(self, author, batch_size=IMPORT_BATCH_SIZE):
+        self.author = author
+        self.batch_size = batch_size
+        self.fields = TaskForm().fields
+        self.statuses = dict(Status.objects.values_list('name', 'id'))
+        self.labels = dict(Label.objects.values_list('name', 'id'))
+        self.users = dict(User.objects.values_list('username', 'id'))
+        self.result = ImportResult()
+        # Names of the rows read so far, to find duplicates in the file
+        self._names = set()
+
+    def import_rows(self, rows):
+        start = time.perf_counter()
+        batch = []
+        for number, row in enumerate(rows, start=1):
+            task, label_ids = self.clean_row(number, row)
+            if task is None:
+                continue
+            batch.append((number, task, label_ids))
+            if len(batch) >= self.batch_size:
+                self.write(batch)
+                batch = []
+        if batch:
+            self.write(batch)
+        self.result.seconds = time.perf_counter() - start
+        return self.result
+
+    def clean_row(self, number, row):
+        """
+        Returns an unsaved task and its label ids,
+        or (None, None) if the row has errors.
+        """
+        if row is None:
+            self.result.errors.append(
+                (number, {'__all__': [str(texts.import_tasks['invalid_row'])]})
+            )
+            return None, None
+
+        errors = {}
+        values = {}
+        for name in ('name', 'description'):
+            try:
+                values[name] = self.fields[name].clean(row.get(name))
+            except ValidationError as error:
+                errors[name] = error.messages
+        values['status_id'] = self._resolve(
+            'status', self.statuses, row.get('status'), errors
+        )
+        values['executor_id'] = self._resolve(
+            'executor', self.users, row.get('executor'), errors
+        )
+        values['author_id'] = self._resolve_author(row.get('author'), errors)
+        label_ids = self._resolve_labels(row.get('labels') or [], errors)
+        self._check_name(values.get('name'), errors)
+
+        if errors:
+            self.result.errors.append((number, errors))
+            return None, None
+        return Task(**values), label_ids
+
+    def _resolve(self, field, lookup, value, errors):
+        """
+        Returns the primary key of the object named value
+        using the errors of the TaskForm field.
+        """
+        if not value:
+            if self.fields[field].required:
+                errors[field] = [
+                    str(self.fields[field].error_messages['required'])
+                ]
+            return None
+        if value not in lookup:
+            errors[field] = [
+                str(self.fields[field].error_messages['invalid_choice'])
+            ]
+        return lookup.get(value)
+
+    def _resolve_author(self, value, errors):
+        if not value:
+            return self.author.pk
+        if value not in self.users:
+            # Same rules as for the executor
+            errors['author'] = [
+                str(self.fields['executor'].error_messages['invalid_choice'])
+            ]
+        return self.users.get(value)
+
+    def _resolve_labels(self, names, errors):
+        unknown = [name for name in names if name not in self.labels]
+        if unknown:
+            errors['labels'] = [
+                str(self.fields['labels'].error_messages['invalid_choice'])
+                % {'value': name}
+                for name in unknown
+            ]
+        return {self.labels[name] for name in names if name in self.labels}
+
+    def _check_name(self, name, errors):
+        if not name or 'name' in errors:
+            return
+        if name in self._names:
+            errors['name'] = [self._unique_name_message()]
+        self._names.add(name)
+
+    def _unique_name_message(self):
+        return Task().unique_error_message(Task, ['name']).messages[0]
+
+    def write(self, batch):
+        """
+        Inserts a batch of tasks with their labels in a transaction.
+        Tasks with names already in the database are reported as errors.
+        """
+        existing = set(
+            Task.objects.filter(
+                name__in=[task.name for _, task, _ in batch]
+            ).values_list('name', flat=True)
+        )
+        for number, task, _ in batch:
+            if task.name in existing:
+                self.result.errors.append(
+                    (number, {'name': [self._unique_name_message()]})
+                )
+        batch = [row for row in batch if row[1].name not in existing]
+
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create([task for _, task, _ in batch])
+            self._load_pks(tasks)
+            task_labels = TaskLabel.objects.bulk_create([
+                TaskLabel(task_id=task.pk, label_id=label_id)
+                for _, task, label_ids in batch
+                for label_id in label_ids
+            ])
+            tasks_bulk_created.send(
+                sender=Task, tasks=tasks, task_labels=task_labels
+            )
+        self.result.created += len(tasks)
+
+    def _load_pks(self, tasks):
+        """
+        Sets primary keys of tasks created by databases which
+        do not return them from bulk inserts.
+        """
+        if all(task.pk is not None for task in tasks):
+            return
+        pks = dict(
+            Task.objects.filter(
+                name__in=[task.name for task in tasks]
+            ).values_list('name', 'id')
+        )
+        for task in tasks:
+            task.pk = pks[task.name]
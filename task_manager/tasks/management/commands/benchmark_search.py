@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.benchmarks import format_timings, measure
+from task_manager.tasks.models import Task
+from task_manager.tasks.search import naive_search_tasks, search_tasks
+from task_manager.tasks.views import TasksIndexView
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the full-text search of tasks with a naive icontains '
+        'scan: time to fetch the first page of results and to count them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'queries',
+            nargs='*',
+            help='Search queries. Defaults to a word of the first task.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed runs of every query.',
+        )
+
+    def handle(self, *args, **options):
+        queries = options['queries'] or self._default_queries()
+        page_size = TasksIndexView.paginate_by
+
+        for query in queries:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'"{query}"'))
+            searches = {
+                'full-text': search_tasks(Task.objects.all(), query)
+                .order_by('-search_rank', 'id'),
+                'icontains': naive_search_tasks(Task.objects.all(), query)
+                .order_by('created_at', 'id'),
+            }
+            for title, queryset in searches.items():
+                page = measure(
+                    lambda: list(queryset[:page_size]), options['repeat']
+                )
+                count = measure(queryset.count, options['repeat'])
+                self.stdout.write(
+                    f'{title}: {queryset.count()} tasks\n'
+                    f'  first page: {format_timings(page)}\n'
+                    f'  count: {format_timings(count)}'
+                )
+            self.stdout.write('')
+
+    def _default_queries(self):
+        task = Task.objects.first()
+        if task is None:
+            raise CommandError('No tasks found, seed data first.')
+        return [task.name.split()[0]]
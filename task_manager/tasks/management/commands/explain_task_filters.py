@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.benchmarks import format_timings, measure
+from task_manager.indexes import PrefixIndex
+from task_manager.labels.views import LabelsAutocompleteView
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.tasks.views import TasksIndexView
+from task_manager.users.views import UsersAutocompleteView
+
+AUTOCOMPLETE_VIEWS = (LabelsAutocompleteView, UsersAutocompleteView)
+
+
+class Command(BaseCommand):
+    help = (
+        'Prints the query plan and timing of the first page of the tasks '
+        'index for the common TaskFilter combinations, and of the '
+        'autocomplete searches, warning when they miss their indexes. '
+        'Run it before and after migrating tasks to 0005_task_indexes '
+        'on the same dataset to compare the plans.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed runs of every query.',
+        )
+
+    def handle(self, *args, **options):
+        task = Task.objects.filter(executor__isnull=False).first()
+        task_label = TaskLabel.objects.first()
+        if task is None or task_label is None:
+            raise CommandError(
+                'No labeled tasks with executors found, seed data first.'
+            )
+
+        combinations = {
+            'no filters': {},
+            'status': {'status': task.status_id},
+            'executor': {'executor': task.executor_id},
+            'label': {'labels': task_label.label_id},
+            'self tasks': {'self_tasks': 'on'},
+            'status + executor': {
+                'status': task.status_id,
+                'executor': task.executor_id,
+            },
+            'status + self tasks': {
+                'status': task.status_id,
+                'self_tasks': 'on',
+            },
+        }
+        request = SimpleNamespace(user=task.author)
+        page_size = TasksIndexView.paginate_by
+
+        for title, data in combinations.items():
+            filterset = TaskFilter(
+                data,
+                queryset=Task.objects.all(),
+                request=request,
+            )
+            queryset = filterset.qs.order_by(
+                *TasksIndexView.cursor_fields
+            )[:page_size + 1]
+
+            self.explain(title, queryset, options['repeat'])
+
+        for view_class in AUTOCOMPLETE_VIEWS:
+            self.explain_autocomplete(view_class, options['repeat'])
+
+    def explain(self, title, queryset, repeat):
+        self.stdout.write(self.style.MIGRATE_HEADING(title))
+        plan = queryset.explain()
+        self.stdout.write(plan)
+        timings = measure(lambda: list(queryset.all()), repeat)
+        self.stdout.write(self.style.SUCCESS(format_timings(timings)))
+        self.stdout.write('')
+        return plan
+
+    def explain_autocomplete(self, view_class, repeat):
+        """
+        Explains the search for the first two letters of the first object
+        and warns when the plan uses none of the prefix indexes.
+        """
+        view = view_class()
+        obj = view.get_queryset().first()
+        if obj is None:
+            return
+        term = getattr(obj, view.search_fields[0])[:2]
+        queryset = view.search(view.get_queryset(), term)[:view.limit]
+        plan = self.explain(
+            f'{view.model._meta.model_name} autocomplete "{term}"',
+            queryset,
+            repeat,
+        )
+        indexes = [
+            index.name for index in view.model._meta.indexes
+            if isinstance(index, PrefixIndex)
+        ]
+        if not any(name in plan for name in indexes):
+            self.stdout.write(self.style.WARNING(
+                f'The search uses none of {", ".join(indexes)}.'
+            ))
+            self.stdout.write('')
@@ -0,0 +1,65 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.tasks.importers import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    TaskImporter,
+)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Imports tasks from a CSV or JSON Lines file with the columns '
+        'of the tasks export. Rows with errors are skipped and reported.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import.')
+        parser.add_argument(
+            '--format',
+            choices=sorted(IMPORT_FORMATS),
+            help='Format of the file. Defaults to the file extension.',
+        )
+        parser.add_argument(
+            '--author',
+            required=True,
+            help='Username of the author of tasks without one in the file.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help='Number of tasks inserted in a transaction.',
+        )
+
+    def handle(self, *args, **options):
+        import_format = (
+            options['format']
+            or os.path.splitext(options['path'])[1].lstrip('.')
+        )
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError(f'Unknown format "{import_format}".')
+        try:
+            author = User.objects.get(username=options['author'])
+        except User.DoesNotExist:
+            raise CommandError(f'User "{options["author"]}" not found.')
+
+        importer = TaskImporter(author, batch_size=options['batch_size'])
+        with open(options['path'], encoding='utf-8', newline='') as file:
+            result = importer.import_rows(IMPORT_FORMATS[import_format](file))
+
+        for number, errors in result.errors:
+            for field, messages in errors.items():
+                self.stderr.write(
+                    f'Row {number}: {field}: {" ".join(messages)}'
+                )
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {result.created} tasks in {result.seconds:.2f} s '
+            f'({result.rate:.0f} tasks/s), '
+            f'skipped {len(result.errors)} rows.'
+        ))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.tasks import counters
+
+
+class Command(BaseCommand):
+    help = 'Recounts task_count of all statuses and labels from the tasks.'
+
+    def handle(self, *args, **options):
+        counters.refresh_all()
+        self.stdout.write(self.style.SUCCESS('Task counters rebuilt.'))
@@ -0,0 +1,91 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_task_labels(apps, schema_editor):
+    """
+    Keeps only the first link between a task and a label,
+    so the unique constraint can be created.
+    """
+    TaskLabel = apps.get_model('tasks', 'TaskLabel')
+    duplicates = (
+        TaskLabel.objects.values('task', 'label')
+        .annotate(first_id=Min('id'), links=Count('id'))
+        .filter(links__gt=1)
+    )
+    for row in duplicates:
+        TaskLabel.objects.filter(
+            task=row['task'],
+            label=row['label'],
+        ).exclude(id=row['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0002_alter_label_created_at_alter_label_name'),
+        ('statuses', '0001_initial'),
+        ('tasks', '0004_alter_task_labels'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_task_labels,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='task_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['executor', 'created_at', 'id'], name='task_executor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['author', 'created_at', 'id'], name='task_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tasklabel',
+            index=models.Index(fields=['label', 'task'], name='tasklabel_label_task_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='tasklabel',
+            constraint=models.UniqueConstraint(fields=('task', 'label'), name='tasklabel_task_label_unique'),
+        ),
+        # Single column foreign key indexes are covered by the indexes above
+        migrations.AlterField(
+            model_name='task',
+            name='author',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='authored_tasks', to=settings.AUTH_USER_MODEL, verbose_name='Author'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='executor',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='assigned_tasks', to=settings.AUTH_USER_MODEL, verbose_name='Executor'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='tasks', to='statuses.status', verbose_name='Status'),
+        ),
+        migrations.AlterField(
+            model_name='tasklabel',
+            name='label',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, to='labels.label'),
+        ),
+        migrations.AlterField(
+            model_name='tasklabel',
+            name='task',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='tasks.task'),
+        ),
+    ]
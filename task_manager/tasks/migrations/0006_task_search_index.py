@@ -0,0 +1,25 @@
+from django.db import migrations
+
+from task_manager.tasks import search
+
+
+def install_search_index(apps, schema_editor):
+    search.install(schema_editor)
+
+
+def uninstall_search_index(apps, schema_editor):
+    search.uninstall(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            install_search_index,
+            uninstall_search_index,
+        ),
+    ]
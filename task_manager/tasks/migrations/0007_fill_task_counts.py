@@ -0,0 +1,36 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_task_counts(apps, schema_editor):
+    Status = apps.get_model('statuses', 'Status')
+    Label = apps.get_model('labels', 'Label')
+    Task = apps.get_model('tasks', 'Task')
+    TaskLabel = apps.get_model('tasks', 'TaskLabel')
+
+    for model, source, field in (
+        (Status, Task, 'status'),
+        (Label, TaskLabel, 'label'),
+    ):
+        count = (
+            source.objects.filter(**{field: OuterRef('pk')})
+            .order_by()
+            .values(field)
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+        model.objects.update(task_count=Coalesce(Subquery(count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0004_label_task_count'),
+        ('statuses', '0002_status_task_count'),
+        ('tasks', '0006_task_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_task_counts, migrations.RunPython.noop),
+    ]
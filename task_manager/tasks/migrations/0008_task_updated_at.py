@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-18 18:04
+
+from django.db import migrations, models
+from django.db.models import F
+
+from task_manager.tasks import search
+
+
+def fill_updated_at(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    Task.objects.update(updated_at=F('created_at'))
+
+
+def install_search_index(apps, schema_editor):
+    # Adding the column recreates the table on SQLite,
+    # which drops the search triggers
+    search.install(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_fill_task_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Updated at'),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+        migrations.RunPython(
+            install_search_index,
+            migrations.RunPython.noop,
+        ),
+    ]
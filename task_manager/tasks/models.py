@@ -1,5 +1,5 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
@@ -8,6 +8,20 @@ from task_manager.texts import task_model
 User = get_user_model()
 
 
+class TaskQuerySet(models.QuerySet):
+    def with_related(self):
+        """
+        Joins status, author and executor and prefetches labels,
+        so listing tasks takes a constant number of queries
+        regardless of the number of rows.
+        """
+        return self.select_related(
+            'status',
+            'author',
+            'executor',
+        ).prefetch_related('labels')
+
+
 class Task(models.Model):
     name = models.CharField(
         verbose_name=task_model['name'],
@@ -25,23 +39,28 @@ class Task(models.Model):
 
     # Atleast one status must be created before creating a task
     # Does not allow deleting statuses that are in use
+    # Indexed by the composite index in Meta.indexes
     status = models.ForeignKey(
         Status,
         verbose_name=task_model['status'],
         on_delete=models.PROTECT,
         related_name='tasks',
+        db_index=False,
     )
 
     # Author is set automatically by the view as the current user
     # Does not allow deleting users that are authors of tasks
+    # Indexed by the composite index in Meta.indexes
     author = models.ForeignKey(
         User,
         verbose_name=task_model['author'],
         on_delete=models.PROTECT,
         related_name='authored_tasks',
+        db_index=False,
     )
 
     # Does not allow deleting users that are executors of tasks
+    # Indexed by the composite index in Meta.indexes
     executor = models.ForeignKey(
         User,
         verbose_name=task_model['executor'],
@@ -49,6 +68,7 @@ class Task(models.Model):
         related_name='assigned_tasks',
         blank=True,
         null=True,
+        db_index=False,
     )
 
     labels = models.ManyToManyField(
@@ -63,10 +83,63 @@ class Task(models.Model):
         verbose_name=task_model['created_at'],
         auto_now_add=True,
     )
+    # Also changed by bulk actions and label changes,
+    # see task_manager.tasks.bulk and task_manager.tasks.signals
+    updated_at = models.DateTimeField(
+        verbose_name=task_model['updated_at'],
+        auto_now=True,
+    )
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        # Tasks index is ordered by (created_at, id) and TaskFilter
+        # filters by status, executor and author (self tasks),
+        # so every filter can be served by the matching index
+        # in the order of the index page.
+        indexes = [
+            models.Index(
+                fields=['created_at', 'id'],
+                name='task_created_idx',
+            ),
+            models.Index(
+                fields=['status', 'created_at', 'id'],
+                name='task_status_created_idx',
+            ),
+            models.Index(
+                fields=['executor', 'created_at', 'id'],
+                name='task_executor_created_idx',
+            ),
+            models.Index(
+                fields=['author', 'created_at', 'id'],
+                name='task_author_created_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Saves the task in a transaction, so the changes made
+        by signal receivers (e.g. task counters) are committed with it.
+        Receivers can compare the task with _loaded_values, the values
+        of the counted fields stored before the save. The row is locked
+        while they are read, so concurrent saves count one after another.
+        """
+        using = kwargs.get('using')
+        with transaction.atomic(using=using):
+            self._loaded_values = {}
+            if not self._state.adding:
+                self._loaded_values = (
+                    Task.objects.db_manager(using)
+                    .select_for_update()
+                    .filter(pk=self.pk)
+                    .values('status_id', 'executor_id')
+                    .first()
+                ) or {}
+            super().save(*args, **kwargs)
+
     def get_executor_name(self):
         return self.executor.get_full_name() if self.executor else ''
 
@@ -77,8 +150,24 @@ class TaskLabel(models.Model):
     Default Django intermediate model is not enough for this case,
     because it allows to delete labels that are in use.
     """
-    task = models.ForeignKey(Task, on_delete=models.CASCADE)
-    label = models.ForeignKey(Label, on_delete=models.PROTECT)
+    # Both foreign keys are indexed by the constraint and the index in Meta
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, db_index=False)
+    label = models.ForeignKey(Label, on_delete=models.PROTECT, db_index=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['task', 'label'],
+                name='tasklabel_task_label_unique',
+            ),
+        ]
+        # Used by the label filter of the tasks index
+        indexes = [
+            models.Index(
+                fields=['label', 'task'],
+                name='tasklabel_label_task_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.task.name} - {self.label.name}'
@@ -0,0 +1,240 @@
+"""
+Full-text search over task name and description.
+
+The search index is maintained by the database itself, so it stays
+in sync with every save, bulk insert, update and delete:
+    - PostgreSQL: a generated tsvector column with a GIN index
+    - SQLite: an FTS5 external content table kept in sync by triggers
+Other databases fall back to icontains.
+
+Both indexes are created by the tasks migrations with install().
+Migrations that recreate the tasks table on SQLite drop the triggers,
+so they have to call install() again.
+"""
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+)
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import Col, Expression, RawSQL
+from django.db.models.functions import Cast
+from django.db.models.sql.constants import INNER
+
+# Name matches weigh more than description matches
+NAME_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+POSTGRESQL_INSTALL = [
+    '''
+    ALTER TABLE tasks_task ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS tasks_task_search_idx
+    ON tasks_task USING GIN (search_vector)
+    ''',
+]
+
+POSTGRESQL_UNINSTALL = [
+    'DROP INDEX IF EXISTS tasks_task_search_idx',
+    'ALTER TABLE tasks_task DROP COLUMN IF EXISTS search_vector',
+]
+
+SQLITE_INSTALL = [
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_task_fts USING fts5(
+        name, description, content='tasks_task', content_rowid='id'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert
+    AFTER INSERT ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete
+    AFTER DELETE ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update
+    AFTER UPDATE OF name, description ON tasks_task BEGIN
+        INSERT INTO tasks_task_fts (tasks_task_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO tasks_task_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    ''',
+    "INSERT INTO tasks_task_fts (tasks_task_fts) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS tasks_task_fts_insert',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_delete',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_update',
+    'DROP TABLE IF EXISTS tasks_task_fts',
+]
+
+_statements = {
+    'postgresql': (POSTGRESQL_INSTALL, POSTGRESQL_UNINSTALL),
+    'sqlite': (SQLITE_INSTALL, SQLITE_UNINSTALL),
+}
+
+
+def install(schema_editor):
+    """
+    Creates (or recreates after a table rebuild) the search index.
+    """
+    install_statements, _ = _statements.get(
+        schema_editor.connection.vendor, ([], [])
+    )
+    for statement in install_statements:
+        schema_editor.execute(statement)
+
+
+def uninstall(schema_editor):
+    _, uninstall_statements = _statements.get(
+        schema_editor.connection.vendor, ([], [])
+    )
+    for statement in uninstall_statements:
+        schema_editor.execute(statement)
+
+
+def get_terms(query):
+    """
+    Splits the query into words. Everything else is dropped,
+    so the words are safe to put into tsquery and FTS5 syntax.
+    """
+    return re.findall(r'\w+', query)
+
+
+_search_vector_column = SearchVectorField()
+_search_vector_column.set_attributes_from_name('search_vector')
+
+
+class _SearchVector(Expression):
+    """
+    The generated search_vector column of the tasks table, which is not
+    a model field. Refers to the table by its alias in the query,
+    so it works in subqueries too.
+    """
+    output_field = SearchVectorField()
+
+    def resolve_expression(self, query=None, *args, **kwargs):
+        return Col(query.get_initial_alias(), _search_vector_column)
+
+
+def _postgresql_search(queryset, terms):
+    # Every word is matched as a prefix, all words are required
+    tsquery = SearchQuery(
+        ' & '.join(f'{term}:*' for term in terms),
+        config='simple',
+        search_type='raw',
+    )
+    return queryset.alias(search_vector=_SearchVector()).annotate(
+        search_rank=Cast(
+            SearchRank(_SearchVector(), tsquery), FloatField()
+        ),
+    ).filter(search_vector=tsquery)
+
+
+class _MatchJoin:
+    """
+    INNER JOIN of the FTS5 matches, ranked, to the tasks. MATCH runs once
+    in the derived table, not for every task of the outer query.
+    """
+    join_type = INNER
+    nullable = False
+    filtered_relation = None
+    table_name = 'tasks_task_fts_match'
+    table_alias = None
+
+    def __init__(self, parent_alias, match):
+        self.parent_alias = parent_alias
+        self.match = match
+
+    def as_sql(self, compiler, connection):
+        # bm25() is lower for better matches
+        return (
+            'INNER JOIN (SELECT rowid, -bm25(tasks_task_fts, %s, %s) AS rank '
+            'FROM tasks_task_fts WHERE tasks_task_fts MATCH %s) '
+            f'{self.table_alias} ON {self.table_alias}.rowid = '
+            f'{compiler.quote_name_unless_alias(self.parent_alias)}.id',
+            [NAME_WEIGHT, DESCRIPTION_WEIGHT, self.match],
+        )
+
+    def relabeled_clone(self, change_map):
+        clone = self.__class__(
+            change_map.get(self.parent_alias, self.parent_alias), self.match
+        )
+        clone.table_alias = change_map.get(self.table_alias, self.table_alias)
+        return clone
+
+    @property
+    def identity(self):
+        return self.__class__, self.parent_alias, self.match
+
+    def __eq__(self, other):
+        if not isinstance(other, _MatchJoin):
+            return NotImplemented
+        return self.identity == other.identity
+
+    def __hash__(self):
+        return hash(self.identity)
+
+
+def _sqlite_search(queryset, terms):
+    # Every word is matched as a prefix, all words are required
+    match = ' '.join(f'"{term}"*' for term in terms)
+    queryset = queryset.all()
+    query = queryset.query
+    # Only the matching tasks have a row to join
+    alias = query.join(_MatchJoin(query.get_initial_alias(), match))
+    return queryset.annotate(
+        search_rank=RawSQL(f'{alias}.rank', [], output_field=FloatField()),
+    )
+
+
+def _naive_search(queryset, terms):
+    for term in terms:
+        queryset = queryset.filter(
+            Q(name__icontains=term) | Q(description__icontains=term)
+        )
+    return queryset.annotate(search_rank=Value(0.0, FloatField()))
+
+
+def search_tasks(queryset, query):
+    """
+    Filters the tasks queryset by the words of the query
+    and annotates every task with search_rank, higher for better matches.
+    """
+    terms = get_terms(query)
+    if not terms:
+        return queryset
+    search = {
+        'postgresql': _postgresql_search,
+        'sqlite': _sqlite_search,
+    }.get(connection.vendor, _naive_search)
+    return search(queryset, terms)
+
+
+def naive_search_tasks(queryset, query):
+    """
+    Same as search_tasks, but scans the table with icontains
+    and does not rank results. Used as a benchmark baseline.
+    """
+    terms = get_terms(query)
+    if not terms:
+        return queryset
+    return _naive_search(queryset, terms)
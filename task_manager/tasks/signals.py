@@ -0,0 +1,157 @@
+"""
+Signals of the tasks app and their receivers.
+"""
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+)
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import choices, counters
+from task_manager.tasks.models import Task, TaskLabel
+
+User = get_user_model()
+
+# Sent after tasks and their labels are inserted with bulk_create,
+# which sends no post_save signals.
+# Arguments: tasks and task_labels, the created objects with primary keys.
+tasks_bulk_created = Signal()
+
+# Sent before tasks are changed with QuerySet.update(),
+# which sends no signals.
+# Arguments: queryset, the tasks to be changed, and values,
+# the new values of the fields by attname.
+tasks_bulk_updating = Signal()
+
+# Sent before the label is added to or removed from tasks in bulk.
+# Arguments: tasks, the queryset of tasks to be changed, label_id,
+# and delta, 1 if the label is added or -1 if it is removed.
+task_labels_bulk_changing = Signal()
+
+
+@receiver(post_save, sender=Status)
+@receiver(post_delete, sender=Status)
+@receiver(post_save, sender=Label)
+@receiver(post_delete, sender=Label)
+@receiver(post_delete, sender=User)
+def invalidate_choices(sender, **kwargs):
+    """
+    Outdates cached dropdown choices when one of their objects changes.
+    """
+    choices.invalidate(sender)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_choices(sender, update_fields=None, **kwargs):
+    """
+    Same as invalidate_choices, but ignores last login updates,
+    which do not change the user's name.
+    """
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    choices.invalidate(sender)
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance, created, **kwargs):
+    if created:
+        counters.adjust(Status, {instance.status_id: 1})
+    else:
+        previous_status_id = instance._loaded_values.get('status_id')
+        if previous_status_id != instance.status_id:
+            counters.adjust(Status, {
+                previous_status_id: -1,
+                instance.status_id: 1,
+            })
+
+
+@receiver(post_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    counters.adjust(Status, {instance.status_id: -1})
+
+
+@receiver(post_save, sender=TaskLabel)
+def count_saved_task_label(sender, instance, created, **kwargs):
+    if created:
+        counters.adjust(Label, {instance.label_id: 1})
+
+
+@receiver(post_delete, sender=TaskLabel)
+def count_deleted_task_label(sender, instance, **kwargs):
+    """
+    Also called for every link removed by task.labels.remove(),
+    set() and clear(), which delete TaskLabel objects with a queryset.
+    """
+    counters.adjust(Label, {instance.label_id: -1})
+
+
+@receiver(m2m_changed, sender=TaskLabel)
+def count_added_task_labels(sender, instance, action, reverse, pk_set,
+                            **kwargs):
+    """
+    task.labels.add() and set() insert TaskLabel objects with bulk_create,
+    which sends no post_save signals.
+    """
+    if action != 'post_add' or not pk_set:
+        return
+    if reverse:
+        # label.tasks.add(*tasks)
+        counters.adjust(Label, {instance.pk: len(pk_set)})
+    else:
+        counters.adjust(Label, {pk: 1 for pk in pk_set})
+
+
+@receiver(tasks_bulk_created)
+def count_bulk_created_tasks(sender, tasks, task_labels, **kwargs):
+    counters.adjust(Status, Counter(task.status_id for task in tasks))
+    counters.adjust(Label, Counter(link.label_id for link in task_labels))
+
+
+@receiver(m2m_changed, sender=TaskLabel)
+def touch_relabeled_tasks(sender, instance, action, reverse, pk_set,
+                          **kwargs):
+    """
+    Labels are shown on the task page, so adding or removing them
+    changes updated_at of the tasks.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if pk_set is not None and not pk_set:
+        # Nothing was added or removed
+        return
+    if reverse:
+        # label.tasks.clear() does not tell which tasks were changed
+        tasks = Task.objects.filter(pk__in=pk_set or [])
+    else:
+        tasks = Task.objects.filter(pk=instance.pk)
+    tasks.update(updated_at=timezone.now())
+
+
+@receiver(tasks_bulk_updating)
+def count_bulk_updated_tasks(sender, queryset, values, **kwargs):
+    if 'status_id' not in values:
+        return
+    rows = (
+        queryset.order_by()
+        .values_list('status_id')
+        .annotate(count=Count('pk'))
+    )
+    deltas = Counter()
+    for status_id, count in rows:
+        deltas[status_id] -= count
+        deltas[values['status_id']] += count
+    counters.adjust(Status, deltas)
+
+
+@receiver(task_labels_bulk_changing)
+def count_bulk_changed_task_labels(sender, tasks, label_id, delta,
+                                   **kwargs):
+    counters.adjust(Label, {label_id: delta * tasks.count()})
@@ -1,5 +1,25 @@
-from django.test import Client, TestCase
+import csv
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.utils import load_backend
+from django.test import (
+    Client,
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
+from django.utils import translation
 
 from task_manager import texts
 from task_manager.factories import (
@@ -8,7 +28,12 @@ from task_manager.factories import (
     TaskFactory,
     UserFactory,
 )
-from task_manager.tasks.models import Task
+from task_manager.labels.models import Label
+from task_manager.sqlite import get_pragmas
+from task_manager.statuses.models import Status
+from task_manager.tasks import bulk, search
+from task_manager.tasks.models import Task, TaskLabel
+from task_manager.tasks.views import TaskDeleteView, TasksIndexView
 
 
 class SetUpMixin:
@@ -176,6 +201,75 @@ class TestTasksIndex(SetUpMixin, TestCase):
         self.assertNotContains(response, wrong_executor_task.name)
         self.assertNotContains(response, wrong_labels_task.name)
 
+    def test_tasks_index_query_count_does_not_grow_with_tasks(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse_lazy('tasks_index'))
+
+        TaskFactory.create_batch(10)
+
+        with self.assertNumQueries(len(context.captured_queries)):
+            response = self.client.get(reverse_lazy('tasks_index'))
+        self.assertEqual(len(response.context['tasks']), 13)
+
+
+class TestTasksIndexPagination(SetUpMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(TasksIndexView, 'paginate_by', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_first_page(self):
+        response = self.client.get(reverse_lazy('tasks_index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['tasks']), self.tasks[:2])
+
+        page = response.context['page_obj']
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertContains(response, texts.pagination['next'])
+        self.assertContains(response, texts.pagination['previous'])
+
+    def test_next_and_previous_pages(self):
+        response = self.client.get(reverse_lazy('tasks_index'))
+        next_url = response.context['page_obj'].next_url
+
+        response = self.client.get(f"{reverse_lazy('tasks_index')}{next_url}")
+        self.assertEqual(list(response.context['tasks']), self.tasks[2:])
+        page = response.context['page_obj']
+        self.assertFalse(page.has_next())
+        self.assertTrue(page.has_previous())
+
+        response = self.client.get(
+            f"{reverse_lazy('tasks_index')}{page.previous_url}"
+        )
+        self.assertEqual(list(response.context['tasks']), self.tasks[:2])
+        self.assertFalse(response.context['page_obj'].has_previous())
+
+    def test_pagination_keeps_filters(self):
+        status = self.tasks[0].status
+        matching_tasks = TaskFactory.create_batch(2, status=status)
+        params = {'status': status.id}
+
+        response = self.client.get(reverse_lazy('tasks_index'), params)
+        self.assertEqual(
+            list(response.context['tasks']),
+            [self.tasks[0], matching_tasks[0]],
+        )
+        next_url = response.context['page_obj'].next_url
+        self.assertIn(f'status={status.id}', next_url)
+
+        response = self.client.get(f"{reverse_lazy('tasks_index')}{next_url}")
+        self.assertEqual(list(response.context['tasks']), matching_tasks[1:])
+
+    def test_invalid_cursor_shows_first_page(self):
+        response = self.client.get(
+            reverse_lazy('tasks_index'),
+            {'after': 'invalid'},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['tasks']), self.tasks[:2])
+
 
 class TestTaskCreate(SetUpMixin, TestCase):
     def test_task_create_form(self):
@@ -243,6 +337,682 @@ class TestTaskCreate(SetUpMixin, TestCase):
         self.assertIn('status', errors)
 
 
+class TestTasksSearch(SetUpMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.name_match = TaskFactory(
+            name='Deploy release',
+            description='Ship it',
+        )
+        self.description_match = TaskFactory(
+            name='Prepare notes',
+            description='Notes for the next deployment',
+        )
+
+    def search(self, query, **params):
+        return self.client.get(
+            reverse_lazy('tasks_index'),
+            {'q': query, **params},
+        )
+
+    def test_search_ranks_name_matches_first(self):
+        response = self.search('deploy')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(response.context['tasks']),
+            [self.name_match, self.description_match],
+        )
+
+    def test_search_requires_all_words(self):
+        response = self.search('notes deploy')
+        self.assertEqual(
+            list(response.context['tasks']),
+            [self.description_match],
+        )
+
+    def test_search_with_other_filters(self):
+        response = self.search(
+            'deploy',
+            status=self.description_match.status.id,
+        )
+        self.assertEqual(
+            list(response.context['tasks']),
+            [self.description_match],
+        )
+
+    def test_search_index_follows_changes(self):
+        self.name_match.name = 'Rollback release'
+        self.name_match.save()
+        self.assertNotIn(
+            self.name_match,
+            self.search('deploy').context['tasks'],
+        )
+        self.assertIn(
+            self.name_match,
+            self.search('rollback').context['tasks'],
+        )
+
+        self.name_match.delete()
+        self.assertEqual(list(self.search('rollback').context['tasks']), [])
+
+    def test_search_without_words_does_not_filter(self):
+        response = self.search('!!!')
+        self.assertEqual(len(response.context['tasks']), 5)
+
+    def test_search_results_are_paginated(self):
+        with patch.object(TasksIndexView, 'paginate_by', 1):
+            response = self.search('deploy')
+            self.assertEqual(
+                list(response.context['tasks']),
+                [self.name_match],
+            )
+            next_url = response.context['page_obj'].next_url
+            response = self.client.get(
+                f"{reverse_lazy('tasks_index')}{next_url}"
+            )
+        self.assertEqual(
+            list(response.context['tasks']),
+            [self.description_match],
+        )
+
+    def test_postgresql_search_in_subquery(self):
+        postgresql = load_backend('django.db.backends.postgresql')
+        pg_connection = postgresql.DatabaseWrapper({
+            **connection.settings_dict,
+            'ENGINE': 'django.db.backends.postgresql',
+        })
+        matches = search._postgresql_search(Task.objects.all(), ['deploy'])
+        queryset = Task.objects.filter(pk__in=matches.values('pk'))
+
+        sql, _ = queryset.query.get_compiler(
+            connection=pg_connection
+        ).as_sql()
+
+        self.assertIn('U0."search_vector" @@', sql)
+        self.assertNotIn('"tasks_task"."search_vector"', sql)
+
+
+class TestTasksExport(SetUpMixin, TestCase):
+    def export(self, export_format, params=None):
+        response = self.client.get(
+            reverse_lazy('tasks_export', args=[export_format]), params or {}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_export_csv(self):
+        rows = list(csv.DictReader(StringIO(self.export('csv'))))
+        self.assertEqual(
+            [int(row['id']) for row in rows],
+            [task.id for task in self.tasks],
+        )
+        task = self.tasks[0]
+        self.assertEqual(rows[0]['status'], task.status.name)
+        self.assertEqual(rows[0]['author'], task.author.username)
+        self.assertEqual(
+            rows[0]['labels'],
+            ','.join(label.name for label in task.labels.all()),
+        )
+
+    def test_export_jsonl_is_filtered(self):
+        task = self.tasks[1]
+        lines = self.export('jsonl', {'status': task.status.id})
+        rows = [json.loads(line) for line in lines.splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['id'], task.id)
+        self.assertEqual(rows[0]['executor'], task.executor.username)
+        self.assertEqual(
+            rows[0]['labels'], [label.name for label in task.labels.all()]
+        )
+
+    def test_export_with_invalid_filter(self):
+        self.assertEqual(self.export('jsonl', {'status': 'x'}), '')
+
+    def test_export_unknown_format(self):
+        response = self.client.get(
+            reverse_lazy('tasks_export', args=['xml'])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_queries_do_not_grow_with_tasks(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.export('csv')
+            return len(queries)
+
+        expected = count_queries()
+        TaskFactory.create_batch(10)
+        self.assertEqual(count_queries(), expected)
+
+    def test_index_export_links_keep_filters(self):
+        status = self.tasks[0].status
+        response = self.client.get(
+            reverse_lazy('tasks_index'), {'status': status.id}
+        )
+        self.assertContains(
+            response,
+            f"{reverse_lazy('tasks_export', args=['csv'])}?status={status.id}",
+        )
+
+
+class TestTasksImport(SetUpMixin, TestCase):
+    def import_file(self, content, suffix='.jsonl', *args):
+        stdout, stderr = StringIO(), StringIO()
+        with tempfile.NamedTemporaryFile(
+            'w', suffix=suffix, encoding='utf-8'
+        ) as file:
+            file.write(content)
+            file.flush()
+            call_command(
+                'import_tasks', file.name, '--author', self.user.username,
+                *args, stdout=stdout, stderr=stderr,
+            )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def jsonl(self, *rows):
+        return ''.join(json.dumps(row) + '\n' for row in rows)
+
+    def test_import_exported_csv(self):
+        response = self.client.get(
+            reverse_lazy('tasks_export', args=['csv'])
+        )
+        exported = b''.join(response.streaming_content).decode()
+        for task in self.tasks:
+            task.name = f'Old {task.name}'
+            task.save()
+
+        stdout, stderr = self.import_file(exported, '.csv')
+
+        self.assertIn('Imported 3 tasks', stdout)
+        self.assertEqual(stderr, '')
+        for task in self.tasks:
+            imported = Task.objects.get(name=task.name.removeprefix('Old '))
+            self.assertEqual(imported.status, task.status)
+            self.assertEqual(imported.author, task.author)
+            self.assertEqual(imported.executor, task.executor)
+            self.assertEqual(
+                list(imported.labels.all()), list(task.labels.all())
+            )
+
+    def test_import_updates_counters(self):
+        status = self.tasks[0].status
+        label = LabelFactory()
+        self.import_file(self.jsonl(
+            {'name': 'First', 'status': status.name, 'labels': [label.name]},
+            {'name': 'Second', 'status': status.name},
+        ), '.jsonl', '--batch-size', '1')
+
+        self.assertEqual(Status.objects.get(pk=status.pk).task_count, 3)
+        self.assertEqual(Label.objects.get(pk=label.pk).task_count, 1)
+        self.assertEqual(
+            Task.objects.get(name='Second').author, self.user
+        )
+
+    def test_import_skips_invalid_rows(self):
+        status = self.tasks[0].status
+        stdout, stderr = self.import_file(self.jsonl(
+            {'name': 'Valid', 'status': status.name},
+            {'name': 'Valid', 'status': status.name},
+            {'name': self.tasks[1].name, 'status': status.name},
+            {'name': 'Unknown status', 'status': 'Unknown'},
+            {'name': 'Unknown label', 'status': status.name,
+             'labels': ['Unknown']},
+            {'status': status.name},
+        ) + 'not json\n')
+
+        self.assertIn('Imported 1 tasks', stdout)
+        self.assertIn('skipped 6 rows', stdout)
+        for row in ('Row 2: name', 'Row 3: name', 'Row 4: status',
+                    'Row 5: labels', 'Row 6: name', 'Row 7: __all__'):
+            self.assertIn(row, stderr)
+        self.assertTrue(Task.objects.filter(name='Valid').exists())
+        self.assertFalse(Task.objects.filter(name='Unknown label').exists())
+
+    def test_import_queries_do_not_grow_with_rows(self):
+        status = self.tasks[0].status
+
+        def count_queries(names):
+            with CaptureQueriesContext(connection) as queries:
+                self.import_file(self.jsonl(*(
+                    {'name': name, 'status': status.name} for name in names
+                )))
+            return len(queries)
+
+        # Creates the rollups of the day
+        count_queries(['Warm up'])
+        self.assertEqual(
+            count_queries(['One']),
+            count_queries([f'Many {n}' for n in range(20)]),
+        )
+
+    def test_admin_import(self):
+        admin = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(admin)
+        upload = SimpleUploadedFile('tasks.jsonl', self.jsonl(
+            {'name': 'Uploaded', 'status': self.tasks[0].status.name},
+        ).encode())
+
+        response = self.client.post(
+            reverse_lazy('admin:tasks_task_import'), {'file': upload}
+        )
+
+        self.assertRedirects(
+            response, reverse_lazy('admin:tasks_task_changelist')
+        )
+        self.assertEqual(Task.objects.get(name='Uploaded').author, admin)
+
+    def test_admin_import_unknown_format(self):
+        admin = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(admin)
+        upload = SimpleUploadedFile('tasks.xml', b'<tasks/>')
+
+        response = self.client.post(
+            reverse_lazy('admin:tasks_task_import'), {'file': upload}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, texts.import_tasks['unknown_format'])
+
+
+class TestTasksBulkActions(SetUpMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.own_tasks = TaskFactory.create_batch(2, author=self.user)
+
+    def post(self, data, params=''):
+        return self.client.post(
+            f"{reverse_lazy('tasks_bulk')}?{params}", data, follow=True
+        )
+
+    def assertCountersRebuilt(self):
+        for model in (Status, Label):
+            counts = dict(model.objects.values_list('pk', 'task_count'))
+            call_command('rebuild_task_counters', stdout=StringIO())
+            self.assertEqual(
+                counts, dict(model.objects.values_list('pk', 'task_count'))
+            )
+
+    def test_set_status_of_selected_own_tasks(self):
+        status = StatusFactory()
+        other_task = self.tasks[0]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post({
+                'action': 'set_status',
+                'status': status.id,
+                'tasks': [task.id for task in self.own_tasks]
+                + [other_task.id],
+            })
+
+        self.assertRedirects(response, reverse_lazy('tasks_index'))
+        self.assertContains(
+            response, texts.bulk_tasks['success'] % {'count': 2}
+        )
+        self.assertEqual(
+            set(Task.objects.filter(status=status)), set(self.own_tasks)
+        )
+        self.assertNotEqual(
+            Task.objects.get(pk=other_task.pk).status, status
+        )
+        self.assertEqual(len([
+            query for query in queries.captured_queries
+            if query['sql'].startswith('UPDATE "tasks_task"')
+        ]), 1)
+        self.assertCountersRebuilt()
+
+    def test_set_executor_of_all_filtered_tasks(self):
+        own_task = self.own_tasks[0]
+        response = self.post(
+            {'action': 'set_executor', 'executor': '', 'select_all': 'on'},
+            f'status={own_task.status.id}',
+        )
+
+        self.assertRedirects(
+            response,
+            f"{reverse_lazy('tasks_index')}?status={own_task.status.id}",
+        )
+        self.assertIsNone(Task.objects.get(pk=own_task.pk).executor)
+        self.assertIsNotNone(
+            Task.objects.get(pk=self.own_tasks[1].pk).executor
+        )
+
+    def test_add_and_remove_labels(self):
+        label, other_label = LabelFactory.create_batch(2)
+        self.own_tasks[0].labels.add(label)
+        tasks = [task.id for task in self.own_tasks]
+
+        response = self.post({
+            'action': 'add_labels',
+            'labels': [label.id, other_label.id],
+            'tasks': tasks,
+        })
+        self.assertContains(
+            response, texts.bulk_tasks['success'] % {'count': 3}
+        )
+        for task in self.own_tasks:
+            self.assertLessEqual({label, other_label}, set(task.labels.all()))
+        self.assertCountersRebuilt()
+
+        response = self.post({
+            'action': 'remove_labels',
+            'labels': [label.id],
+            'tasks': tasks,
+        })
+        self.assertContains(
+            response, texts.bulk_tasks['success'] % {'count': 2}
+        )
+        for task in self.own_tasks:
+            self.assertNotIn(label, task.labels.all())
+            self.assertIn(other_label, task.labels.all())
+        self.assertCountersRebuilt()
+
+    @patch.object(bulk, 'BATCH_SIZE', 2)
+    def test_remove_labels_in_batches(self):
+        label = LabelFactory()
+        tasks = Task.objects.all()
+        label.tasks.add(*tasks)
+
+        self.assertEqual(bulk.remove_labels(tasks, [label]), tasks.count())
+        self.assertFalse(TaskLabel.objects.filter(label=label).exists())
+        self.assertCountersRebuilt()
+
+    def test_invalid_bulk_action(self):
+        response = self.post({'action': 'set_status', 'tasks': []})
+        self.assertContains(response, texts.bulk_tasks['no_tasks'])
+
+        response = self.post({
+            'action': 'add_labels',
+            'tasks': [self.own_tasks[0].id],
+        })
+        self.assertNotContains(
+            response, texts.bulk_tasks['success'] % {'count': 0}
+        )
+
+    def test_bulk_action_with_no_login(self):
+        self.client.logout()
+        response = self.client.post(reverse_lazy('tasks_bulk'))
+        expected_url = (
+            f"{reverse_lazy('login')}?next={reverse_lazy('tasks_bulk')}"
+        )
+        self.assertRedirects(response, expected_url)
+
+
+class TestTasksConditionalGet(SetUpMixin, TestCase):
+    def get(self, url, etag=None, params=None):
+        headers = {'If-None-Match': etag} if etag else {}
+        return self.client.get(url, params or {}, headers=headers)
+
+    def test_unchanged_tasks_index(self):
+        url = reverse_lazy('tasks_index')
+        response = self.get(url)
+        self.assertNotIn('Last-Modified', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(url, response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        # The session, the user and the aggregate
+        self.assertEqual(len(queries), 3)
+
+    def test_tasks_index_etag_depends_on_filters_and_user(self):
+        url = reverse_lazy('tasks_index')
+        etag = self.get(url)['ETag']
+        params = {'status': self.tasks[0].status.id}
+        self.assertEqual(self.get(url, etag, params).status_code, 200)
+
+        self.client.force_login(UserFactory())
+        self.assertEqual(self.get(url, etag).status_code, 200)
+
+    def test_tasks_index_after_changes(self):
+        url = reverse_lazy('tasks_index')
+
+        def rename_status():
+            status = self.tasks[0].status
+            status.name = 'Renamed status'
+            status.save()
+
+        changes = [
+            lambda: TaskFactory(),
+            lambda: Task.objects.first().delete(),
+            lambda: bulk.set_status(Task.objects.all(), StatusFactory()),
+            rename_status,
+            lambda: UserFactory(),
+        ]
+        for change in changes:
+            etag = self.get(url)['ETag']
+            change()
+            self.assertEqual(self.get(url, etag).status_code, 200)
+
+    def test_tasks_index_ignores_if_modified_since(self):
+        # Renaming a status keeps updated_at of its tasks
+        status = self.tasks[0].status
+        status.name = 'Renamed status'
+        status.save()
+        response = self.client.get(
+            reverse_lazy('tasks_index'),
+            headers={'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Renamed status')
+
+    def test_tasks_index_with_messages(self):
+        url = reverse_lazy('tasks_index')
+        etag = self.get(url)['ETag']
+        self.client.post(
+            reverse_lazy('task_delete', args=[self.tasks[0].id])
+        )
+        # The task was not deleted, but the error message must be shown
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, texts.delete_task['delete_error'])
+
+    def test_task_view(self):
+        task = self.tasks[0]
+        url = reverse_lazy('task_view', args=[task.id])
+        etag = self.get(url)['ETag']
+        self.assertEqual(self.get(url, etag).status_code, 304)
+
+        task.labels.add(LabelFactory())
+        self.assertEqual(self.get(url, etag).status_code, 200)
+
+
+class TestTasksIndexRowCache(SetUpMixin, TestCase):
+    def test_only_changed_rows_are_rendered(self):
+        url = reverse_lazy('tasks_index')
+        self.client.get(url)
+        task, other_task = self.tasks[:2]
+        # QuerySet.update() keeps updated_at, so the cached row is shown
+        Task.objects.filter(pk=other_task.pk).update(name='Not rendered')
+        task.name = 'Renamed task'
+        task.save()
+
+        response = self.client.get(url)
+        self.assertContains(response, 'Renamed task')
+        self.assertContains(response, other_task.name)
+        self.assertNotContains(response, 'Not rendered')
+
+    def test_rows_are_rendered_after_status_change(self):
+        url = reverse_lazy('tasks_index')
+        self.client.get(url)
+        status = self.tasks[0].status
+        status.name = 'Renamed status'
+        status.save()
+
+        self.assertContains(self.client.get(url), 'Renamed status')
+
+    def test_rows_are_cached_per_language(self):
+        url = reverse_lazy('tasks_index')
+        with translation.override('ru'):
+            self.assertContains(self.client.get(url), 'Изменить')
+        with translation.override('en'):
+            self.assertNotContains(self.client.get(url), 'Изменить')
+
+
+class TestTaskCounters(SetUpMixin, TestCase):
+    def assertCounts(self, model, expected):
+        for obj, count in expected.items():
+            self.assertEqual(model.objects.get(pk=obj.pk).task_count, count)
+
+    def test_status_counts(self):
+        status, other_status = StatusFactory.create_batch(2)
+        task = TaskFactory(status=status)
+        TaskFactory(status=status)
+        self.assertCounts(Status, {status: 2, other_status: 0})
+
+        task.status = other_status
+        task.save()
+        self.assertCounts(Status, {status: 1, other_status: 1})
+
+        task.name = 'Renamed task'
+        task.save()
+        self.assertCounts(Status, {status: 1, other_status: 1})
+
+        task.delete()
+        self.assertCounts(Status, {status: 1, other_status: 0})
+
+    def test_status_counts_with_stale_instance(self):
+        status, other_status = StatusFactory.create_batch(2)
+        task = TaskFactory(status=status)
+        stale_task = Task.objects.get(pk=task.pk)
+
+        task.status = other_status
+        task.save()
+        # Loaded before the status changed, but counted from the stored one
+        stale_task.status = other_status
+        stale_task.save()
+        self.assertCounts(Status, {status: 0, other_status: 1})
+
+    def test_status_counts_after_update_view(self):
+        task = self.tasks[0]
+        status = StatusFactory()
+        self.client.post(
+            reverse_lazy('task_update', args=[task.id]),
+            {'name': task.name, 'status': status.id},
+        )
+        self.assertCounts(Status, {task.status: 0, status: 1})
+
+    def test_label_counts(self):
+        label, other_label = LabelFactory.create_batch(2)
+        task = TaskFactory(labels=[label])
+        self.assertCounts(Label, {label: 1, other_label: 0})
+
+        task.labels.add(label, other_label)
+        self.assertCounts(Label, {label: 1, other_label: 1})
+
+        task.labels.set([other_label])
+        self.assertCounts(Label, {label: 0, other_label: 1})
+
+        other_label.tasks.add(*self.tasks)
+        self.assertCounts(Label, {other_label: 4})
+
+        task.labels.clear()
+        self.assertCounts(Label, {other_label: 3})
+
+        TaskLabel.objects.create(task=task, label=label)
+        self.assertCounts(Label, {label: 1})
+
+        task.delete()
+        self.assertCounts(Label, {label: 0, other_label: 3})
+
+    def test_rebuild_task_counters(self):
+        Status.objects.update(task_count=100)
+        Label.objects.update(task_count=100)
+
+        call_command('rebuild_task_counters', stdout=StringIO())
+
+        for task in self.tasks:
+            self.assertCounts(Status, {task.status: 1})
+            self.assertCounts(Label, {label: 1 for label in task.labels.all()})
+
+
+class TestTaskChoicesCache(SetUpMixin, TestCase):
+    def test_choices_are_not_queried_again(self):
+        self.client.get(reverse_lazy('task_create'))
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse_lazy('task_create'))
+        queries = ' '.join(query['sql'] for query in context.captured_queries)
+
+        self.assertNotIn('statuses_status', queries)
+        self.assertNotIn('labels_label', queries)
+        for task in self.tasks:
+            self.assertContains(response, task.status.name)
+            self.assertContains(response, task.executor.get_full_name())
+
+    def test_choices_are_rebuilt_after_changes(self):
+        self.client.get(reverse_lazy('tasks_index'))
+
+        status = StatusFactory(name='Fresh status')
+        response = self.client.get(reverse_lazy('tasks_index'))
+        self.assertContains(response, 'Fresh status')
+
+        status.name = 'Renamed status'
+        status.save()
+        response = self.client.get(reverse_lazy('tasks_index'))
+        self.assertContains(response, 'Renamed status')
+        self.assertNotContains(response, 'Fresh status')
+
+        status.delete()
+        response = self.client.get(reverse_lazy('tasks_index'))
+        self.assertNotContains(response, 'Renamed status')
+
+    def test_user_choices_are_rebuilt_after_changes(self):
+        self.client.get(reverse_lazy('task_create'))
+
+        UserFactory(first_name='Fresh', last_name='User')
+        response = self.client.get(reverse_lazy('task_create'))
+        self.assertContains(response, 'Fresh User')
+
+
+class TestTaskAutocompleteWidgets(SetUpMixin, TestCase):
+    def test_all_options_are_rendered_below_threshold(self):
+        response = self.client.get(reverse_lazy('task_create'))
+        self.assertNotContains(response, 'data-autocomplete-url')
+        for task in self.tasks:
+            self.assertContains(response, task.executor.get_full_name())
+
+    @override_settings(AUTOCOMPLETE_THRESHOLD=1)
+    def test_only_selected_options_are_rendered_above_threshold(self):
+        task = self.tasks[0]
+        response = self.client.get(
+            reverse_lazy('task_update', args=[task.id])
+        )
+        self.assertContains(
+            response,
+            f'data-autocomplete-url="{reverse_lazy("users_autocomplete")}"',
+        )
+        self.assertContains(
+            response,
+            f'data-autocomplete-url="{reverse_lazy("labels_autocomplete")}"',
+        )
+        self.assertContains(response, task.executor.get_full_name())
+        for label in task.labels.all():
+            self.assertContains(response, label.name)
+        for other_task in self.tasks[1:]:
+            self.assertNotContains(
+                response,
+                other_task.executor.get_full_name(),
+            )
+
+    @override_settings(AUTOCOMPLETE_THRESHOLD=1)
+    def test_filter_renders_only_selected_executor(self):
+        executor = self.tasks[0].executor
+        response = self.client.get(
+            reverse_lazy('tasks_index'),
+            {'executor': 'invalid'},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(
+            reverse_lazy('tasks_index'),
+            {'executor': executor.id},
+        )
+        self.assertContains(
+            response,
+            f'<option value="{executor.id}" selected>',
+        )
+
+
 class TestTaskUpdate(SetUpMixin, TestCase):
     def test_task_update_form(self):
         response = self.client.get(
@@ -313,6 +1083,34 @@ class TestTaskDelete(SetUpMixin, TestCase):
         self.assertEqual(Task.objects.count(), 3)
 
 
+class TestTaskOwnership(SetUpMixin, TestCase):
+    def test_task_is_fetched_once(self):
+        task = TaskFactory(author=self.user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse_lazy('task_delete', args=[task.id])
+            )
+        self.assertEqual(response.status_code, 200)
+
+        task_queries = [
+            query for query in context.captured_queries
+            if 'FROM "tasks_task"' in query['sql']
+        ]
+        self.assertEqual(len(task_queries), 1)
+
+    def test_filter_owned(self):
+        own_tasks = TaskFactory.create_batch(2, author=self.user)
+        request = RequestFactory().get('/')
+        request.user = self.user
+        view = TaskDeleteView()
+        view.setup(request)
+
+        self.assertQuerySetEqual(
+            view.filter_owned(Task.objects.order_by('id')),
+            own_tasks,
+        )
+
+
 class TestTaskView(SetUpMixin, TestCase):
     def test_task_view(self):
         response = self.client.get(
@@ -343,3 +1141,109 @@ class TestTaskView(SetUpMixin, TestCase):
             response,
             reverse_lazy('task_delete', args=[self.tasks[0].id])
         )
+
+
+@override_settings(SQLITE_TUNING=True)
+class TestTasksConcurrentWrites(SimpleTestCase):
+    """
+    Creates and updates tasks through the views from several threads.
+    Threads connect to a database file, since locking of the in-memory
+    test database differs from a file.
+    """
+    # Threads replace the connection to the test database
+    databases = {'default'}
+    threads = 8
+    writes = 5
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        directory = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(directory.cleanup)
+        cls.settings_dict = {
+            **connection.settings_dict,
+            'NAME': Path(directory.name) / 'db.sqlite3',
+            'OPTIONS': {'transaction_mode': 'IMMEDIATE', 'timeout': 5},
+        }
+        cls.run_in_threads(cls.migrate, [()])
+
+    @classmethod
+    def run_in_threads(cls, func, args_list):
+        """
+        Calls func with every args of args_list in its own thread
+        connected to the database file.
+        """
+        def target(args):
+            connections['default'] = load_backend(
+                cls.settings_dict['ENGINE']
+            ).DatabaseWrapper(cls.settings_dict)
+            try:
+                return func(*args)
+            finally:
+                connections['default'].close()
+
+        with ThreadPoolExecutor(len(args_list)) as executor:
+            return list(executor.map(target, args_list))
+
+    @staticmethod
+    def migrate():
+        call_command('migrate', verbosity=0)
+
+    @classmethod
+    def create_data(cls):
+        return (
+            StatusFactory(),
+            LabelFactory(),
+            UserFactory.create_batch(cls.threads),
+        )
+
+    @classmethod
+    def write_tasks(cls, user, status, label):
+        client = Client()
+        client.force_login(user)
+        codes = []
+        for n in range(cls.writes):
+            data = {
+                'name': f'{user.username} {n}',
+                'status': status.pk,
+                'labels': [label.pk],
+                'executor': user.pk,
+            }
+            response = client.post(reverse_lazy('task_create'), data)
+            codes.append(response.status_code)
+            task = Task.objects.get(name=data['name'])
+            data['name'] += ' updated'
+            response = client.post(
+                reverse_lazy('task_update', args=[task.pk]), data
+            )
+            codes.append(response.status_code)
+        return codes
+
+    @staticmethod
+    def count_tasks(label):
+        return (
+            Task.objects.filter(name__endswith=' updated').count(),
+            TaskLabel.objects.filter(label=label).count(),
+            get_pragmas(connection),
+        )
+
+    def test_concurrent_create_and_update(self):
+        [(status, label, users)] = self.run_in_threads(
+            self.create_data, [()]
+        )
+
+        results = self.run_in_threads(
+            self.write_tasks, [(user, status, label) for user in users]
+        )
+
+        self.assertEqual(
+            [code for codes in results for code in codes],
+            [302] * self.threads * self.writes * 2,
+        )
+        [(updated, labelled, pragmas)] = self.run_in_threads(
+            self.count_tasks, [(label,)]
+        )
+        self.assertEqual(updated, self.threads * self.writes)
+        self.assertEqual(labelled, self.threads * self.writes)
+        self.assertEqual(pragmas['journal_mode'], 'wal')
+        self.assertEqual(pragmas['busy_timeout'], 5000)
@@ -3,6 +3,12 @@ from task_manager.tasks import views
 
 urlpatterns = [
     path('', views.TasksIndexView.as_view(), name='tasks_index'),
+    path(
+        'export/<str:export_format>/',
+        views.TasksExportView.as_view(),
+        name='tasks_export',
+    ),
+    path('bulk/', views.TasksBulkView.as_view(), name='tasks_bulk'),
     path('create/', views.TaskCreateView.as_view(), name='task_create'),
     path(
         '<int:pk>/update/',
@@ -1,28 +1,185 @@
+from django.contrib import messages
+from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
-
-from django.urls import reverse_lazy
-from django.views.generic import CreateView, DeleteView, DetailView, UpdateView
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse, reverse_lazy
+from django.views.generic import (
+    CreateView,
+    DeleteView,
+    DetailView,
+    UpdateView,
+    View,
+)
+from django.views.generic.list import MultipleObjectMixin
 from django_filters.views import FilterView
 
 from task_manager import texts
-from task_manager.mixins import OwnershipRequiredMixin
+from task_manager.labels.models import Label
+from task_manager.mixins import ConditionalGetMixin, OwnershipRequiredMixin
+from task_manager.pagination import CURSOR_PARAMS, KeysetPaginationMixin
+from task_manager.replicas import ReplicaReadMixin
+from task_manager.statuses.models import Status
+from task_manager.tasks import bulk, choices
+from task_manager.tasks.exporters import EXPORT_FORMATS
 from task_manager.tasks.filters import TaskFilter
-from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.forms import TaskBulkActionForm, TaskForm
 from task_manager.tasks.models import Task
 
+User = get_user_model()
+
+# Rows of the tasks index page are cached until they change,
+# old versions expire after a day
+ROW_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_related_versions():
+    """
+    Returns versions of statuses, users and labels, which change
+    when any of them is changed, for the ETags of task pages.
+    """
+    return [choices.get_version(model) for model in (Status, User, Label)]
 
-class TasksIndexView(LoginRequiredMixin, FilterView):
+
+class TasksIndexView(LoginRequiredMixin,
+                     ReplicaReadMixin,
+                     ConditionalGetMixin,
+                     KeysetPaginationMixin,
+                     FilterView):
+    """
+    List of tasks filtered by TaskFilter.
+    Tasks are ordered by creation date, or by relevance when searching,
+    and paginated by cursor.
+    Unchanged pages are answered with 304 Not Modified
+    and unchanged rows are rendered from the cache.
+    """
     model = Task
+    queryset = Task.objects.with_related()
     template_name = 'tasks/index.html'
     context_object_name = 'tasks'
     login_url = reverse_lazy('login')
     filterset_class = TaskFilter
+    paginate_by = 50
     extra_context = {
         'base': texts.base,
         'tasks_index': texts.tasks_index,
+        'pagination': texts.pagination,
+        'bulk_tasks': texts.bulk_tasks,
+        'row_cache_timeout': ROW_CACHE_TIMEOUT,
     }
 
+    def get_filtered_queryset(self):
+        """
+        Returns the tasks matching the filter, or none if it is invalid.
+        """
+        filterset = self.get_filterset(self.get_filterset_class())
+        if filterset.is_bound and not filterset.is_valid():
+            return filterset.queryset.none()
+        return filterset.qs
+
+    def get_conditional_queryset(self):
+        return self.get_filtered_queryset()
+
+    def get_etag_parts(self):
+        return get_related_versions()
+
+    def get_cursor_fields(self, queryset):
+        if 'search_rank' in queryset.query.annotations:
+            return ('-search_rank', 'id')
+        return super().get_cursor_fields(queryset)
+
+    def get_context_data(self, **kwargs):
+        """
+        Adds the filter parameters for the export links.
+        """
+        context = super().get_context_data(**kwargs)
+        params = self.request.GET.copy()
+        for name in CURSOR_PARAMS:
+            params.pop(name, None)
+        context['export_query'] = params.urlencode()
+        context['bulk_form'] = TaskBulkActionForm()
+        # A row shows the task, its status and users, so its cache key
+        # has the task updated_at and the versions of statuses and users
+        status_version, user_version, _ = get_related_versions()
+        context['row_versions'] = f'{status_version}:{user_version}'
+        return context
+
+
+class TasksExportView(TasksIndexView):
+    """
+    Streams all tasks matching the TaskFilter parameters
+    in the format given in the URL, in the order of the index page.
+    """
+    def get(self, request, *args, **kwargs):
+        if kwargs['export_format'] not in EXPORT_FORMATS:
+            raise Http404
+        content_type, stream = EXPORT_FORMATS[kwargs['export_format']]
+
+        queryset = self.get_filtered_queryset()
+        queryset = queryset.order_by(*self.get_cursor_fields(queryset))
+
+        filename = f'tasks.{kwargs["export_format"]}'
+        return StreamingHttpResponse(
+            stream(queryset),
+            content_type=content_type,
+            headers={
+                'Content-Disposition': f'attachment; filename="{filename}"',
+            },
+        )
+
+
+class TasksBulkView(LoginRequiredMixin,
+                    OwnershipRequiredMixin,
+                    MultipleObjectMixin,
+                    View):
+    """
+    Applies a TaskBulkActionForm action to the selected tasks, or to
+    all tasks matching the TaskFilter parameters in the query string.
+    Only tasks authored by the user are changed.
+    Redirects to the tasks index page with the same filters.
+    """
+    model = Task
+    http_method_names = ['post']
+    login_url = reverse_lazy('login')
+
+    # OwnershipRequiredMixin settings
+    ownership_field = 'author'
+    ownership_scope = 'queryset'
+
+    actions = {
+        'set_status': bulk.set_status,
+        'set_executor': bulk.set_executor,
+        'add_labels': bulk.add_labels,
+        'remove_labels': bulk.remove_labels,
+    }
+
+    def post(self, request, *args, **kwargs):
+        form = TaskBulkActionForm(request.POST)
+        if form.is_valid():
+            action = form.cleaned_data['action']
+            count = self.actions[action](
+                self.get_selected_tasks(form),
+                form.cleaned_data[form.ACTION_FIELDS[action]],
+            )
+            messages.success(
+                request, texts.bulk_tasks['success'] % {'count': count}
+            )
+        else:
+            for errors in form.errors.values():
+                for error in errors:
+                    messages.error(request, error)
+        return redirect(f"{reverse('tasks_index')}?{request.GET.urlencode()}")
+
+    def get_selected_tasks(self, form):
+        queryset = self.get_queryset()
+        if form.cleaned_data['select_all']:
+            filterset = TaskFilter(
+                self.request.GET, queryset=queryset, request=self.request
+            )
+            return filterset.qs if filterset.is_valid() else queryset.none()
+        return queryset.filter(pk__in=form.cleaned_data['tasks'].values('pk'))
+
 
 class TaskCreateView(SuccessMessageMixin, LoginRequiredMixin, CreateView):
     """
@@ -93,8 +250,15 @@ class TaskDeleteView(SuccessMessageMixin,
     }
 
 
-class TaskView(LoginRequiredMixin, DetailView):
+class TaskView(LoginRequiredMixin,
+               ReplicaReadMixin,
+               ConditionalGetMixin,
+               DetailView):
+    """
+    Task details. Unchanged pages are answered with 304 Not Modified.
+    """
     model = Task
+    queryset = Task.objects.with_related()
     template_name = 'tasks/detail.html'
     context_object_name = 'task'
     login_url = reverse_lazy('login')
@@ -102,3 +266,9 @@ class TaskView(LoginRequiredMixin, DetailView):
         'base': texts.base,
         'task_view': texts.task_view,
     }
+
+    def get_conditional_queryset(self):
+        return Task.objects.filter(pk=self.kwargs['pk'])
+
+    def get_etag_parts(self):
+        return get_related_versions()
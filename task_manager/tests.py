@@ -1,9 +1,60 @@
-from django.test import TestCase
+import tempfile
+import threading
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from asgiref.sync import (
+    async_to_sync,
+    iscoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models import Count
+from django.db.utils import load_backend
+from django.http import HttpResponse
+from django.templatetags.static import static
+from django.test import RequestFactory, TestCase, override_settings
 from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy, path
 
-from task_manager import texts
-from task_manager.factories import UserFactory
+from task_manager import (
+    assets,
+    cache_backends,
+    checks,
+    metrics,
+    texts,
+    urls,
+    views,
+)
+from task_manager.caching import get_cache, get_cache_settings
+from task_manager.db_pool import (
+    check_connection,
+    get_pool_options,
+    get_pool_stats,
+)
+from task_manager.factories import StatusFactory, TaskFactory, UserFactory
+from task_manager.hashing import run_hashing
+from task_manager.labels.models import Label
+from task_manager.management.commands.loadtest_login import get_percentiles
+from task_manager.replicas import (
+    PIN_COOKIE,
+    REPLICA_DB_ALIAS,
+    ReplicaMiddleware,
+)
+from task_manager.seeding import SEED_PASSWORD, Seeder
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.warmup import compile_templates
+
+User = get_user_model()
 
 
 class SetUpMixin:
@@ -24,6 +75,7 @@ class TestIndex(SetUpMixin, TestCase):
             'statuses_index',
             'labels_index',
             'tasks_index',
+            'dashboard',
         ]
         self.logged_out_urls = [
             'login',
@@ -99,6 +151,41 @@ class TestLogin(SetUpMixin, TestCase):
         self.assertFalse(response.wsgi_request.user.is_authenticated)
 
 
+class AsyncUrlconf:
+    urlpatterns = [
+        path('login/', views.AsyncUserLoginView.as_view(), name='login'),
+        *urls.urlpatterns,
+    ]
+
+
+@override_settings(ROOT_URLCONF=AsyncUrlconf)
+class TestAsyncLogin(TestLogin):
+    """
+    Runs the tests of the login page with the view of ASGI deployments.
+    """
+    def test_view_is_async(self):
+        response = self.client.get(reverse_lazy('login'))
+
+        self.assertIs(
+            response.resolver_match.func.view_class, views.AsyncUserLoginView
+        )
+        self.assertTrue(views.AsyncUserLoginView.view_is_async)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+
+class TestPasswordHashing(TestCase):
+    @override_settings(PASSWORD_HASHING_THREADS=2)
+    def test_runs_in_executor(self):
+        thread = async_to_sync(run_hashing)(threading.current_thread)
+
+        self.assertTrue(thread.name.startswith('password_hashing'))
+
+    def test_runs_in_request_thread(self):
+        thread = async_to_sync(run_hashing)(threading.current_thread)
+
+        self.assertIs(thread, threading.current_thread())
+
+
 class TestLogout(SetUpMixin, TestCase):
     def test_logout(self):
         self.client.force_login(self.user)
@@ -137,3 +224,624 @@ class TestErrors(SetUpMixin, TestCase):
                     response,
                     template_name='errors/500.html'
                 )
+
+
+class TestWarmupTemplates(TestCase):
+    def test_project_templates_compile(self):
+        compiled, errors = compile_templates()
+        project_dir = settings.BASE_DIR / 'task_manager'
+
+        self.assertGreater(compiled, 0)
+        self.assertFalse([
+            path for path in errors if path.is_relative_to(project_dir)
+        ])
+
+    def test_command(self):
+        out = StringIO()
+        call_command('warmup_templates', stdout=out, stderr=StringIO())
+
+        self.assertIn('Compiled', out.getvalue())
+
+
+class FakePool:
+    def get_stats(self):
+        return {'requests_num': 4, 'requests_wait_ms': 10}
+
+
+class TestDatabasePool(SetUpMixin, TestCase):
+    @mock.patch('task_manager.db_pool.find_spec')
+    def test_pool_options_defaults(self, find_spec):
+        options = get_pool_options({})
+
+        self.assertEqual(options['min_size'], 2)
+        self.assertEqual(options['max_size'], 4)
+        self.assertEqual(options['timeout'], 10)
+        self.assertIs(options['check'], check_connection)
+
+    @mock.patch('task_manager.db_pool.find_spec')
+    def test_pool_options_from_environment(self, find_spec):
+        options = get_pool_options({
+            'DATABASE_POOL_MAX_SIZE': '8',
+            'DATABASE_POOL_TIMEOUT': '2.5',
+            'DATABASE_POOL_CHECK': 'False',
+        })
+
+        self.assertEqual(options['max_size'], 8)
+        self.assertEqual(options['timeout'], 2.5)
+        self.assertNotIn('check', options)
+
+    @mock.patch('task_manager.db_pool.find_spec', return_value=None)
+    def test_pool_options_without_psycopg3(self, find_spec):
+        with self.assertRaisesMessage(
+            ImproperlyConfigured, 'poetry install -E pool'
+        ):
+            get_pool_options({})
+
+    def test_pool_stats(self):
+        connections = {
+            'default': SimpleNamespace(pool=FakePool()),
+            'other': SimpleNamespace(),
+        }
+        with mock.patch('task_manager.db_pool.connections', connections):
+            stats = get_pool_stats()
+
+        self.assertEqual(list(stats), ['default'])
+        self.assertEqual(stats['default']['requests_wait_ms_avg'], 2.5)
+
+    def test_pool_view_without_pool(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse_lazy('database_pool'))
+
+        self.assertEqual(response.json(), {'pools': {}})
+
+    def test_pool_view_for_staff_only(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse_lazy('database_pool'))
+
+        self.assertEqual(response.status_code, 403)
+
+
+class TestReplicaRouting(TestCase):
+    """
+    Runs with two SQLite databases: the test database as the primary
+    and a database file as the replica, which the views never write to.
+    The replica is added before the test databases are resolved,
+    so it is isolated like the primary.
+    """
+    databases = '__all__'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        databases = connections.configure_settings({
+            DEFAULT_DB_ALIAS: connection.settings_dict,
+            REPLICA_DB_ALIAS: {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': Path(cls.directory.name) / 'replica.sqlite3',
+            },
+        })
+        connections.settings[REPLICA_DB_ALIAS] = databases[REPLICA_DB_ALIAS]
+        call_command('migrate', database=REPLICA_DB_ALIAS, verbosity=0)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA_DB_ALIAS].close()
+        del connections[REPLICA_DB_ALIAS]
+        del connections.settings[REPLICA_DB_ALIAS]
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.client = Client()
+        self.user = UserFactory()
+        self.client.force_login(self.user)
+        self.status = StatusFactory(name='Primary status')
+
+    def test_index_reads_from_replica(self):
+        Status.objects.using(REPLICA_DB_ALIAS).create(name='Replica status')
+
+        response = self.client.get(reverse_lazy('statuses_index'))
+
+        self.assertContains(response, 'Replica status')
+        self.assertNotContains(response, 'Primary status')
+
+    def test_user_loaded_from_primary(self):
+        response = self.client.get(reverse_lazy('tasks_index'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['user'], self.user)
+
+    def test_detail_reads_from_replica(self):
+        task = TaskFactory()
+
+        response = self.client.get(reverse_lazy('task_view', args=[task.pk]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_reads_pinned_to_primary_after_write(self):
+        response = self.client.post(
+            reverse_lazy('status_create'), {'name': 'New status'}
+        )
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        response = self.client.get(reverse_lazy('statuses_index'))
+
+        self.assertContains(response, 'New status')
+        self.assertContains(response, 'Primary status')
+
+    def test_async_write_pins_reads(self):
+        async def get_response(request):
+            await sync_to_async(StatusFactory)()
+            return HttpResponse()
+
+        middleware = ReplicaMiddleware(get_response)
+        response = async_to_sync(middleware)(RequestFactory().post('/'))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_safe_requests_do_not_pin(self):
+        response = self.client.get(reverse_lazy('statuses_index'))
+
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+
+class TestMetrics(SetUpMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse_lazy('index'))
+
+        self.assertRegex(
+            response['Server-Timing'],
+            r'^db;dur=[\d.]+;desc="\d+ queries", '
+            r'tpl;dur=[\d.]+, total;dur=[\d.]+$',
+        )
+
+    def test_async_request(self):
+        async def get_response(request):
+            # Sync code of the request runs in a thread
+            await sync_to_async(Status.objects.count)()
+            return HttpResponse()
+
+        middleware = metrics.MetricsMiddleware(get_response)
+        response = async_to_sync(middleware)(RequestFactory().get('/'))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertIn('desc="1 queries"', response['Server-Timing'])
+        self.assertEqual(metrics.get_totals()[metrics.UNRESOLVED].queries, 1)
+
+    @override_settings(SERVER_TIMING=False)
+    def test_server_timing_disabled(self):
+        response = self.client.get(reverse_lazy('index'))
+
+        self.assertNotIn('Server-Timing', response)
+
+    def test_totals_by_view(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse_lazy('statuses_index'))
+        self.client.get(reverse_lazy('statuses_index'))
+
+        totals = metrics.get_totals()['statuses_index']
+
+        self.assertEqual(totals.requests, 2)
+        self.assertGreater(totals.queries, 0)
+        self.assertGreater(totals.template_seconds, 0)
+        self.assertGreaterEqual(totals.seconds, totals.template_seconds)
+
+    @override_settings(SLOW_REQUEST_QUERIES=0)
+    def test_slow_request_logged(self):
+        self.client.force_login(self.user)
+
+        with self.assertLogs('task_manager.metrics', 'WARNING') as logs:
+            self.client.get(reverse_lazy('statuses_index'))
+
+        self.assertIn('statuses_index', logs.output[0])
+        self.assertEqual(
+            metrics.get_totals()['statuses_index'].slow_requests, 1
+        )
+
+    def test_metrics_for_staff(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_login(self.user)
+        self.client.get(reverse_lazy('statuses_index'))
+
+        response = self.client.get(reverse_lazy('metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response, 'task_manager_requests_total{view="statuses_index"} 1'
+        )
+        self.assertContains(response, '# TYPE task_manager_db_queries_total')
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_with_token(self):
+        response = self.client.get(
+            reverse_lazy('metrics'), headers={'Authorization': 'Bearer secret'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(
+            reverse_lazy('metrics'), headers={'Authorization': 'Bearer wrong'}
+        )
+        self.assertEqual(response.status_code, 403)
+
+
+class TestSeedData(TestCase):
+    def test_seed_data(self):
+        out = StringIO()
+        call_command(
+            'seed_data', '--users=5', '--statuses=3', '--labels=4',
+            '--tasks=120', '--batch-size=50', '--seed=1', stdout=out,
+        )
+
+        self.assertIn(
+            'Created 5 users, 3 statuses, 4 labels, 120 tasks',
+            out.getvalue(),
+        )
+        user = User.objects.get(username='seed1_user0')
+        self.assertTrue(user.check_password(SEED_PASSWORD))
+        self.assertEqual(Task.objects.count(), 120)
+        for status in Status.objects.annotate(count=Count('tasks')):
+            self.assertEqual(status.task_count, status.count)
+        for label in Label.objects.annotate(count=Count('tasks')):
+            self.assertEqual(label.task_count, label.count)
+
+    def test_seed_is_deterministic(self):
+        first, second = Seeder(seed=2), Seeder(seed=2)
+        for seeder in first, second:
+            seeder.users = seeder.with_weights([1, 2, 3])
+            seeder.statuses = seeder.with_weights([4, 5])
+            seeder.labels = seeder.with_weights([6, 7, 8])
+
+        def generate(seeder):
+            return [
+                (
+                    seeder.build_task(n).executor_id,
+                    seeder.pick_labels(),
+                )
+                for n in range(20)
+            ]
+
+        self.assertEqual(generate(first), generate(second))
+
+    def test_existing_seed(self):
+        args = ['seed_data', '--users=1', '--tasks=0', '--seed=3']
+        call_command(*args, stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command(*args, stdout=StringIO())
+
+
+class TestVendoredBootstrap(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_files_are_vendored(self):
+        self.assertEqual(assets.get_outdated_files(), [])
+        self.assertEqual(checks.check_vendored_bootstrap(None), [])
+
+    def test_outdated_files(self):
+        vendored = assets.get_vendored_files()
+        self.assertEqual(
+            assets.get_outdated_files(self.directory), list(vendored)
+        )
+
+        for name in vendored:
+            file = self.directory / name
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_bytes((assets.BOOTSTRAP_DIR / name).read_bytes())
+        (self.directory / 'css/bootstrap.min.css').write_text('changed')
+        self.assertEqual(
+            assets.get_outdated_files(self.directory),
+            ['css/bootstrap.min.css'],
+        )
+
+    def test_check_fails_on_outdated_files(self):
+        with mock.patch.object(
+            checks, 'get_outdated_files',
+            return_value=['css/bootstrap.min.css'],
+        ):
+            errors = checks.check_vendored_bootstrap(None)
+
+        self.assertEqual([error.id for error in errors], ['task_manager.E001'])
+        self.assertIn('vendor/bootstrap/css/bootstrap.min.css', errors[0].msg)
+
+    def test_vendored_files_are_static(self):
+        response = self.client.get(reverse_lazy('index'))
+
+        self.assertContains(
+            response, '/static/vendor/bootstrap/css/bootstrap.min.css'
+        )
+        self.assertContains(
+            response, '/static/vendor/bootstrap/js/bootstrap.bundle.min.js'
+        )
+        self.assertNotContains(response, 'cdn.jsdelivr.net')
+
+    def test_collected_files_are_immutable(self):
+        name = f'{assets.BOOTSTRAP_STATIC_DIR}/css/bootstrap.min.css'
+        storages = {
+            'staticfiles': {
+                'BACKEND': 'whitenoise.storage.'
+                           'CompressedManifestStaticFilesStorage',
+            },
+        }
+        with override_settings(STATIC_ROOT=self.directory, STORAGES=storages):
+            # Only the files of the project
+            call_command(
+                'collectstatic',
+                interactive=False,
+                verbosity=0,
+                ignore_patterns=['admin', 'django_extensions'],
+            )
+            url = static(name)
+            response = Client().get(url, headers={'Accept-Encoding': 'br'})
+
+        self.assertRegex(url, r'bootstrap\.min\.[0-9a-f]{12}\.css$')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Content-Encoding'], 'br')
+        response.close()
+
+    def test_download_checks_integrity(self):
+        content = b'/* bootstrap */'
+        files = {
+            'css_url': ('css/bootstrap.min.css', assets.get_integrity(content)),
+        }
+        with (
+            mock.patch.object(assets, 'BOOTSTRAP_FILES', files),
+            mock.patch.object(assets, 'BOOTSTRAP_SOURCE_MAPS', {}),
+            mock.patch.object(assets, 'urlopen') as urlopen,
+        ):
+            read = urlopen.return_value.__enter__.return_value.read
+            read.return_value = content
+            paths = assets.download_bootstrap(self.directory)
+
+            self.assertEqual(paths[0].read_bytes(), content)
+            # Files matching their hashes are not downloaded again
+            self.assertEqual(assets.download_bootstrap(self.directory), [])
+
+            paths[0].write_text('changed')
+            read.return_value = b'changed'
+            with self.assertRaises(ValueError):
+                assets.download_bootstrap(self.directory)
+
+
+@override_settings(CACHES={
+    **settings.CACHES,
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'sessions',
+    },
+})
+class TestSessionBackends(SetUpMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        caches['sessions'].clear()
+        self.addCleanup(caches['sessions'].clear)
+
+    def get_session_queries(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse_lazy('statuses_index'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse_lazy('statuses_index'))
+        self.assertEqual(response.status_code, 200)
+        return [
+            query for query in queries if 'django_session' in query['sql']
+        ]
+
+    def test_db(self):
+        self.assertEqual(len(self.get_session_queries()), 1)
+
+    def test_cache_backends_do_not_query(self):
+        for name in 'cache', 'cached_db', 'signed_cookies':
+            engine = settings.SESSION_ENGINES[name]
+            with self.subTest(name), override_settings(SESSION_ENGINE=engine):
+                self.client = Client()
+                self.assertEqual(self.get_session_queries(), [])
+
+    def test_benchmark(self):
+        out = StringIO()
+
+        call_command(
+            'benchmark_sessions', self.user.username, '--requests=2',
+            stdout=out,
+        )
+
+        for name in settings.SESSION_ENGINES:
+            self.assertIn(f'{name}: ', out.getvalue())
+
+
+class TestCaches(SetUpMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache_backends.reset()
+        self.addCleanup(cache_backends.reset)
+
+    def test_cache_settings(self):
+        for url, backend, location in (
+            ('locmem://', 'LocMemCache', 'tasks'),
+            ('locmem://app', 'LocMemCache', 'app:tasks'),
+            ('file:///tmp/cache', 'FileBasedCache', '/tmp/cache/tasks'),
+            ('redis://cache:6379/1', 'RedisCache', 'redis://cache:6379/1'),
+        ):
+            with self.subTest(url):
+                cache = get_cache_settings(url, 'tasks', version=3)
+
+                self.assertEqual(
+                    cache['BACKEND'], f'task_manager.cache_backends.{backend}'
+                )
+                self.assertEqual(cache['LOCATION'], location)
+                self.assertEqual(cache['KEY_PREFIX'], 'tasks')
+                self.assertEqual(cache['VERSION'], 3)
+
+    def test_unsupported_cache_url(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_cache_settings('memcached://cache:11211', 'tasks')
+
+    def test_namespaces(self):
+        caches['tasks'].set('key', 'tasks')
+
+        self.assertIsNone(caches['labels'].get('key'))
+        self.assertEqual(get_cache('tasks').get('key'), 'tasks')
+        self.assertIs(get_cache('admin'), caches['default'])
+
+    def test_process_local_caches_are_refused(self):
+        errors = checks.check_shared_caches(None)
+        self.assertEqual(
+            [error.id for error in errors], ['task_manager.E002'] * 4
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            shared = {
+                alias: get_cache_settings(f'file://{directory}', alias)
+                for alias in settings.CACHES
+            }
+            with override_settings(CACHES=shared):
+                self.assertEqual(checks.check_shared_caches(None), [])
+
+        with override_settings(DEBUG=True):
+            self.assertEqual(checks.check_shared_caches(None), [])
+
+    def test_hits_and_misses(self):
+        cache = caches['statuses']
+        cache.set('key', 'value')
+        cache.get('key')
+        cache.get('key')
+        cache.get('other', 'default')
+
+        stats = cache_backends.get_stats()['statuses']
+
+        self.assertEqual((stats.hits, stats.misses), (2, 1))
+        self.assertAlmostEqual(stats.hit_ratio, 2 / 3)
+
+    def test_prometheus_metrics(self):
+        caches['tasks'].get('missing')
+
+        self.assertIn(
+            'task_manager_cache_misses_total{namespace="tasks"} 1',
+            metrics.render_prometheus(),
+        )
+
+    def test_choices_use_app_caches(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse_lazy('task_create'))
+
+        stats = cache_backends.get_stats()
+
+        for namespace in 'statuses', 'labels', 'users':
+            self.assertGreater(stats[namespace].lookups, 0)
+
+    def test_health_page(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_login(self.user)
+        caches['tasks'].get('missing')
+
+        response = self.client.get(reverse_lazy('cache_health'))
+
+        caches_by_alias = {
+            cache['alias']: cache for cache in response.context['caches']
+        }
+        self.assertEqual(set(caches_by_alias), set(settings.CACHES))
+        self.assertTrue(caches_by_alias['tasks']['available'])
+        self.assertEqual(caches_by_alias['tasks']['stats'].misses, 1)
+        self.assertContains(response, texts.cache_health['hit_ratio'])
+
+    def test_health_page_for_staff_only(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse_lazy('cache_health'))
+
+        self.assertEqual(response.status_code, 403)
+
+
+class TestLoginBenchmark(TestCase):
+    @override_settings(PASSWORD_HASHERS=[
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    ])
+    def test_benchmark(self):
+        out = StringIO()
+
+        call_command(
+            'benchmark_login', '--requests=1', '--iterations', '1000',
+            stdout=out,
+        )
+
+        self.assertIn('Hasher: pbkdf2_sha256', out.getvalue())
+        self.assertIn('Logins: ', out.getvalue())
+        self.assertIn('1000 iterations: ', out.getvalue())
+        self.assertFalse(User.objects.exists())
+
+    def test_hasher_without_iterations(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                'benchmark_login', '--requests=1', '--iterations', '1000',
+                stdout=StringIO(),
+            )
+
+
+class TestLoginLoadTest(TestCase):
+    def test_percentiles(self):
+        latencies = [n / 100 for n in range(1, 101)]
+
+        percentiles = get_percentiles(latencies)
+
+        self.assertAlmostEqual(percentiles['p50'], 0.505)
+        self.assertAlmostEqual(percentiles['p99'], 0.9901)
+
+    def test_single_latency(self):
+        self.assertEqual(get_percentiles([0.2])['p99'], 0.2)
+
+    def test_server_not_running(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                'loadtest_login', 'http://127.0.0.1:9', 'user',
+                '--concurrency=2', '--timeout=1', stdout=StringIO(),
+            )
+
+    @mock.patch(
+        'task_manager.management.commands.loadtest_login.build_opener'
+    )
+    def test_login_page_without_csrf_token(self, build_opener):
+        response = build_opener.return_value.open.return_value.__enter__
+        response.return_value.read.return_value = b'<form></form>'
+
+        # The other clients stop waiting for the failed one
+        with self.assertRaisesMessage(CommandError, 'has no CSRF token'):
+            call_command(
+                'loadtest_login', 'http://127.0.0.1:9', 'user',
+                '--concurrency=3', '--timeout=30', stdout=StringIO(),
+            )
+
+
+class TestPrefixIndex(TestCase):
+    def get_sql(self, connection):
+        index = Label._meta.indexes[0]
+        schema_editor = connection.schema_editor(collect_sql=True)
+        return str(index.create_sql(Label, schema_editor))
+
+    def test_postgresql_pattern_ops(self):
+        postgresql = load_backend('django.db.backends.postgresql')
+        connection = postgresql.DatabaseWrapper({
+            **settings.DATABASES[DEFAULT_DB_ALIAS],
+            'ENGINE': 'django.db.backends.postgresql',
+        })
+
+        self.assertIn(
+            '((UPPER("name")) text_pattern_ops)', self.get_sql(connection)
+        )
+
+    def test_plain_index_elsewhere(self):
+        self.assertNotIn('text_pattern_ops', self.get_sql(connection))
@@ -14,6 +14,7 @@ base = {
     'statuses': _('Statuses'),
     'labels': _('Labels'),
     'tasks': _('Tasks'),
+    'dashboard': _('Dashboard'),
     'author': _('Author'),
 }
 
@@ -91,6 +92,8 @@ logout = {
 status_model = {
     'name': _('Name'),
     'created_at': _('Created at'),
+    'updated_at': _('Updated at'),
+    'task_count': _('Tasks'),
 }
 
 # Texts for the statuses index page
@@ -100,6 +103,7 @@ statuses_index = {
     'id': _('ID'),
     'name': _('Name'),
     'created_at': _('Created at'),
+    'task_count': _('Tasks'),
     'edit': _('Edit'),
     'delete': _('Delete'),
 }
@@ -136,6 +140,7 @@ task_model = {
     'author': _('Author'),
     'executor': _('Executor'),
     'created_at': _('Created at'),
+    'updated_at': _('Updated at'),
 }
 
 # Texts for the tasks index page
@@ -150,11 +155,57 @@ tasks_index = {
     'executor': _('Executor'),
     'created_at': _('Created at'),
     'self_tasks': _('Self tasks'),
+    'search': _('Search'),
     'filter': _('Filter'),
+    'export_csv': _('Export CSV'),
+    'export_jsonl': _('Export JSON Lines'),
     'edit': _('Edit'),
     'delete': _('Delete'),
 }
 
+# Texts for the bulk actions on the tasks index page
+bulk_tasks = {
+    'bulk_actions': _('Bulk actions'),
+    'action': _('Action'),
+    'set_status': _('Change status'),
+    'set_executor': _('Change executor'),
+    'add_labels': _('Add labels'),
+    'remove_labels': _('Remove labels'),
+    'select_all': _('All filtered tasks'),
+    'status': _('Status'),
+    'executor': _('Executor'),
+    'labels': _('Labels'),
+    'apply': _('Apply'),
+    'no_tasks': _('No tasks selected'),
+    'success': _('Changes made: %(count)s'),
+}
+
+# Texts for the tasks import
+import_tasks = {
+    'import_tasks': _('Import tasks'),
+    'file': _('File'),
+    'file_help': _(
+        'CSV or JSON Lines file with the columns of the tasks export'
+    ),
+    'import': _('Import'),
+    'unknown_format': _('Unsupported file format'),
+    'invalid_encoding': _('The file is not in UTF-8'),
+    'invalid_row': _('Invalid row'),
+    'import_success': _('Imported %(created)s tasks, skipped %(skipped)s rows'),
+    'row_error': _('Row %(number)s: %(errors)s'),
+}
+
+# Texts for the pagination links
+pagination = {
+    'previous': _('Previous'),
+    'next': _('Next'),
+}
+
+# Texts for the autocomplete widgets
+autocomplete = {
+    'placeholder': _('Start typing to search'),
+}
+
 # Texts for the tasks create page
 create_task = {
     'create_task': _('Create task'),
@@ -194,6 +245,8 @@ task_view = {
 label_model = {
     'name': _('Name'),
     'created_at': _('Created at'),
+    'updated_at': _('Updated at'),
+    'task_count': _('Tasks'),
 }
 
 # Texts for the labels index page
@@ -203,6 +256,7 @@ labels_index = {
     'id': _('ID'),
     'name': _('Name'),
     'created_at': _('Created at'),
+    'task_count': _('Tasks'),
     'edit': _('Edit'),
     'delete': _('Delete'),
 }
@@ -230,6 +284,50 @@ delete_label = {
     'delete_error': _('Label cannot be deleted because it is in use'),
 }
 
+# Texts for the task rollup models
+rollup_model = {
+    'dimension': _('Dimension'),
+    'key': _('Key'),
+    'day': _('Day'),
+    'count': _('Count'),
+    'status': _('Status'),
+    'executor': _('Executor'),
+    'label': _('Label'),
+}
+
+# Texts for the dashboard page
+dashboard = {
+    'dashboard': _('Dashboard'),
+    'by_status': _('Tasks by status'),
+    'by_executor': _('Tasks by executor'),
+    'by_label': _('Tasks by label'),
+    'timeline': _('Tasks created in the last 30 days'),
+    'status': _('Status'),
+    'executor': _('Executor'),
+    'label': _('Label'),
+    'day': _('Day'),
+    'count': _('Tasks'),
+    'total': _('Total'),
+    'no_executor': _('No executor'),
+    'no_tasks': _('No tasks yet'),
+}
+
+# Texts for the cache health page
+cache_health = {
+    'cache_health': _('Cache health'),
+    'description': _(
+        'Lookups of the worker process serving this page since it started.'
+    ),
+    'namespace': _('Namespace'),
+    'backend': _('Backend'),
+    'available': _('Available'),
+    'hits': _('Hits'),
+    'misses': _('Misses'),
+    'hit_ratio': _('Hit ratio'),
+    'yes': _('Yes'),
+    'no': _('No'),
+}
+
 # Texts for the 404 error page
 error404 = {
     'error404': _('404 error'),
@@ -14,18 +14,36 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 from task_manager import views
 
+if settings.ASYNC_VIEWS:
+    login_view = views.AsyncUserLoginView
+else:
+    login_view = views.UserLoginView
+
 urlpatterns = [
     path('', views.IndexView.as_view(), name='index'),
-    path('login/', views.UserLoginView.as_view(), name='login'),
+    path('login/', login_view.as_view(), name='login'),
     path('logout/', views.UserLogoutView.as_view(), name='logout'),
     path('users/', include('task_manager.users.urls')),
     path('statuses/', include('task_manager.statuses.urls')),
     path('labels/', include('task_manager.labels.urls')),
     path('tasks/', include('task_manager.tasks.urls')),
+    path('dashboard/', include('task_manager.dashboard.urls')),
+    path(
+        'database/pool/',
+        views.DatabasePoolView.as_view(),
+        name='database_pool',
+    ),
+    path(
+        'cache/health/',
+        views.CacheHealthView.as_view(),
+        name='cache_health',
+    ),
+    path('metrics/', views.MetricsView.as_view(), name='metrics'),
     path('admin/', admin.site.urls),
 ]
 
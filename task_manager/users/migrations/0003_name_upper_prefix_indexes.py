@@ -0,0 +1,40 @@
+# Generated by Django 5.1.15 on 2026-10-18 19:14
+
+import django.db.models.functions.text
+import task_manager.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_name_upper_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_username_upper_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_first_name_upper_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_last_name_upper_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=task_manager.indexes.PrefixIndex(django.db.models.functions.text.Upper('username'), name='user_username_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=task_manager.indexes.PrefixIndex(django.db.models.functions.text.Upper('first_name'), name='user_first_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=task_manager.indexes.PrefixIndex(django.db.models.functions.text.Upper('last_name'), name='user_last_name_upper_idx'),
+        ),
+    ]
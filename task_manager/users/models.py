@@ -1,6 +1,8 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
 
+from task_manager.indexes import PrefixIndex
 from task_manager.texts import user_model
 
 
@@ -19,5 +21,13 @@ class User(AbstractUser):
         null=False,
     )
 
+    class Meta(AbstractUser.Meta):
+        # Used by the prefix search of the users autocomplete
+        indexes = [
+            PrefixIndex(Upper('username'), name='user_username_upper_idx'),
+            PrefixIndex(Upper('first_name'), name='user_first_name_upper_idx'),
+            PrefixIndex(Upper('last_name'), name='user_last_name_upper_idx'),
+        ]
+
     def __str__(self):
         return self.get_full_name()
@@ -1,10 +1,11 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.test.client import Client
-from django.urls import reverse_lazy
+from django.urls import path, reverse_lazy
 
-from task_manager import texts
+from task_manager import texts, urls
 from task_manager.factories import UserFactory
+from task_manager.users.views import AsyncUserCreateView
 
 
 class TestUsersIndex(TestCase):
@@ -83,6 +84,32 @@ class TestUserCreate(TestCase):
         self.assertIn('username', errors)
 
 
+class AsyncUrlconf:
+    urlpatterns = [
+        path(
+            'users/create/',
+            AsyncUserCreateView.as_view(),
+            name='user_create',
+        ),
+        *urls.urlpatterns,
+    ]
+
+
+@override_settings(ROOT_URLCONF=AsyncUrlconf)
+class TestAsyncUserCreate(TestUserCreate):
+    """
+    Runs the tests of the registration page with the view
+    of ASGI deployments.
+    """
+    def test_view_is_async(self):
+        response = self.client.get(reverse_lazy('user_create'))
+
+        self.assertIs(
+            response.resolver_match.func.view_class, AsyncUserCreateView
+        )
+        self.assertTrue(AsyncUserCreateView.view_is_async)
+
+
 class TestUserUpdate(TestCase):
     def setUp(self):
         self.client = Client()
@@ -201,3 +228,43 @@ class TestUserDelete(TestCase):
         )
         self.assertRedirects(response, reverse_lazy('users_index'))
         self.assertContains(response, texts.auth['permission_required'])
+
+
+class TestUsersAutocomplete(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = UserFactory(
+            username='jdoe',
+            first_name='John',
+            last_name='Doe',
+        )
+        self.other_user = UserFactory(
+            username='asmith',
+            first_name='Anna',
+            last_name='Smith',
+        )
+        self.client.force_login(self.user)
+
+    def test_autocomplete_with_no_login(self):
+        self.client.logout()
+        response = self.client.get(reverse_lazy('users_autocomplete'))
+        self.assertEqual(response.status_code, 302)
+
+    def test_autocomplete_by_prefix(self):
+        for term in ('jd', 'JOH', 'do'):
+            response = self.client.get(
+                reverse_lazy('users_autocomplete'),
+                {'q': term},
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                response.json()['results'],
+                [{'id': self.user.id, 'text': 'John Doe'}],
+            )
+
+    def test_autocomplete_does_not_match_middle_of_name(self):
+        response = self.client.get(
+            reverse_lazy('users_autocomplete'),
+            {'q': 'mith'},
+        )
+        self.assertEqual(response.json()['results'], [])
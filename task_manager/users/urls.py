@@ -1,9 +1,20 @@
+from django.conf import settings
 from django.urls import path
 from task_manager.users import views
 
+if settings.ASYNC_VIEWS:
+    create_view = views.AsyncUserCreateView
+else:
+    create_view = views.UserCreateView
+
 urlpatterns = [
     path('', views.UsersIndexView.as_view(), name='users_index'),
-    path('create/', views.UserCreateView.as_view(), name='user_create'),
+    path('create/', create_view.as_view(), name='user_create'),
+    path(
+        'autocomplete/',
+        views.UsersAutocompleteView.as_view(),
+        name='users_autocomplete',
+    ),
     path(
         '<int:pk>/update/',
         views.UserUpdateView.as_view(),
@@ -5,11 +5,14 @@ from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
 from task_manager import texts
-from task_manager.mixins import OwnershipRequiredMixin
+from task_manager.hashing import run_hashing
+from task_manager.mixins import AsyncFormMixin, OwnershipRequiredMixin
+from task_manager.replicas import ReplicaReadMixin
+from task_manager.views import AutocompleteView
 from task_manager.users.forms import UserForm, UserUpdateForm
 
 
-class UsersIndexView(ListView):
+class UsersIndexView(ReplicaReadMixin, ListView):
     model = get_user_model()
     template_name = 'users/index.html'
     context_object_name = 'users'
@@ -36,6 +39,20 @@ class UserCreateView(SuccessMessageMixin, CreateView):
     }
 
 
+class AsyncUserCreateView(AsyncFormMixin, UserCreateView):
+    """
+    UserCreateView for ASGI deployments (ASYNC_VIEWS).
+    Saving the user, which hashes the password, runs
+    in the hashing executor.
+    """
+    async def post(self, request, *args, **kwargs):
+        self.object = None
+        return await super().post(request, *args, **kwargs)
+
+    async def save(self, form):
+        return await run_hashing(self.form_valid, form)
+
+
 class UserUpdateView(SuccessMessageMixin,
                      LoginRequiredMixin,
                      OwnershipRequiredMixin,
@@ -88,3 +105,12 @@ class UserDeleteView(SuccessMessageMixin,
         'base': texts.base,
         'delete_user': texts.delete_user,
     }
+
+
+class UsersAutocompleteView(AutocompleteView):
+    """
+    Search users by the beginning of the username, first or last name.
+    """
+    model = get_user_model()
+    search_fields = ('username', 'first_name', 'last_name')
+    ordering = ('first_name', 'last_name', 'id')
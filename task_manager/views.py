@@ -1,13 +1,36 @@
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.forms import AuthenticationForm
+from django.contrib.auth.mixins import (
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+)
 from django.contrib.auth.views import LoginView, LogoutView
 from django.contrib.messages.views import SuccessMessageMixin
-from django.http import HttpResponseNotFound, HttpResponseServerError
+from django.core.cache import caches
+from django.core.exceptions import PermissionDenied
+from django.db.models import Q
+from django.db.models.functions import Upper
+from django.http import (
+    HttpResponse,
+    HttpResponseNotFound,
+    HttpResponseServerError,
+    JsonResponse,
+)
 from django.template import loader
 from django.urls import reverse_lazy
-from django.views.generic.base import TemplateView
+from django.utils.crypto import constant_time_compare
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import never_cache
+from django.views.decorators.csrf import csrf_protect
+from django.views.decorators.debug import sensitive_post_parameters
+from django.views.generic.base import TemplateView, View
 
-from task_manager import texts
+from task_manager import cache_backends, metrics, texts
+from task_manager.caching import is_available
+from task_manager.db_pool import get_pool_stats
+from task_manager.hashing import run_hashing
+from task_manager.mixins import AsyncFormMixin
 
 
 class IndexView(TemplateView):
@@ -34,6 +57,23 @@ class UserLoginView(SuccessMessageMixin, LoginView):
     }
 
 
+class AsyncUserLoginView(AsyncFormMixin, UserLoginView):
+    """
+    UserLoginView for ASGI deployments (ASYNC_VIEWS).
+    Authentication, which hashes the password, runs
+    in the hashing executor.
+    """
+    @method_decorator(sensitive_post_parameters())
+    @method_decorator(csrf_protect)
+    @method_decorator(never_cache)
+    async def dispatch(self, request, *args, **kwargs):
+        # The decorators of LoginView.dispatch would wrap it as a sync view
+        return await View.dispatch(self, request, *args, **kwargs)
+
+    async def validate(self, form):
+        return await run_hashing(form.is_valid)
+
+
 class UserLogoutView(LogoutView):
     """
     Logout user using Django's built-in logout view.
@@ -51,6 +91,112 @@ class UserLogoutView(LogoutView):
         return super().dispatch(request, *args, **kwargs)
 
 
+class AutocompleteView(LoginRequiredMixin, View):
+    """
+    Returns up to `limit` objects of the model as JSON
+    {"results": [{"id": ..., "text": ...}]}, where one of search_fields
+    starts with the `q` query parameter (case-insensitive).
+    Search fields are expected to have Upper() indexes.
+    """
+    model = None
+    search_fields = ()
+    ordering = ()
+    limit = 20
+    login_url = reverse_lazy('login')
+
+    def get_queryset(self):
+        return self.model.objects.order_by(*self.ordering)
+
+    def search(self, queryset, term):
+        condition = Q()
+        aliases = {}
+        for field in self.search_fields:
+            alias = f'{field}_upper'
+            aliases[alias] = Upper(field)
+            condition |= Q(**{f'{alias}__startswith': term.upper()})
+        return queryset.alias(**aliases).filter(condition)
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        term = request.GET.get('q', '').strip()
+        if term:
+            queryset = self.search(queryset, term)
+        results = [
+            {'id': obj.pk, 'text': str(obj)}
+            for obj in queryset[:self.limit]
+        ]
+        return JsonResponse({'results': results})
+
+
+class DatabasePoolView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """
+    Returns the connection pool statistics of the worker process
+    serving the request as JSON. Available to staff only.
+    """
+    login_url = reverse_lazy('login')
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse({'pools': get_pool_stats()})
+
+
+class CacheHealthView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
+    """
+    Lists the caches with their hits and misses in the worker process
+    serving the request. Available to staff only.
+    """
+    template_name = 'cache_health.html'
+    login_url = reverse_lazy('login')
+    extra_context = {
+        'base': texts.base,
+        'cache_health': texts.cache_health,
+    }
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        stats = cache_backends.get_stats()
+        context['caches'] = [
+            {
+                'alias': alias,
+                'backend': type(caches[alias]).__name__,
+                'available': is_available(alias),
+                'stats': stats.get(
+                    caches[alias].key_prefix, cache_backends.CacheStats()
+                ),
+            }
+            for alias in settings.CACHES
+        ]
+        return context
+
+
+class MetricsView(View):
+    """
+    Request metrics of the worker process serving the request
+    in the Prometheus text format. Available to staff and to clients
+    sending METRICS_TOKEN as a bearer token.
+    """
+    def has_access(self, request):
+        token = settings.METRICS_TOKEN
+        if token and constant_time_compare(
+            request.headers.get('Authorization', ''), f'Bearer {token}'
+        ):
+            return True
+        return request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        if not self.has_access(request):
+            raise PermissionDenied
+        return HttpResponse(
+            metrics.render_prometheus(),
+            content_type='text/plain; version=0.0.4; charset=utf-8',
+        )
+
+
 def error_404_view(request, exception, template_name='errors/404.html'):
     """404 handler"""
     context = {
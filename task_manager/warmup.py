@@ -0,0 +1,60 @@
+"""
+Compiles all templates in advance.
+
+With the cached template loader every template is parsed once per process,
+on the first request rendering it. Compiling all templates when a worker
+starts moves this work out of the first requests.
+"""
+from pathlib import Path
+
+from django.template import TemplateSyntaxError, engines
+from django.template.loaders.cached import Loader as CachedLoader
+
+TEMPLATE_SUFFIXES = ('.html', '.txt')
+
+
+def _get_loaders(engine):
+    for loader in engine.template_loaders:
+        if isinstance(loader, CachedLoader):
+            yield from loader.loaders
+        else:
+            yield loader
+
+
+def get_templates(engine):
+    """
+    Returns the paths of all templates found by the loaders
+    of the engine by template name. When several files have the same
+    name, the one the engine loads is returned.
+    """
+    templates = {}
+    for loader in _get_loaders(engine):
+        for directory in map(Path, loader.get_dirs()):
+            for path in sorted(directory.rglob('*')):
+                name = path.relative_to(directory).as_posix()
+                if path.suffix in TEMPLATE_SUFFIXES and path.is_file():
+                    templates.setdefault(name, path)
+    return templates
+
+
+def compile_templates():
+    """
+    Loads every template of the Django template engines,
+    which stores the compiled templates in the cached loaders.
+    Returns the number of compiled templates and the errors
+    of the templates which could not be compiled by file path.
+    """
+    compiled = 0
+    errors = {}
+    for backend in engines.all():
+        engine = getattr(backend, 'engine', None)
+        if engine is None:
+            continue
+        for name, path in get_templates(engine).items():
+            try:
+                engine.get_template(name)
+            except TemplateSyntaxError as error:
+                errors[path] = error
+            else:
+                compiled += 1
+    return compiled, errors
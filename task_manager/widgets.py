@@ -0,0 +1,79 @@
+"""
+Select widgets loading their options from an autocomplete endpoint.
+"""
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIteratorValue
+from django.urls import reverse
+
+from task_manager import texts
+
+
+class AutocompleteSelectMixin:
+    """
+    Renders all options while the number of choices is below
+    AUTOCOMPLETE_THRESHOLD. Above it only the selected options are rendered
+    and the rest are searched by autocomplete.js through the url_name view.
+    Must be used with model choice fields.
+    """
+    class Media:
+        js = ['js/autocomplete.js']
+
+    def __init__(self, url_name, attrs=None):
+        super().__init__(attrs)
+        self.url_name = url_name
+
+    def is_remote(self):
+        return len(self.choices) > settings.AUTOCOMPLETE_THRESHOLD
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        if self.is_remote():
+            context['widget']['attrs'].update({
+                'data-autocomplete-url': reverse(self.url_name),
+                'data-autocomplete-placeholder': (
+                    texts.autocomplete['placeholder']
+                ),
+            })
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        if not self.is_remote():
+            return super().optgroups(name, value, attrs)
+
+        groups = []
+        for index, (option_value, label) in enumerate(
+            self._selected_choices(value)
+        ):
+            selected = str(option_value) in value
+            option = self.create_option(
+                name, option_value, label, selected, index, attrs=attrs
+            )
+            groups.append((None, [option], index))
+        return groups
+
+    def _selected_choices(self, value):
+        field = self.choices.field
+        if field.empty_label is not None and not self.allow_multiple_selected:
+            yield '', field.empty_label
+
+        try:
+            selected = list(
+                self.choices.queryset.filter(pk__in=[pk for pk in value if pk])
+            )
+        except (ValueError, ValidationError):
+            selected = []
+        for obj in selected:
+            yield (
+                ModelChoiceIteratorValue(field.prepare_value(obj), obj),
+                field.label_from_instance(obj),
+            )
+
+
+class AutocompleteSelect(AutocompleteSelectMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteSelectMixin, forms.SelectMultiple):
+    pass
@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
+from task_manager.warmup import compile_templates
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.settings')
 
 application = get_wsgi_application()
+
+if settings.TEMPLATE_WARMUP:
+    # Compile templates when the worker starts, not on the first requests
+    compile_templates()